@@ -0,0 +1,19 @@
+import random
+
+# The real input has 1,000 pairs of location IDs.
+REAL_SIZE = 1000
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate `size` lines of two whitespace-separated location IDs. IDs in the
+    right list are drawn from the same pool as the left list most of the time,
+    so that the similarity score isn't trivially zero.
+    """
+    rng = random.Random(seed)
+    left = [rng.randrange(10000, 100000) for _ in range(size)]
+    right = [
+        rng.choice(left) if rng.random() < 0.5 else rng.randrange(10000, 100000)
+        for _ in range(size)
+    ]
+    return "".join(f"{first}   {second}\n" for first, second in zip(left, right))
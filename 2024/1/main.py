@@ -1,50 +1,212 @@
-from typing import TextIO
-from collections import defaultdict
+import os
+import tempfile
+from pathlib import Path
 
+import numpy as np
 
-def parse_file(file: TextIO) -> tuple[list[int], list[int]]:
-    first = []
-    second = []
+from aoc.external_sort import (
+    MAX_FAN_IN,
+    RunWriter,
+    group_counts,
+    lockstep,
+    merge_runs,
+    reduce_runs,
+)
+from aoc.memory import parse_size
+from aoc.reader import Source, file_chunks, int_block, map_input
 
-    for line in file:
-        first_id, second_id = map(int, line.split())
-        first.append(first_id)
-        second.append(second_id)
+type LocationIds = np.ndarray
 
-    return first, second
+# Counting how often every ID up to the largest one comes up takes an array
+# that long, so past this (or four times the number of IDs, if that's more),
+# IDs are counted by sorting them instead. It's kept small enough that the
+# table costs no more than a sort's copies of the lists would.
+MAX_COUNTED_ID = 1 << 14
+
+
+def parse_file(source: Source) -> tuple[LocationIds, LocationIds]:
+    # One row per line, so each list is a column of the block. The columns are
+    # copied out, so that each one is contiguous for sorting.
+    ids = int_block(source)
+    return np.ascontiguousarray(ids[:, 0]), np.ascontiguousarray(ids[:, 1])
 
 
 # Part 1
-def compute_total_distance(first: list[int], second: list[int]) -> int:
-    sorted_first = sorted(first)
-    sorted_second = sorted(second)
+def compute_total_distance(first: LocationIds, second: LocationIds) -> int:
+    # np.sort returns a sorted copy, leaving the lists themselves alone.
+    return int(np.abs(np.sort(first) - np.sort(second)).sum())
 
-    return sum(
-        abs(first - second) for first, second in zip(sorted_first, sorted_second)
-    )
+
+def count_appearances(left: LocationIds, right: LocationIds) -> np.ndarray:
+    """
+    Count how many times each ID in the left list appears in the right list.
+    """
+    if left.min() >= 0 and right.min() >= 0:
+        largest = max(left.max(), right.max())
+        if largest < max(MAX_COUNTED_ID, 4 * len(right)):
+            # Tally the right list into an array indexed by ID, and look up
+            # every left ID in it.
+            return np.bincount(right, minlength=largest + 1)[left]
+
+    # Otherwise, binary search for each left ID among the distinct right ones.
+    ids, counts = np.unique(right, return_counts=True)
+    indexes = np.minimum(np.searchsorted(ids, left), len(ids) - 1)
+    return np.where(ids[indexes] == left, counts[indexes], 0)
 
 
 # Part 2
-def compute_similarity_score(left: list[int], right: list[int]) -> int:
-    appearance_counts = defaultdict(int)
-    for id in right:
-        appearance_counts[id] += 1
+def compute_similarity_score(left: LocationIds, right: LocationIds) -> int:
+    left = np.asarray(left, dtype=np.int64)
+    right = np.asarray(right, dtype=np.int64)
+    if not len(left) or not len(right):
+        return 0
+    return int((left * count_appearances(left, right)).sum())
+
+
+# Streaming, for lists too big to fit in memory.
+
+# How much memory the streaming solution aims to use, unless told otherwise.
+DEFAULT_STREAM_MEMORY = 256_000_000
+
+
+def spill_sorted_columns(
+    path: str | Path, directory: Path, memory: int
+) -> tuple[list[Path], list[Path]]:
+    """
+    Read the lists a chunk of lines at a time, and write each of them out to
+    sorted runs in `directory`, few enough to merge in one pass. Returns the
+    run files for each list.
+    """
+    # Tokenizing a chunk takes temporary arrays adding up to a few dozen times
+    # its size, and each list's run (of 8-byte IDs) is held twice over while
+    # it's gathered up and sorted.
+    left = RunWriter(directory, max(memory // 32, 1), "left")
+    right = RunWriter(directory, max(memory // 32, 1), "right")
+    for chunk in file_chunks(path, max(memory // 128, 1 << 12)):
+        ids = int_block(chunk)
+        if len(ids):
+            left.add(ids[:, 0])
+            right.add(ids[:, 1])
+    block_length = merge_block_length(MAX_FAN_IN, memory)
+    return (
+        reduce_runs(left.finish(), block_length),
+        reduce_runs(right.finish(), block_length),
+    )
+
+
+def merge_block_length(num_runs: int, memory: int) -> int:
+    # Both lists are merged at once, each holding a block of 8-byte IDs (and
+    # what's left of the last one) per run, plus the merged block. That's kept
+    # to half the memory, leaving the rest for working on the merged blocks.
+    return max(memory // (2 * 2 * 3 * 8 * max(num_runs, 1)), 1024)
+
+
+def stream_total_distance(
+    left_runs: list[Path], right_runs: list[Path], memory: int
+) -> int:
+    block_length = merge_block_length(max(len(left_runs), len(right_runs)), memory)
+    total = 0
+    for first, second in lockstep(
+        merge_runs(left_runs, block_length), merge_runs(right_runs, block_length)
+    ):
+        total += int(np.abs(first - second).sum())
+    return total
+
+
+def stream_similarity_score(
+    left_runs: list[Path], right_runs: list[Path], memory: int
+) -> int:
+    """
+    Count how often each ID comes up in both sorted lists, and walk the two
+    tables of counts together, in order of ID, to match up the IDs they share.
+    """
+    block_length = merge_block_length(max(len(left_runs), len(right_runs)), memory)
+    left_groups = group_counts(merge_runs(left_runs, block_length))
+    right_groups = group_counts(merge_runs(right_runs, block_length))
+    empty = np.zeros(0, dtype=np.int64)
+    left_ids = left_counts = right_ids = right_counts = empty
+    score = 0
+    while True:
+        if not len(left_ids):
+            group = next(left_groups, None)
+            if group is None:
+                return score
+            left_ids, left_counts = group
+        if not len(right_ids):
+            group = next(right_groups, None)
+            if group is None:
+                return score
+            right_ids, right_counts = group
+        # Everything up to the smaller of the two last IDs can be matched up
+        # now: any more of those IDs would have been in these groups.
+        bound = min(left_ids[-1], right_ids[-1])
+        left_end = int(np.searchsorted(left_ids, bound, side="right"))
+        right_end = int(np.searchsorted(right_ids, bound, side="right"))
+        ids, counts = left_ids[:left_end], left_counts[:left_end]
+        candidates = right_ids[:right_end]
+        if len(candidates):
+            indexes = np.minimum(np.searchsorted(candidates, ids), len(candidates) - 1)
+            matched = candidates[indexes] == ids
+            score += int(
+                (
+                    ids[matched]
+                    * counts[matched]
+                    * right_counts[:right_end][indexes[matched]]
+                ).sum()
+            )
+        left_ids, left_counts = left_ids[left_end:], left_counts[left_end:]
+        right_ids, right_counts = right_ids[right_end:], right_counts[right_end:]
+
+
+def solve_streaming(
+    path: str | Path, memory: int = DEFAULT_STREAM_MEMORY
+) -> tuple[int, int]:
+    """
+    Solve both parts for the lists in the file at `path` using about `memory`
+    bytes, however long they are, by sorting them on disk (see
+    aoc.external_sort). Returns the total distance and the similarity score.
+    """
+    with tempfile.TemporaryDirectory(prefix="aoc-2024-1-") as directory:
+        left_runs, right_runs = spill_sorted_columns(path, Path(directory), memory)
+        distance = stream_total_distance(left_runs, right_runs, memory)
+        similarity = stream_similarity_score(left_runs, right_runs, memory)
+    return distance, similarity
+
+
+def parse(text: Source) -> tuple[LocationIds, LocationIds]:
+    return parse_file(text)
+
+
+def part1(parsed: tuple[LocationIds, LocationIds]) -> int:
+    return compute_total_distance(*parsed)
+
+
+def part2(parsed: tuple[LocationIds, LocationIds]) -> int:
+    return compute_similarity_score(*parsed)
 
-    return sum(appearance_counts[id] * id for id in left)
 
+def check_examples() -> None:
+    with map_input("test.txt") as data:
+        first, second = parse_file(data)
+        distance = compute_total_distance(first, second)
+        assert distance == 11, f"Expected 11, but got {distance}"
+        score = compute_similarity_score(first, second)
+        assert score == 31, f"Expected 31, but got {score}"
 
-with open("test.txt", "r") as file:
-    first, second = parse_file(file)
-    distance = compute_total_distance(first, second)
-    assert distance == 11, f"Expected 11, but got {distance}"
-    score = compute_similarity_score(first, second)
-    assert score == 31, f"Expected 31, but got {score}"
 
-print("All tests passed!")
+if __name__ == "__main__":
+    check_examples()
+    print("All tests passed!")
 
-with open("input.txt", "r") as file:
-    first, second = parse_file(file)
-    distance = compute_total_distance(first, second)
-    print("Part 1:", distance)
-    score = compute_similarity_score(first, second)
-    print("Part 2:", score)
+    # With AOC_STREAM_MEMORY set (like 512M), the lists are sorted on disk
+    # within that much memory, rather than loaded whole.
+    stream_memory = os.environ.get("AOC_STREAM_MEMORY")
+    if stream_memory:
+        distance, similarity = solve_streaming("input.txt", parse_size(stream_memory))
+        print("Part 1:", distance)
+        print("Part 2:", similarity)
+    else:
+        with map_input("input.txt") as data:
+            parsed = parse(data)
+            print("Part 1:", part1(parsed))
+            print("Part 2:", part2(parsed))
@@ -0,0 +1,39 @@
+import math
+import random
+
+# The real input is a 45x45 topographic map.
+REAL_SIZE = 45 * 45
+
+DIRECTIONS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate a square topographic map of roughly `size` tiles. The map starts
+    out as random heights, and then hiking trails climbing from 0 to 9 one step
+    at a time are laid over it. Trails regularly cross each other, so many
+    trailheads end up reaching several summits by several routes.
+    """
+    rng = random.Random(seed)
+    side = max(math.isqrt(size), 4)
+    heights = [[rng.randint(0, 9) for _ in range(side)] for _ in range(side)]
+
+    for _ in range(side * side // 10):
+        row, col = rng.randrange(side), rng.randrange(side)
+        trail = [(row, col)]
+        while len(trail) < 10:
+            options = [
+                (row + dr, col + dc)
+                for dr, dc in DIRECTIONS
+                if 0 <= row + dr < side
+                and 0 <= col + dc < side
+                and (row + dr, col + dc) not in trail
+            ]
+            if not options:
+                break
+            row, col = rng.choice(options)
+            trail.append((row, col))
+        for height, (row, col) in enumerate(trail):
+            heights[row][col] = height
+
+    return "".join("".join(map(str, row)) + "\n" for row in heights)
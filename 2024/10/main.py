@@ -1,4 +1,5 @@
 from typing import TextIO
+import io
 
 
 def parse_file(file: TextIO) -> list[list[int]]:
@@ -10,36 +11,44 @@ def find_hiking_trails_from_tile(
 ) -> list[tuple[int, int]]:
     """
     Find all the hiking trails starting from the given tile. The tile must have
-    the elevation we're looking for. The function will recursively check the
-    surrounding tiles to find the hiking trails, returning the list of
-    destination tiles for each trail found.
+    the elevation we're looking for. The function will check the surrounding
+    tiles to find the hiking trails, returning the list of destination tiles
+    for each trail found. Tiles still to be explored are kept on an explicit
+    stack rather than in recursive calls.
     """
+    height, width = len(map), len(map[0])
     row, col = tile
     # If the tile is out of bounds or is not the one we're looking for, there
     # are 0 hiking trails from this tile.
-    if (
-        row < 0
-        or row >= len(map)
-        or col < 0
-        or col >= len(map[0])
-        or map[row][col] != looking_for
-    ):
+    if not (0 <= row < height and 0 <= col < width) or map[row][col] != looking_for:
         return []
 
-    # If the tile is at the final elevation, 9, we reached a single hiking
-    # trail's destination.
-    if map[row][col] == 9:
-        return [(row, col)]
+    destinations: list[tuple[int, int]] = []
+    # Only tiles with the elevation the trail needs next are ever pushed.
+    stack = [(row, col)]
+    while stack:
+        row, col = stack.pop()
+        elevation = map[row][col]
+        # If the tile is at the final elevation, 9, we reached a single hiking
+        # trail's destination.
+        if elevation == 9:
+            destinations.append((row, col))
+            continue
 
-    # Otherwise, we need to further explore the surrounding tiles. We will check
-    # in each of the four cardinal directions and concatenate the results.
-    next_elevation = looking_for + 1
-    return (
-        find_hiking_trails_from_tile(map, (row - 1, col), next_elevation)
-        + find_hiking_trails_from_tile(map, (row + 1, col), next_elevation)
-        + find_hiking_trails_from_tile(map, (row, col - 1), next_elevation)
-        + find_hiking_trails_from_tile(map, (row, col + 1), next_elevation)
-    )
+        # Otherwise, we need to further explore the surrounding tiles. We will
+        # check in each of the four cardinal directions, in reverse so that
+        # they come off the stack in the same order as before.
+        next_elevation = elevation + 1
+        if col + 1 < width and map[row][col + 1] == next_elevation:
+            stack.append((row, col + 1))
+        if col > 0 and map[row][col - 1] == next_elevation:
+            stack.append((row, col - 1))
+        if row + 1 < height and map[row + 1][col] == next_elevation:
+            stack.append((row + 1, col))
+        if row > 0 and map[row - 1][col] == next_elevation:
+            stack.append((row - 1, col))
+
+    return destinations
 
 
 def count_hiking_trails(map: list[list[int]]) -> tuple[int, int]:
@@ -61,16 +70,31 @@ def count_hiking_trails(map: list[list[int]]) -> tuple[int, int]:
     return (total_unique, total_ratings)
 
 
-with open("test.txt", "r") as file:
-    map = parse_file(file)
-    (count_1, count_2) = count_hiking_trails(map)
-    assert count_1 == 36, f"Expected 36, but got {count_1}"
-    assert count_2 == 81, f"Expected 81, but got {count_2}"
+def parse(text: str) -> list[list[int]]:
+    return parse_file(io.StringIO(text))
+
+
+def part1(map: list[list[int]]) -> int:
+    return count_hiking_trails(map)[0]
+
+
+def part2(map: list[list[int]]) -> int:
+    return count_hiking_trails(map)[1]
+
+
+def check_examples() -> None:
+    with open("test.txt", "r") as file:
+        map = parse_file(file)
+        (count_1, count_2) = count_hiking_trails(map)
+        assert count_1 == 36, f"Expected 36, but got {count_1}"
+        assert count_2 == 81, f"Expected 81, but got {count_2}"
+
 
-print("All tests passed.")
+if __name__ == "__main__":
+    check_examples()
+    print("All tests passed.")
 
-with open("input.txt", "r") as file:
-    map = parse_file(file)
-    (count_1, count_2) = count_hiking_trails(map)
-    print("Part 1:", count_1)
-    print("Part 2:", count_2)
+    with open("input.txt", "r") as file:
+        map = parse(file.read())
+        print("Part 1:", part1(map))
+        print("Part 2:", part2(map))
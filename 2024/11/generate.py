@@ -0,0 +1,12 @@
+import random
+
+# The real input is a single line of 8 stones.
+REAL_SIZE = 8
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate a single line of `size` stones with random engravings.
+    """
+    rng = random.Random(seed)
+    return " ".join(str(rng.randint(0, 10**7)) for _ in range(size)) + "\n"
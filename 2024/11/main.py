@@ -1,12 +1,16 @@
-from typing import TypedDict, TextIO
-from functools import cache
+from typing import TypedDict
 
+from aoc.memo import memo
+from aoc.reader import Source, ints, map_input
 
-def parse_file(file: TextIO) -> list[int]:
-    return [int(value) for value in file.readline().strip().split()]
 
+def parse_file(source: Source) -> list[int]:
+    return ints(source).tolist()
 
-@cache
+
+# Every stone only ever needs its rules applied once, but the results are cheap
+# to recompute, so only the most recent ones are kept.
+@memo(maxsize=4096)
 def apply_rules(stone: int) -> list[int]:
     # If the stone is engraved with the number `0`, it is replaced by a
     # stone engraved with the number `1`.
@@ -27,7 +31,9 @@ def apply_rules(stone: int) -> list[int]:
         return [stone * 2024]
 
 
-@cache
+# Persisted, so that counts for more blinks than ever before can build on the
+# ones from previous runs.
+@memo(persist=True)
 def blink_and_count(stone: int, blinks: int) -> int:
     """
     Recursively apply the rules to the stone and count the number of total
@@ -63,21 +69,35 @@ test_cases: list[TestCase] = [
     },
 ]
 
-for test_index, test_case in enumerate(test_cases):
-    input = test_case["input"]
-    stones_after_blinks = test_case["stones_after_blinks"]
-    for blinks, expected_count in stones_after_blinks.items():
-        result_count = blink(input, blinks)
-        assert (
-            result_count == expected_count
-        ), f"Test case {test_index} failed for {blinks} blinks: expected {expected_count}, but got {result_count}"
 
-print("All tests passed.")
+def parse(text: Source) -> list[int]:
+    return parse_file(text)
+
+
+def part1(stones: list[int]) -> int:
+    return blink(stones, 25)
+
+
+def part2(stones: list[int]) -> int:
+    return blink(stones, 75)
+
+
+def check_examples() -> None:
+    for test_index, test_case in enumerate(test_cases):
+        input = test_case["input"]
+        stones_after_blinks = test_case["stones_after_blinks"]
+        for blinks, expected_count in stones_after_blinks.items():
+            result_count = blink(input, blinks)
+            assert (
+                result_count == expected_count
+            ), f"Test case {test_index} failed for {blinks} blinks: expected {expected_count}, but got {result_count}"
+
 
-with open("input.txt", "r") as file:
-    stones = parse_file(file)
-    count = blink(stones, 25)
-    print("Part 1:", count)
+if __name__ == "__main__":
+    check_examples()
+    print("All tests passed.")
 
-    count = blink(stones, 75)
-    print("Part 2:", count)
+    with map_input("input.txt") as data:
+        stones = parse(data)
+        print("Part 1:", part1(stones))
+        print("Part 2:", part2(stones))
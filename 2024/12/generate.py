@@ -0,0 +1,34 @@
+import math
+import random
+import string
+
+# The real input is a 140x140 garden.
+REAL_SIZE = 140 * 140
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate a square garden of roughly `size` plots. The garden starts out as
+    a patchwork of rectangular blocks of random crops, and then plots along
+    the block edges are randomly swapped to a neighbor's crop so that regions
+    get irregular shapes, holes and the occasional enclave.
+    """
+    rng = random.Random(seed)
+    side = max(math.isqrt(size), 2)
+    block = 6
+    blocks_per_side = side // block + 1
+    crops = [
+        rng.choices(string.ascii_uppercase, k=blocks_per_side)
+        for _ in range(blocks_per_side)
+    ]
+    garden = [
+        [crops[row // block][col // block] for col in range(side)]
+        for row in range(side)
+    ]
+    for _ in range(side * side // 20):
+        row, col = rng.randrange(side), rng.randrange(side)
+        dr, dc = rng.choice(((-1, 0), (1, 0), (0, -1), (0, 1)))
+        neighbor_row = min(max(row + dr, 0), side - 1)
+        neighbor_col = min(max(col + dc, 0), side - 1)
+        garden[row][col] = garden[neighbor_row][neighbor_col]
+    return "".join("".join(row) + "\n" for row in garden)
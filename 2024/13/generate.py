@@ -0,0 +1,29 @@
+import random
+
+# The real input has 320 claw machines.
+REAL_SIZE = 320
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate `size` claw machine configurations. Every prize is placed
+    somewhere at most 100 presses of each button could reach, but for about two
+    thirds of the machines it is then nudged slightly off, which almost always
+    makes it unreachable.
+    """
+    rng = random.Random(seed)
+    machines: list[str] = []
+    for _ in range(size):
+        a_x, a_y = rng.randint(10, 99), rng.randint(10, 99)
+        b_x, b_y = rng.randint(10, 99), rng.randint(10, 99)
+        a_presses, b_presses = rng.randint(1, 100), rng.randint(1, 100)
+        prize_x = a_presses * a_x + b_presses * b_x
+        prize_y = a_presses * a_y + b_presses * b_y
+        if rng.random() < 2 / 3:
+            prize_x += rng.randint(1, 9)
+        machines.append(
+            f"Button A: X+{a_x}, Y+{a_y}\n"
+            f"Button B: X+{b_x}, Y+{b_y}\n"
+            f"Prize: X={prize_x}, Y={prize_y}\n"
+        )
+    return "\n".join(machines)
@@ -1,7 +1,11 @@
-from typing import TextIO, TypedDict
-import re
-from functools import cache
-import numpy as np
+from typing import TypedDict
+
+from aoc.executor import parallel_map
+from aoc.imports import lazy_import, load_now
+from aoc.reader import Source, ints, map_input
+
+# Only Part 2 needs NumPy, so it isn't loaded until then.
+np = lazy_import("numpy")
 
 
 class MachineConfig(TypedDict):
@@ -10,99 +14,78 @@ class MachineConfig(TypedDict):
     prize: tuple[int, int]
 
 
-BUTTON_REGEX = re.compile(r"Button [AB]: X\+(\d+), Y\+(\d+)")
-PRIZE_REGEX = re.compile(r"Prize: X=(\d+), Y=(\d+)")
+# Every machine is described by six numbers: X and Y for button A, for button B
+# and for the prize, in that order.
+NUMBERS_PER_MACHINE = 6
 
 
-def parse_file(file: TextIO) -> list[MachineConfig]:
-    machines = []
-    # Continue until the end of the file.
-    while True:
-        line = file.readline()
-        if not line:
-            break
-        a_match = BUTTON_REGEX.match(line)
-        b_match = BUTTON_REGEX.match(file.readline())
-        prize_match = PRIZE_REGEX.match(file.readline())
+def parse_file(source: Source) -> list[MachineConfig]:
+    numbers = ints(source)
+    if len(numbers) % NUMBERS_PER_MACHINE:
+        raise ValueError("Invalid input file")
 
-        if not a_match or not b_match or not prize_match:
-            raise ValueError("Invalid input file")
+    return [
+        {"button_a": (ax, ay), "button_b": (bx, by), "prize": (prize_x, prize_y)}
+        for ax, ay, bx, by, prize_x, prize_y in numbers.reshape(
+            -1, NUMBERS_PER_MACHINE
+        ).tolist()
+    ]
 
-        button_a = tuple(map(int, a_match.groups()))
-        button_b = tuple(map(int, b_match.groups()))
-        prize_x, prize_y = map(int, prize_match.groups())
-        # Each machine configuration is followed by an empty line.
-        file.readline()
 
-        machines.append(
-            {"button_a": button_a, "button_b": button_b, "prize": (prize_x, prize_y)}
-        )
-
-    return machines
+def presses_to_cover(dx: int, dy: int, x: int, y: int) -> int | None:
+    """
+    How many presses of a button that moves the claw by (dx, dy) move it by
+    exactly (x, y), or None if no number of them does.
+    """
+    if dx:
+        presses, left_over = divmod(x, dx)
+        return presses if not left_over and presses * dy == y else None
+    if dy:
+        # The button doesn't move the claw along X, so there can't be any X
+        # left to cover.
+        presses, left_over = divmod(y, dy)
+        return presses if not left_over and not x else None
+    # The button doesn't move the claw at all, so it's never worth pressing.
+    return 0 if not x and not y else None
 
 
 def find_cheapest_way_to_win(machine: MachineConfig) -> tuple[int, int, int] | None:
     """
     Given a machine configuration, determines the cheapest way to win the prize,
-    or returns None if it is impossible to win. The function will recursively
-    check possible combinations of button presses to reach the prize, returning
+    or returns None if it is impossible to win. The function checks every number
+    of button A presses that doesn't overshoot the prize: whatever distance is
+    left has to be covered by button B alone (see presses_to_cover). It returns
     a tuple of (a button presses, b button presses, total cost) with the minimal
     cost, if a solution is found.
     NOTE: This implementation assumes there is a single, unique solution. It
     wouldn't be possible to solve the challenge if there were multiple solutions.
     """
-    min_so_far = float("inf")
-
-    @cache
-    def find_way(
-        x: int, y: int, presses: tuple[int, int], cost: int
-    ) -> tuple[int, int, int] | None:
-        """
-        Recursive helper function that finds the cheapest way to reach the prize
-        by testing both branches (pressing button A and button B) and returning
-        the cheaper option of the two.
-        """
-        nonlocal min_so_far
-        if cost >= min_so_far:
-            return None
-
-        a_presses, b_presses = presses
-
-        # If we've reached the prize, return the cost.
-        if (x, y) == machine["prize"]:
-            min_so_far = min(min_so_far, cost)
-            return a_presses, b_presses, cost
-
-        prize_x, prize_y = machine["prize"]
-
-        # If we've exceeded the prize's coordinates, return None.
-        if x > prize_x or y > prize_y:
-            return None
-
-        a_dx, a_dy = machine["button_a"]
-        b_dx, b_dy = machine["button_b"]
-
-        # Try pressing button A and button B, and pick the cheapest option.
+    a_dx, a_dy = machine["button_a"]
+    b_dx, b_dy = machine["button_b"]
+    prize_x, prize_y = machine["prize"]
+    # Button A can't be pressed more times than it takes to pass the prize
+    # along an axis it moves the claw on. If it doesn't move the claw at all,
+    # pressing it only adds to the cost.
+    bounds = [
+        prize // delta for prize, delta in ((prize_x, a_dx), (prize_y, a_dy)) if delta
+    ]
+    most_a_presses = min(bounds, default=0)
+
+    cheapest: tuple[int, int, int] | None = None
+    # Count down, so that if two ways cost the same, the one with more A presses
+    # wins, like it did when we searched by pressing A first.
+    for a_presses in range(most_a_presses, -1, -1):
+        b_presses = presses_to_cover(
+            b_dx, b_dy, prize_x - a_presses * a_dx, prize_y - a_presses * a_dy
+        )
+        if b_presses is None:
+            continue
         # Pressing button A costs 3, and pressing button B costs 1.
-        a_cost = find_way(x + a_dx, y + a_dy, (a_presses + 1, b_presses), cost + 3)
-        b_cost = find_way(x + b_dx, y + b_dy, (a_presses, b_presses + 1), cost + 1)
+        cost = a_presses * 3 + b_presses
+        if cheapest is None or cost < cheapest[2]:
+            cheapest = (a_presses, b_presses, cost)
 
-        # If it's not possible to reach the prize by pressing either button,
-        # return None.
-        if a_cost is None and b_cost is None:
-            return None
-
-        # If it's possible to reach the prize by pressing one button, but not
-        # the other, return the cost of the button that reaches the prize.
-        if a_cost is None:
-            return b_cost
-        if b_cost is None:
-            return a_cost
-
-        # Otherwise, return the cheapest option of the two.
-        return min(a_cost, b_cost, key=lambda result: result[2])
-
-    return find_way(0, 0, (0, 0), 0)
+    return cheapest
 
 
 # Part 2
@@ -143,68 +126,90 @@ def solve_linear_system(machine: MachineConfig) -> tuple[int, int, int] | None:
         return a_presses, b_presses, round(cost)
 
 
-with open("./test.txt", "r") as file:
-    machines = parse_file(file)
-    assert len(machines) == 4, f"Expected 4 machines, but got {len(machines)}"
-
-    # Test the first machine.
-    machine = machines[0]
-    result = find_cheapest_way_to_win(machine)
-    assert result is not None, "Expected a solution to first machine, but got None"
-    a_presses, b_presses, cost = result
-    assert a_presses == 80, f"Expected 80 A presses, but got {a_presses}"
-    assert b_presses == 40, f"Expected 40 B presses, but got {b_presses}"
-    assert cost == 280, f"Expected cost of 280, but got {cost}"
-
-    # Test the second and fourth machines.
-    for machine in [machines[1], machines[3]]:
-        result = find_cheapest_way_to_win(machine)
-        assert result is None, "Expected no solution, but got one"
-
-    # Test the third machine.
-    machine = machines[2]
-    result = find_cheapest_way_to_win(machine)
-    assert result is not None, "Expected a solution to third machine, but got None"
-    a_presses, b_presses, cost = result
-    assert a_presses == 38, f"Expected 38 A presses, but got {a_presses}"
-    assert b_presses == 86, f"Expected 86 B presses, but got {b_presses}"
-    assert cost == 200, f"Expected cost of 200, but got {cost}"
-
-    # Part 2
-    print(machines)
-
-    # Test the first and third machines.
-    for machine in [machines[0], machines[2]]:
-        result = solve_linear_system(machine)
-        assert result is None, "Expected no solution, but got one"
-
-    # Test the second and fourth machines.
-    for machine in [machines[1], machines[3]]:
-        result = solve_linear_system(machine)
-        assert result is not None, "Expected a solution, but got None"
-        print("Cost:", result[2])
-
-print("All tests passed.")
-
-with open("./input.txt", "r") as file:
-    machines = parse_file(file)
+def total_cost(results: list[tuple[int, int, int] | None]) -> int:
+    """
+    Sum up the cost of winning every machine that can be won.
+    """
     total_cost = 0
-    for machine in machines:
-        result = find_cheapest_way_to_win(machine)
+    for result in results:
         if result is None:
             continue
         _, _, cost = result
         total_cost += cost
+    return total_cost
 
-    print("Part 1:", total_cost)
 
-    # Part 2
-    total_cost = 0
-    for machine in machines:
-        result = solve_linear_system(machine)
-        if result is None:
-            continue
-        _, _, cost = result
-        total_cost += cost
+def parse(text: Source) -> list[MachineConfig]:
+    return parse_file(text)
+
+
+# Every machine is solved on its own, so the machines can be solved in parallel
+# (see aoc.executor).
+def part1(machines: list[MachineConfig]) -> int:
+    return total_cost(parallel_map(find_cheapest_way_to_win, machines))
+
+
+def part2(machines: list[MachineConfig]) -> int:
+    load_now(np)
+    return total_cost(parallel_map(solve_linear_system, machines))
+
+
+def check_examples() -> None:
+    with map_input("./test.txt") as data:
+        machines = parse_file(data)
+        assert len(machines) == 4, f"Expected 4 machines, but got {len(machines)}"
+
+        # Test the first machine.
+        machine = machines[0]
+        result = find_cheapest_way_to_win(machine)
+        assert result is not None, "Expected a solution to first machine, but got None"
+        a_presses, b_presses, cost = result
+        assert a_presses == 80, f"Expected 80 A presses, but got {a_presses}"
+        assert b_presses == 40, f"Expected 40 B presses, but got {b_presses}"
+        assert cost == 280, f"Expected cost of 280, but got {cost}"
+
+        # Test the second and fourth machines.
+        for machine in [machines[1], machines[3]]:
+            result = find_cheapest_way_to_win(machine)
+            assert result is None, "Expected no solution, but got one"
+
+        # Test the third machine.
+        machine = machines[2]
+        result = find_cheapest_way_to_win(machine)
+        assert result is not None, "Expected a solution to third machine, but got None"
+        a_presses, b_presses, cost = result
+        assert a_presses == 38, f"Expected 38 A presses, but got {a_presses}"
+        assert b_presses == 86, f"Expected 86 B presses, but got {b_presses}"
+        assert cost == 200, f"Expected cost of 200, but got {cost}"
+
+        # A button that only moves the claw along one axis still works.
+        machine: MachineConfig = {
+            "button_a": (0, 5),
+            "button_b": (4, 1),
+            "prize": (8, 12),
+        }
+        result = find_cheapest_way_to_win(machine)
+        assert result == (2, 2, 8), f"Expected (2, 2, 8), but got {result}"
+
+        # Part 2
+        # Test the first and third machines.
+        for machine in [machines[0], machines[2]]:
+            result = solve_linear_system(machine)
+            assert result is None, "Expected no solution, but got one"
+
+        # Test the second and fourth machines.
+        for machine in [machines[1], machines[3]]:
+            result = solve_linear_system(machine)
+            assert result is not None, "Expected a solution, but got None"
+
+
+if __name__ == "__main__":
+    check_examples()
+    print("All tests passed.")
+
+    with map_input("./input.txt") as data:
+        machines = parse(data)
+        print("Part 1:", part1(machines))
 
-    print("Part 2:", total_cost)
+        # Part 2
+        print("Part 2:", part2(machines))
@@ -0,0 +1,34 @@
+import random
+
+# The real input has 500 robots.
+REAL_SIZE = 500
+
+ROWS, COLS = 103, 101
+TREE_LENGTH = 31
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate `size` robots patrolling the real 101 wide by 103 tall space.
+    Most of them start at random positions with random velocities, but a line
+    of them is planted so that they all line up horizontally after a random
+    number of seconds, standing in for the Easter egg.
+    """
+    rng = random.Random(seed)
+    easter_egg_time = rng.randrange(ROWS * COLS)
+    tree_row = rng.randrange(ROWS)
+    tree_start = rng.randrange(COLS - TREE_LENGTH)
+
+    lines: list[str] = []
+    for index in range(size):
+        vr, vc = rng.randint(-99, 99), rng.randint(-99, 99)
+        if index < TREE_LENGTH:
+            # Work backwards from where the robot will be at the Easter egg
+            # time to find where it has to start.
+            row = (tree_row - vr * easter_egg_time) % ROWS
+            col = (tree_start + index - vc * easter_egg_time) % COLS
+        else:
+            row, col = rng.randrange(ROWS), rng.randrange(COLS)
+        lines.append(f"p={col},{row} v={vc},{vr}\n")
+    rng.shuffle(lines)
+    return "".join(lines)
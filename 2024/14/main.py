@@ -1,5 +1,6 @@
-from typing import TextIO, TypedDict
-import re
+from typing import TypedDict
+
+from aoc.reader import Source, int_block, map_input
 
 
 class Robot(TypedDict):
@@ -7,21 +8,15 @@ class Robot(TypedDict):
     velocity: tuple[int, int]
 
 
-ROBOT_REGEX = r"p=(-?\d+),(-?\d+) v=(-?\d+),(-?\d+)"
-
-
-def parse_robots(file: TextIO) -> list[Robot]:
-    robots = []
-    for line in file:
-        # p=0,4 v=3,-3
-        match = re.match(ROBOT_REGEX, line.strip())
-        if match:
-            col, row, vc, vr = map(int, match.groups())
-            robots.append({"initial_position": (row, col), "velocity": (vr, vc)})
-        else:
-            raise ValueError(f"Invalid robot line: {line}")
-
-    return robots
+def parse_robots(source: Source) -> list[Robot]:
+    # p=0,4 v=3,-3
+    numbers = int_block(source, signed=True)
+    if numbers.size and numbers.shape[1] != 4:
+        raise ValueError("Every robot line needs a position and a velocity")
+    return [
+        {"initial_position": (row, col), "velocity": (vr, vc)}
+        for col, row, vc, vr in numbers.tolist()
+    ]
 
 
 type Quadrant = list[tuple[int, int]]
@@ -85,7 +80,7 @@ def calculate_safety_factor(tiles: list[list[int]]) -> int:
     return tl * tr * bl * br
 
 
-def find_easter_egg_time(tiles: list[list[int]]) -> int:
+def find_easter_egg_time(dimensions: tuple[int, int], robots: list[Robot]) -> int:
     """
     Find the time at which the robots form a Christmas tree pattern. I
     originally expected this pattern to appear dead center and looked for
@@ -94,14 +89,12 @@ def find_easter_egg_time(tiles: list[list[int]]) -> int:
     15 or more tiles with robots in a row, which is a good indicator that the
     robots are forming a tree.
     """
-    rows = len(tiles)
-    cols = len(tiles[0])
+    rows, cols = dimensions
     for seconds in range(rows * cols):
         tiles = simulate_patrols((rows, cols), robots, seconds)
         stringified = stringify_tiles(tiles, numbered=False)
         # Check for a line with 15 or more tiles in a row with robots in them.
         if stringified.count("#" * 15) > 0:
-            print(stringified)
             return seconds
 
     raise ValueError("No Easter egg found")
@@ -127,31 +120,50 @@ TEST_TILES = (
     ".1....1...."
 )
 
-with open("test.txt", "r") as file:
-    robots = parse_robots(file)
-    tiles = simulate_patrols((7, 11), robots, 100)
-    stringified = stringify_tiles(tiles)
-    assert (
-        stringified == TEST_TILES
-    ), f"Expected:\n{TEST_TILES}\n but got:\n{stringified}"
+DIMENSIONS = (103, 101)
+
+
+def parse(text: Source) -> list[Robot]:
+    return parse_robots(text)
+
+
+def part1(robots: list[Robot], dimensions: tuple[int, int] = DIMENSIONS) -> int:
+    tiles = simulate_patrols(dimensions, robots, 100)
+    return calculate_safety_factor(tiles)
+
+
+def part2(robots: list[Robot], dimensions: tuple[int, int] = DIMENSIONS) -> int:
+    return find_easter_egg_time(dimensions, robots)
+
+
+def check_examples() -> None:
+    with map_input("test.txt") as data:
+        robots = parse_robots(data)
+        tiles = simulate_patrols((7, 11), robots, 100)
+        stringified = stringify_tiles(tiles)
+        assert (
+            stringified == TEST_TILES
+        ), f"Expected:\n{TEST_TILES}\n but got:\n{stringified}"
 
-    quadrants = get_quadrants(7, 11)
-    assert all(
-        len(q) == 15 for q in quadrants
-    ), "Expected all quadrants to have 15 tiles"
+        quadrants = get_quadrants(7, 11)
+        assert all(
+            len(q) == 15 for q in quadrants
+        ), "Expected all quadrants to have 15 tiles"
 
-    safety_factor = calculate_safety_factor(tiles)
-    assert safety_factor == 12, f"Expected 12, but got {safety_factor}"
+        safety_factor = part1(robots, (7, 11))
+        assert safety_factor == 12, f"Expected 12, but got {safety_factor}"
 
 
-print("All tests passed.")
+if __name__ == "__main__":
+    check_examples()
+    print("All tests passed.")
 
-with open("input.txt", "r") as file:
-    robots = parse_robots(file)
-    tiles = simulate_patrols((103, 101), robots, 100)
-    safety_factor = calculate_safety_factor(tiles)
-    print("Part 1:", safety_factor)
+    with map_input("input.txt") as data:
+        robots = parse(data)
+        print("Part 1:", part1(robots))
 
-    # Part 2
-    easter_egg_time = find_easter_egg_time(tiles)
-    print("Part 2:", easter_egg_time)
+        # Part 2
+        easter_egg_time = part2(robots)
+        tiles = simulate_patrols(DIMENSIONS, robots, easter_egg_time)
+        print(stringify_tiles(tiles, numbered=False))
+        print("Part 2:", easter_egg_time)
@@ -0,0 +1,39 @@
+import math
+import random
+
+# The real input has 20,000 moves on a 50x50 warehouse.
+REAL_SIZE = 20000
+
+MOVES_PER_LINE = 1000
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate a warehouse followed by `size` moves for the robot. The warehouse
+    is walled in and sized so that there are about eight moves per tile, like
+    the real input. Inside, about a tenth of the tiles are walls and a fifth
+    are boxes.
+    """
+    rng = random.Random(seed)
+    side = max(math.isqrt(size // 8), 5)
+    warehouse = [["#"] * side]
+    for _ in range(side - 2):
+        row = ["#"]
+        for _ in range(side - 2):
+            roll = rng.random()
+            row.append("#" if roll < 0.1 else "O" if roll < 0.3 else ".")
+        row.append("#")
+        warehouse.append(row)
+    warehouse.append(["#"] * side)
+    warehouse[side // 2][side // 2] = "@"
+
+    moves = "".join(rng.choices("<>^v", k=size))
+    move_lines = [
+        moves[i : i + MOVES_PER_LINE] for i in range(0, len(moves), MOVES_PER_LINE)
+    ]
+
+    return (
+        "".join("".join(row) + "\n" for row in warehouse)
+        + "\n"
+        + "".join(line + "\n" for line in move_lines)
+    )
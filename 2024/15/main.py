@@ -1,6 +1,7 @@
 from typing import TextIO, Literal, cast
 import copy
 from collections import deque
+import io
 
 type Direction = Literal["<", "^", ">", "v"]
 
@@ -266,37 +267,47 @@ def sum_coordinates(layout: list[list[str]]) -> int:
     return sum
 
 
-with open("test.txt", "r") as file:
-    layout, initial_position, instructions = parse_warehouse(file)
-    layout = simulate(layout, initial_position, instructions)
-    assert (
-        sum_coordinates(layout) == 2028
-    ), f"Expected 2028, but got {sum_coordinates(layout)}"
+type Warehouse = tuple[list[list[str]], tuple[int, int], list[Direction]]
 
-with open("test2.txt", "r") as file:
-    initial_layout, initial_position, instructions = parse_warehouse(file)
-    layout_1 = copy.deepcopy(initial_layout)
-    layout_1 = simulate(layout_1, initial_position, instructions)
-    assert (
-        sum_coordinates(layout_1) == 10092
-    ), f"Expected 10092, but got {sum_coordinates(layout_1)}"
 
-    # Part 2
-    widened_layout, initial_position = widen_layout(initial_layout)
-    layout_2 = simulate(widened_layout, initial_position, instructions, box_size=2)
-    assert (
-        sum_coordinates(layout_2) == 9021
-    ), f"Expected 9021, but got {sum_coordinates(layout_2)}"
+def parse(text: str) -> Warehouse:
+    return parse_warehouse(io.StringIO(text))
+
 
-print("All tests passed!")
+def part1(warehouse: Warehouse) -> int:
+    initial_layout, initial_position, instructions = warehouse
+    # The simulation moves boxes around in place, so work on a copy.
+    layout = simulate(copy.deepcopy(initial_layout), initial_position, instructions)
+    return sum_coordinates(layout)
 
-with open("input.txt", "r") as file:
-    initial_layout, initial_position, instructions = parse_warehouse(file)
-    layout = copy.deepcopy(initial_layout)
-    layout = simulate(layout, initial_position, instructions)
-    print("Part 1:", sum_coordinates(layout))
 
-    # Part 2
+def part2(warehouse: Warehouse) -> int:
+    initial_layout, _, instructions = warehouse
     widened_layout, initial_position = widen_layout(initial_layout)
     layout = simulate(widened_layout, initial_position, instructions, box_size=2)
-    print("Part 2:", sum_coordinates(layout))
+    return sum_coordinates(layout)
+
+
+def check_examples() -> None:
+    with open("test.txt", "r") as file:
+        warehouse = parse_warehouse(file)
+        assert part1(warehouse) == 2028, f"Expected 2028, but got {part1(warehouse)}"
+
+    with open("test2.txt", "r") as file:
+        warehouse = parse_warehouse(file)
+        assert part1(warehouse) == 10092, f"Expected 10092, but got {part1(warehouse)}"
+
+        # Part 2
+        assert part2(warehouse) == 9021, f"Expected 9021, but got {part2(warehouse)}"
+
+
+if __name__ == "__main__":
+    check_examples()
+    print("All tests passed!")
+
+    with open("input.txt", "r") as file:
+        warehouse = parse(file.read())
+        print("Part 1:", part1(warehouse))
+
+        # Part 2
+        print("Part 2:", part2(warehouse))
@@ -0,0 +1,50 @@
+import math
+import random
+
+# The real input is a 141x141 maze.
+REAL_SIZE = 141 * 141
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate a square maze of roughly `size` tiles, with the start in the
+    bottom left corner and the end in the top right, like the real input. The
+    maze is carved out as a perfect maze first, then a few extra walls are
+    knocked down so that there are loops and multiple best paths.
+    """
+    rng = random.Random(seed)
+    side = max(math.isqrt(size), 5)
+    # Mazes are carved on a lattice of odd coordinates, so the side must be odd.
+    if side % 2 == 0:
+        side += 1
+    maze = [["#"] * side for _ in range(side)]
+
+    start = (side - 2, 1)
+    maze[start[0]][start[1]] = "."
+    stack: list[tuple[int, int]] = [start]
+    while stack:
+        row, col = stack[-1]
+        options = [
+            (row + dr, col + dc, row + dr // 2, col + dc // 2)
+            for dr, dc in ((-2, 0), (2, 0), (0, -2), (0, 2))
+            if 0 < row + dr < side - 1
+            and 0 < col + dc < side - 1
+            and maze[row + dr][col + dc] == "#"
+        ]
+        if not options:
+            stack.pop()
+            continue
+        next_row, next_col, wall_row, wall_col = rng.choice(options)
+        maze[wall_row][wall_col] = "."
+        maze[next_row][next_col] = "."
+        stack.append((next_row, next_col))
+
+    for _ in range(side * side // 10):
+        row, col = rng.randrange(1, side - 1), rng.randrange(1, side - 1)
+        # Only knock down walls that sit between two open tiles.
+        if (row + col) % 2 == 1:
+            maze[row][col] = "."
+
+    maze[start[0]][start[1]] = "S"
+    maze[1][side - 2] = "E"
+    return "".join("".join(row) + "\n" for row in maze)
@@ -0,0 +1,65 @@
+import itertools
+import math
+import random
+
+# The real input has 3,450 bytes falling into a 71x71 memory space.
+REAL_SIZE = 3450
+# The real memory space's width and height, which is as small as the solution
+# ever takes it to be, and how many bytes part 1 lets fall.
+REAL_SIDE = 71
+NANOSECONDS = 1024
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate `size` falling bytes, as `X,Y` lines. The memory space is sized
+    so that the bytes cover about two thirds of it, like the real input, which
+    guarantees that the exit is cut off eventually. The start and exit corners
+    are never corrupted, and the corner furthest from the start is always one
+    of the first bytes to fall, so the size of the space can be inferred.
+    The first 1,024 bytes, which part 1 looks at, always leave a path open.
+
+    Fewer bytes than the real input's fall into a space as big as the real one
+    (the smallest the solution infers), too sparsely to be sure of cutting off
+    the exit by chance. So a wall of them is built across it, from bytes that
+    only fall after the first 1,024, which part 1 needs a path through. Below
+    1,024 bytes plus one row of the space, there aren't enough to do both, and
+    the exit is never cut off.
+    """
+    rng = random.Random(seed)
+    side = max(math.isqrt(size * 3 // 2), REAL_SIDE)
+    wall: list[tuple[int, int]] = []
+    if side * side * 2 // 3 > size:
+        wall_y = rng.randrange(1, side - 1)
+        wall = [(x, wall_y) for x in range(side)]
+    cells = [
+        (x, y)
+        for y in range(side)
+        for x in range(side)
+        if (x, y) not in ((0, 0), (side - 1, side - 1)) and (x, y) not in wall
+    ]
+    falling = rng.sample(cells, len(cells))
+    # Make sure the far edge of the space appears among the bytes.
+    for edge in ((side - 1, 0), (0, side - 1)):
+        falling.remove(edge)
+        falling.insert(rng.randrange(20), edge)
+
+    # Part 1 needs a path to the exit, so the cells along a random one (made of
+    # steps right and down) only fall after the bytes it looks at. It starts
+    # with a step right and then one down, so it goes through neither edge.
+    steps = [(1, 0)] * (side - 2) + [(0, 1)] * (side - 2)
+    rng.shuffle(steps)
+    steps = [(1, 0), (0, 1), *steps]
+    path = set(itertools.accumulate(steps, lambda a, b: (a[0] + b[0], a[1] + b[1])))
+    first: list[tuple[int, int]] = []
+    rest: list[tuple[int, int]] = []
+    for cell in falling:
+        if len(first) < NANOSECONDS and cell not in path:
+            first.append(cell)
+        else:
+            rest.append(cell)
+    falling = (first + rest)[: max(size - len(wall), 0)]
+
+    for brick in wall:
+        falling.insert(rng.randint(min(NANOSECONDS, len(falling)), len(falling)), brick)
+    return "".join(f"{x},{y}\n" for x, y in falling[:size])
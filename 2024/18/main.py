@@ -1,134 +1,173 @@
-from typing import TextIO
-import heapq
+from aoc.grid import Grid
+from aoc.instrument import profiled
+from aoc.reader import Source, int_block, map_input
+from aoc.search import search
+from aoc.union_find import UnionFind
 
 
-def parse_falling_bytes(file: TextIO) -> list[tuple[int, int]]:
-    positions = []
-    for line in file:
-        x, y = line.strip().split(",")
-        # Append the tuple as (row, column), which is actually (y, x).
-        positions.append((int(y), int(x)))
-    return positions
+def parse_falling_bytes(source: Source) -> list[tuple[int, int]]:
+    positions = int_block(source)
+    # Each position is (row, column), which is actually (y, x). Converting a
+    # column at a time skips building a list for every row on the way.
+    return list(zip(positions[:, 1].tolist(), positions[:, 0].tolist()))
 
 
 def corrupt_memory_space(
     size: int, nanoseconds: int, falling_bytes: list[tuple[int, int]]
-) -> list[list[str]]:
-    memory_space = [["."] * size for _ in range(size)]
-    for row, column in falling_bytes[:nanoseconds]:
-        memory_space[row][column] = "#"
+) -> Grid:
+    memory_space = Grid.full(size, size, ".")
+    for position in falling_bytes[:nanoseconds]:
+        memory_space[position] = "#"
     return memory_space
 
 
-def dijkstra(memory_space: list[list[str]], start: tuple[int, int]) -> int:
+@profiled
+def find_shortest_path_length(memory_space: Grid, start: tuple[int, int]) -> int:
     """
-    Implements Dijkstra's algorithm to find the shortest path from the start to
-    the end in the memory space. The function returns the length of the shortest
-    path. If no path is found, the function raises a ValueError.
+    Finds the length of the shortest path from the start to the bottom right
+    corner of the memory space. Every step costs the same, so the search runs
+    as a breadth-first search over the (flattened) positions. If no path is
+    found, the function raises a ValueError.
     """
+    end = (memory_space.height - 1, memory_space.width - 1)
+    # Surround the memory space with corrupted bytes, so that anywhere outside
+    # of it is just as unreachable as a corrupted position inside it.
+    memory_space = memory_space.padded("#")
+    # For each node, whether that position is not corrupted (one byte each).
+    is_reachable = (memory_space.cells != ord("#")).tobytes()
+    # Node IDs of the four cardinal directions from any position.
+    steps = (1, -1, memory_space.stride, -memory_space.stride)
+
+    def neighbors(node: int) -> list[tuple[int, int]]:
+        return [(node + step, 1) for step in steps if is_reachable[node + step]]
+
+    end_node = memory_space.node(end)
+    result = search(
+        memory_space.num_nodes,
+        [memory_space.node(start)],
+        neighbors,
+        weights=[1],
+        targets=[end_node],
+    )
+    return result.distance(end_node)
 
-    def is_reachable(node: tuple[int, int]) -> bool:
-        """
-        Helper function to check if a node is within bounds and not a wall.
-        """
+
+def find_first_totally_blocked_byte(
+    size: int, falling_bytes: list[tuple[int, int]]
+) -> tuple[int, int]:
+    """
+    Finds the first byte that completely corrupts the memory space, such that no
+    path is possible from the top left corner to the bottom right corner. The
+    function returns the coordinates of that byte.
+    """
+    # Working from the last byte position, we can clear the fallen bytes one at
+    # a time, joining each cleared position to the open regions around it. The
+    # first byte that completely corrupts the memory space is the one whose
+    # clearing finally joins the two corners.
+    # How many bytes have fallen on each position (by node, row by row).
+    num_corrupted = [0] * (size * size)
+    for row, col in falling_bytes:
+        num_corrupted[row * size + col] += 1
+    regions = UnionFind(size * size)
+
+    def clear(row: int, col: int) -> None:
+        node = row * size + col
+        if row > 0 and not num_corrupted[node - size]:
+            regions.union(node, node - size)
+        if row < size - 1 and not num_corrupted[node + size]:
+            regions.union(node, node + size)
+        if col > 0 and not num_corrupted[node - 1]:
+            regions.union(node, node - 1)
+        if col < size - 1 and not num_corrupted[node + 1]:
+            regions.union(node, node + 1)
+
+    for node in range(size * size):
+        if not num_corrupted[node]:
+            clear(*divmod(node, size))
+
+    start, end = 0, size * size - 1
+
+    def has_path() -> bool:
         return (
-            0 <= node[0] < len(memory_space)
-            and 0 <= node[1] < len(memory_space[0])
-            and memory_space[node[0]][node[1]] != "#"
+            not num_corrupted[start]
+            and not num_corrupted[end]
+            and regions.connected(start, end)
         )
 
-    min_heap: list[
-        tuple[int, tuple[int, int]]
-        # (path length, position)
-    ] = [(0, start)]
-
-    # Initialize the set of visited positions
-    visited: set[tuple[int, int]] = set()
-
-    # Continue until we reach the end position or the heap is empty.
-    while len(min_heap) > 0:
-        # Pop the position with the smallest score from the heap.
-        current_length, current_pos = heapq.heappop(min_heap)
-        # If we've visited this position before, skip it.
-        if current_pos in visited:
+    if has_path():
+        raise ValueError("Paths found for all bytes")
+    for row, col in reversed(falling_bytes):
+        node = row * size + col
+        num_corrupted[node] -= 1
+        # The position is still corrupted by an earlier byte.
+        if num_corrupted[node]:
             continue
-        # Mark the current position as visited.
-        visited.add(current_pos)
+        clear(row, col)
+        if has_path():
+            return row, col
 
-        # If we've reached the end, return the path length.
-        if current_pos == (len(memory_space) - 1, len(memory_space[0]) - 1):
-            return current_length
+    raise ValueError("No path found even before any bytes fell")
 
-        # Check the four cardinal directions from the current position.
-        neighbors = [
-            (current_pos[0] + 1, current_pos[1]),
-            (current_pos[0] - 1, current_pos[1]),
-            (current_pos[0], current_pos[1] + 1),
-            (current_pos[0], current_pos[1] - 1),
-        ]
 
-        for neighbor in neighbors:
-            # If the neighbor is within bounds and not a wall, it's a path we can take.
-            if is_reachable(neighbor):
-                # Add the neighbor to the heap with the new path length to
-                # continue exploring.
-                heapq.heappush(min_heap, (current_length + 1, neighbor))
+# In 0-indexed 2D space, if (70, 70) is the bottom right corner, then the size
+# is 71x71.
+SIZE = 71
+NANOSECONDS = 1024
 
-    raise ValueError("No path found")
 
+def parse(text: Source) -> list[tuple[int, int]]:
+    return parse_falling_bytes(text)
 
-def find_first_totally_blocked_byte(
-    size: int, falling_bytes: list[tuple[int, int]]
-) -> tuple[int, int]:
+
+def infer_size(byte_positions: list[tuple[int, int]]) -> int:
     """
-    Finds the first byte that completely corrupts the memory space, such that no
-    path is possible from the top left corner to the bottom right corner. The
-    function returns the coordinates of that byte.
+    The memory space is at least as big as the real input's, but larger
+    (generated) inputs need more room: the bytes are spread over the whole
+    space, so the furthest coordinate any of them lands on tells us its size.
     """
-    # Working from the last byte position, we can simulate the falling bytes and
-    # find the last byte before the memory space is fully corrupted and no path
-    # is possible.
-    reversed_positions = list(reversed(falling_bytes))
-    # We want to return the first byte that completely corrupts the memory
-    # space, which will be the byte just before we find a valid path, when
-    # working back to front.
-    last_coord = reversed_positions[0]
-    for i, coord in enumerate(reversed_positions):
-        # Try with corrupted memory space up to all bytes up to the ith byte position.
-        memory_space = corrupt_memory_space(size, len(falling_bytes) - i, falling_bytes)
-        try:
-            dijkstra(memory_space, (0, 0))
-            return last_coord
-        except ValueError:
-            last_coord = coord
-            continue
+    return max(SIZE, max(max(position) for position in byte_positions) + 1)
+
+
+def part1(
+    byte_positions: list[tuple[int, int]],
+    size: int | None = None,
+    nanoseconds: int = NANOSECONDS,
+) -> int:
+    size = size or infer_size(byte_positions)
+    memory_space = corrupt_memory_space(size, nanoseconds, byte_positions)
+    return find_shortest_path_length(memory_space, (0, 0))
+
+
+def part2(byte_positions: list[tuple[int, int]], size: int | None = None) -> str:
+    size = size or infer_size(byte_positions)
+    row, col = find_first_totally_blocked_byte(size, byte_positions)
+    # The answer is expected as X,Y, i.e. column first.
+    return f"{col},{row}"
 
-    raise ValueError("Paths found for all bytes")
 
+def check_examples() -> None:
+    with map_input("test.txt") as data:
+        byte_positions = parse_falling_bytes(data)
+        shortest_path_length = part1(byte_positions, size=7, nanoseconds=12)
+        assert (
+            shortest_path_length == 22
+        ), f"Expected 22, but got {shortest_path_length}"
 
-with open("test.txt", "r") as file:
-    byte_positions = parse_falling_bytes(file)
-    memory_space = corrupt_memory_space(7, 12, byte_positions)
-    shortest_path_length = dijkstra(memory_space, (0, 0))
-    assert shortest_path_length == 22, f"Expected 22, but got {shortest_path_length}"
+        # Part 2
+        first_blocking_byte = find_first_totally_blocked_byte(7, byte_positions)
+        assert first_blocking_byte == (
+            1,
+            6,
+        ), f"Expected (1, 6), but got {first_blocking_byte}"
 
-    # Part 2
-    first_blocking_byte = find_first_totally_blocked_byte(7, byte_positions)
-    assert first_blocking_byte == (
-        1,
-        6,
-    ), f"Expected (1, 6), but got {first_blocking_byte}"
 
-print("All tests passed.")
+if __name__ == "__main__":
+    check_examples()
+    print("All tests passed.")
 
-with open("input.txt", "r") as file:
-    byte_positions = parse_falling_bytes(file)
-    # In 0-indexed 2D space, if (70, 70) is the bottom right corner, then the
-    # size is 71x71.
-    memory_space = corrupt_memory_space(71, 1024, byte_positions)
-    shortest_path_length = dijkstra(memory_space, (0, 0))
-    print("Part 1:", shortest_path_length)
+    with map_input("input.txt") as data:
+        byte_positions = parse(data)
+        print("Part 1:", part1(byte_positions))
 
-    # Part 2
-    first_blocking_byte = find_first_totally_blocked_byte(71, byte_positions)
-    print("Part 2:", f"{first_blocking_byte[1]},{first_blocking_byte[0]}")
+        # Part 2
+        print("Part 2:", part2(byte_positions))
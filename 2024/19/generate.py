@@ -0,0 +1,36 @@
+import random
+
+# The real input has 400 designs.
+REAL_SIZE = 400
+
+COLORS = "wubrg"
+
+
+def random_stripes(rng: random.Random, length: int) -> str:
+    return "".join(rng.choices(COLORS, k=length))
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate the available towel patterns followed by `size` designs. Most
+    designs are built by stringing together available patterns, so that they
+    have (many) arrangements; the rest are random and usually impossible.
+    """
+    rng = random.Random(seed)
+    # Like the real input, one of the colors isn't available as a single
+    # stripe towel, otherwise every design would be possible.
+    patterns = sorted(
+        {random_stripes(rng, rng.randint(1, 8)) for _ in range(450)} - {"w"}
+    )
+
+    designs: list[str] = []
+    for _ in range(size):
+        if rng.random() < 0.7:
+            design = ""
+            while len(design) < 40:
+                design += rng.choice(patterns)
+        else:
+            design = random_stripes(rng, rng.randint(40, 60))
+        designs.append(design)
+
+    return ", ".join(patterns) + "\n\n" + "".join(d + "\n" for d in designs)
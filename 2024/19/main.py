@@ -1,5 +1,7 @@
 from typing import TextIO, TypedDict
-from functools import cache
+import io
+
+from aoc.memo import memo
 
 
 class TowelConfig(TypedDict):
@@ -18,7 +20,7 @@ def parse_towel_config(file: TextIO) -> TowelConfig:
     return {"patterns": patterns, "design_requests": design_requests}
 
 
-@cache
+@memo
 def can_form_pattern_from_towels(patterns: frozenset[str], design: str) -> bool:
     """
     Check if the given design can be formed by arranging towels of different
@@ -26,18 +28,19 @@ def can_form_pattern_from_towels(patterns: frozenset[str], design: str) -> bool:
     starts with any of the patterns and if the remaining part of the design can
     also be formed by arranging towels.
     """
-    if design == "" or design in config["patterns"]:
+    if design == "" or design in patterns:
         return True
 
     return any(
         design.startswith(pattern)
         and can_form_pattern_from_towels(patterns, design[len(pattern) :])
-        for pattern in config["patterns"]
+        for pattern in patterns
     )
 
 
 # Part 2
-@cache
+# Persisted, so that each design is only ever counted once for a set of patterns.
+@memo(persist=True)
 def count_possible_designs(patterns: frozenset[str], design: str) -> int:
     """
     Check how many different arrangements of towels can form the given design.
@@ -50,7 +53,7 @@ def count_possible_designs(patterns: frozenset[str], design: str) -> int:
 
     return sum(
         count_possible_designs(patterns, design[len(pattern) :])
-        for pattern in config["patterns"]
+        for pattern in patterns
         if design.startswith(pattern)
     )
 
@@ -104,40 +107,55 @@ TEST_CASES: list[TestCase] = [
     },
 ]
 
-with open("test.txt", "r") as file:
-    config = parse_towel_config(file)
-    assert (
-        len(config["patterns"]) == 8
-    ), f"Expected 8 patterns, but got {len(config['patterns'])}"
-    assert (
-        len(config["design_requests"]) == 8
-    ), f"Expected 8 design requests, but got {len(config['design_requests'])}"
-
-    for case in TEST_CASES:
-        possible = can_form_pattern_from_towels(config["patterns"], case["design"])
-        assert (
-            possible == case["expected_possible"]
-        ), f"Expected {case['expected_possible']} for {case['design']}, but got {possible}"
 
-        # Part 2
-        count = count_possible_designs(config["patterns"], case["design"])
-        assert (
-            count == case["expected_count"]
-        ), f"Expected {case['expected_count']} possible designs for {case['design']}, but got {count}"
+def parse(text: str) -> TowelConfig:
+    return parse_towel_config(io.StringIO(text))
 
-print("All tests passed.")
 
-with open("input.txt", "r") as file:
-    config = parse_towel_config(file)
-    possible_designs = sum(
+def part1(config: TowelConfig) -> int:
+    return sum(
         can_form_pattern_from_towels(config["patterns"], design)
         for design in config["design_requests"]
     )
-    print("Part 1:", possible_designs)
 
-    # Part 2
-    total_designs = sum(
+
+def part2(config: TowelConfig) -> int:
+    return sum(
         count_possible_designs(config["patterns"], design)
         for design in config["design_requests"]
     )
-    print("Part 2:", total_designs)
+
+
+def check_examples() -> None:
+    with open("test.txt", "r") as file:
+        config = parse_towel_config(file)
+        assert (
+            len(config["patterns"]) == 8
+        ), f"Expected 8 patterns, but got {len(config['patterns'])}"
+        assert (
+            len(config["design_requests"]) == 8
+        ), f"Expected 8 design requests, but got {len(config['design_requests'])}"
+
+        for case in TEST_CASES:
+            possible = can_form_pattern_from_towels(config["patterns"], case["design"])
+            assert (
+                possible == case["expected_possible"]
+            ), f"Expected {case['expected_possible']} for {case['design']}, but got {possible}"
+
+            # Part 2
+            count = count_possible_designs(config["patterns"], case["design"])
+            assert (
+                count == case["expected_count"]
+            ), f"Expected {case['expected_count']} possible designs for {case['design']}, but got {count}"
+
+
+if __name__ == "__main__":
+    check_examples()
+    print("All tests passed.")
+
+    with open("input.txt", "r") as file:
+        config = parse(file.read())
+        print("Part 1:", part1(config))
+
+        # Part 2
+        print("Part 2:", part2(config))
@@ -0,0 +1,31 @@
+import random
+
+# The real input has 1,000 reports.
+REAL_SIZE = 1000
+
+
+def generate_report(rng: random.Random) -> list[int]:
+    """
+    Generate a report that is safe by construction, then possibly break it by
+    introducing a bad level, so that there's a mix of safe reports, reports
+    that need one level removed, and reports that are unsafe either way.
+    """
+    length = rng.randint(5, 8)
+    step_sign = rng.choice((-1, 1))
+    levels = [rng.randint(10, 90)]
+    for _ in range(length - 1):
+        levels.append(levels[-1] + step_sign * rng.randint(1, 3))
+
+    for _ in range(rng.choice((0, 0, 1, 2))):
+        index = rng.randrange(length)
+        levels[index] += rng.choice((-5, -1, 0, 4))
+
+    return levels
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate `size` reports, one per line, with levels separated by spaces.
+    """
+    rng = random.Random(seed)
+    return "".join(" ".join(map(str, generate_report(rng))) + "\n" for _ in range(size))
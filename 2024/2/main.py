@@ -1,78 +1,218 @@
-from typing import TextIO, Literal
-from collections import deque
+from typing import Literal
+from itertools import pairwise
 
+import numpy as np
 
-def parse_file(file: TextIO) -> list[list[int]]:
-    return [[int(num) for num in line.split()] for line in file]
+from aoc.reader import Source, int_lists, int_rows, map_input
 
+# Every report's levels, one report per row, padded out with zeros to the
+# length of the longest one.
+type Levels = np.ndarray
+# How many levels are in each report.
+type Lengths = np.ndarray
+type Reports = tuple[Levels, Lengths]
 
-def is_safe(_report: list[int]) -> bool:
-    """
-    Return True if the report is safe, False otherwise.
-    """
-    report = deque(_report)
-
-    def is_safe_recursive(
-        first: int, rest: deque[int], dir: Literal["asc", "desc"]
-    ) -> bool:
-        if len(rest) == 0:
-            return True
-
-        second = rest.popleft()
-        # If the direction is ascending, the second number must be greater than
-        # the first by at least 1 and at most 3.
-        if dir == "asc" and (second < first + 1 or second > first + 3):
-            return False
-        # If the direction is descending, the second number must be less than
-        # the first by at least 1 and at most 3.
-        elif dir == "desc" and (second > first - 1 or second < first - 3):
-            return False
-
-        return is_safe_recursive(second, rest, dir)
-
-    first = report.popleft()
-    return is_safe_recursive(first, report.copy(), "asc") or is_safe_recursive(
-        first, report.copy(), "desc"
+
+def parse_file(source: Source) -> Reports:
+    values, lengths = int_rows(source, signed=True)
+    # Levels are small, so they're packed as 32-bit integers where they fit.
+    int32 = np.iinfo(np.int32)
+    fits = not len(values) or (values.min() >= int32.min and values.max() <= int32.max)
+    levels = np.zeros(
+        (len(lengths), int(lengths.max(initial=0))),
+        dtype=np.int32 if fits else np.int64,
     )
+    # The values fill each row up to its report's length, in order, so a mask
+    # of those cells places them without working out an index for each one.
+    levels[np.arange(levels.shape[1]) < lengths[:, np.newaxis]] = values
+    return levels, lengths
 
 
-def get_all_with_one_deleted(report: list[int]) -> list[list[int]]:
+def is_safe(report: list[int]) -> bool:
     """
-    Return a list of reports where each report is the input with the i-th
-    element deleted.
+    Return True if the report is safe, False otherwise.
     """
-    return [report[:i] + report[i + 1 :] for i in range(len(report))]
 
-
-def is_safe_with_one_deleted(report: list[int]) -> bool:
-    if is_safe(report):
+    def is_safe_in_direction(dir: Literal["asc", "desc"]) -> bool:
+        for first, second in pairwise(report):
+            # If the direction is ascending, the second number must be greater
+            # than the first by at least 1 and at most 3.
+            if dir == "asc" and (second < first + 1 or second > first + 3):
+                return False
+            # If the direction is descending, the second number must be less
+            # than the first by at least 1 and at most 3.
+            elif dir == "desc" and (second > first - 1 or second < first - 3):
+                return False
         return True
-    else:
-        reports_with_one_deleted = get_all_with_one_deleted(report)
-        for report_with_one_deleted in reports_with_one_deleted:
-            if is_safe(report_with_one_deleted):
-                return True
-    return False
 
+    return is_safe_in_direction("asc") or is_safe_in_direction("desc")
 
-with open("test.txt", "r") as file:
-    reports = parse_file(file)
 
-    num_safe = sum(is_safe(report) for report in reports)
-    assert num_safe == 2, f"Expected 2, but got {num_safe}"
+# How much each level has to change from the one before it, in either direction.
+MIN_STEP = 1
+MAX_STEP = 3
 
-    # Part 2
-    num_safe = sum(is_safe_with_one_deleted(report) for report in reports)
-    assert num_safe == 4, f"Expected 4, but got {num_safe}"
 
-print("All tests passed!")
+def removals_in_direction(
+    report: list[int], dir: Literal["asc", "desc"], max_removals: int
+) -> list[int] | None:
+    """
+    Return the indices of the fewest levels that need removing for the report
+    to be safe in the given direction, or None if that takes more than
+    `max_removals` of them.
+
+    The levels that are kept form the longest run (not necessarily contiguous)
+    where each level changes from the one before it by a safe amount. Since a
+    safe change is only ever one of a few values, the longest run ending at a
+    level can be found by looking up the longest runs ending at each value the
+    level before it could have had, so this is one pass over the report.
+    """
+    sign = 1 if dir == "asc" else -1
+    # For each value, the length of the longest run found so far ending in
+    # that value, and the index of the level it ends at.
+    longest: dict[int, tuple[int, int]] = {}
+    # For each level, the index of the level before it in the longest run
+    # ending at it, or -1 if it's the first in that run.
+    previous: list[int] = []
+    best_length, best_end = 0, -1
+    for index, level in enumerate(report):
+        length, before = 0, -1
+        for step in range(MIN_STEP, MAX_STEP + 1):
+            run = longest.get(level - sign * step)
+            if run is not None and run[0] > length:
+                length, before = run
+        length += 1
+        previous.append(before)
+        if length > longest.get(level, (0, -1))[0]:
+            longest[level] = (length, index)
+        if length > best_length:
+            best_length, best_end = length, index
+        # Even if every level after this one extended the longest run, all of
+        # the levels so far that aren't in it would still need removing.
+        if index + 1 - best_length > max_removals:
+            return None
+
+    kept: set[int] = set()
+    while best_end != -1:
+        kept.add(best_end)
+        best_end = previous[best_end]
+    return [index for index in range(len(report)) if index not in kept]
+
+
+def removals_to_make_safe(report: list[int], max_removals: int = 1) -> list[int] | None:
+    """
+    Return the indices of the fewest levels that need removing for the report
+    to be safe (an empty list if it's safe already), or None if that takes more
+    than `max_removals` of them.
+    """
+    ascending = removals_in_direction(report, "asc", max_removals)
+    if ascending == []:
+        return ascending
+    descending = removals_in_direction(report, "desc", max_removals)
+    if ascending is None or (
+        descending is not None and len(descending) < len(ascending)
+    ):
+        return descending
+    return ascending
+
+
+# Batched, for classifying every report at once.
+
 
-with open("input.txt", "r") as file:
-    reports = parse_file(file)
+def safe_steps(changes: np.ndarray, dir: Literal["asc", "desc"]) -> np.ndarray:
+    """
+    Return which of the changes between levels are safe in the given direction.
+    """
+    if dir == "desc":
+        changes = -changes
+    return (changes >= MIN_STEP) & (changes <= MAX_STEP)
 
-    num_safe = sum(is_safe(report) for report in reports)
-    print("Part 1:", num_safe)
 
-    # Part 2
-    num_safe = sum(is_safe_with_one_deleted(report) for report in reports)
-    print("Part 2:", num_safe)
+def safe_reports(reports: Reports, max_removals: Literal[0, 1] = 0) -> np.ndarray:
+    """
+    Return which reports are safe, with up to `max_removals` levels removed,
+    for every report at once.
+
+    Removing a level from a report drops the changes on either side of it and
+    puts their sum in their place. So a report is safe with level `i` removed
+    if every change before `i - 1` is safe (a running "all" from the start), as
+    is every change from `i + 1` on (a running "all" from the end), and so is
+    the sum of the two changes either side of it, if it has a level on both.
+    """
+    levels, lengths = reports
+    num_changes = max(levels.shape[1] - 1, 0)
+    # The changes past the end of each report are between padding, and so
+    # they're taken to be safe.
+    padding = np.arange(num_changes) >= (lengths[:, np.newaxis] - 1)
+    changes = np.diff(levels, axis=1)
+    merged = changes[:, :-1] + changes[:, 1:]
+    everywhere = np.ones((len(lengths), 1), dtype=bool)
+
+    safe = np.zeros(len(lengths), dtype=bool)
+    for dir in ("asc", "desc"):
+        steps = safe_steps(changes, dir) | padding
+        if max_removals == 0:
+            safe |= steps.all(axis=1)
+            continue
+        # For each level, whether all of the changes before the one into the
+        # level before it are safe, and all of those after the one out of it.
+        before = np.logical_and.accumulate(
+            np.hstack((everywhere, everywhere, steps[:, :-1])), axis=1
+        )
+        after = np.logical_and.accumulate(
+            np.hstack((steps[:, 1:], everywhere, everywhere))[:, ::-1], axis=1
+        )[:, ::-1]
+        # The first and last levels only have a change on one side, as do the
+        # last levels of the shorter reports, whose next change is padding.
+        bridged = np.hstack(
+            (everywhere, safe_steps(merged, dir) | padding[:, 1:], everywhere)
+        )
+        safe |= (before & after & bridged).any(axis=1)
+    return safe
+
+
+def parse(text: Source) -> Reports:
+    return parse_file(text)
+
+
+def part1(reports: Reports) -> int:
+    return int(safe_reports(reports).sum())
+
+
+def part2(reports: Reports) -> int:
+    return int(safe_reports(reports, max_removals=1).sum())
+
+
+def check_examples() -> None:
+    with map_input("test.txt") as data:
+        reports = parse_file(data)
+
+        num_safe = part1(reports)
+        assert num_safe == 2, f"Expected 2, but got {num_safe}"
+
+        # Part 2
+        num_safe = part2(reports)
+        assert num_safe == 4, f"Expected 4, but got {num_safe}"
+
+    with map_input("test.txt") as data:
+        # The same, a report at a time.
+        report_lists = int_lists(data, signed=True)
+
+        num_safe = sum(is_safe(report) for report in report_lists)
+        assert num_safe == 2, f"Expected 2, but got {num_safe}"
+
+        removals = [removals_to_make_safe(report) for report in report_lists]
+        expected = [[], None, None, [2], [3], []]
+        assert removals == expected, f"Expected {expected}, but got {removals}"
+
+
+if __name__ == "__main__":
+    check_examples()
+    print("All tests passed!")
+
+    with map_input("input.txt") as data:
+        reports = parse(data)
+        print("Part 1:", part1(reports))
+
+        # Part 2
+        print("Part 2:", part2(reports))
@@ -0,0 +1,31 @@
+import random
+
+# The real input's racetrack is about 9,400 picoseconds long.
+REAL_SIZE = 9400
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate a racetrack of roughly `size` track tiles. The track snakes back
+    and forth across the map in rows separated by a single wall, so that there
+    are plenty of cheats available both through the walls between rows and
+    along the turns. The width of the map varies with the seed.
+    """
+    rng = random.Random(seed)
+    width = max(int(size**0.5) + rng.randint(-5, 5), 5)
+    lanes = max(size // (width + 1), 1)
+    height = 2 * lanes + 1
+    track = [["#"] * (width + 2) for _ in range(height)]
+
+    for lane in range(lanes):
+        row = 2 * lane + 1
+        for col in range(1, width + 1):
+            track[row][col] = "."
+        # Connect this lane to the next one at alternating ends.
+        if lane < lanes - 1:
+            track[row + 1][width if lane % 2 == 0 else 1] = "."
+
+    last_row = 2 * lanes - 1
+    track[1][1] = "S"
+    track[last_row][width if (lanes - 1) % 2 == 0 else 1] = "E"
+    return "".join("".join(row) + "\n" for row in track)
@@ -0,0 +1,12 @@
+import random
+
+# The real input has 5 door codes.
+REAL_SIZE = 5
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate `size` door codes of three digits followed by `A`.
+    """
+    rng = random.Random(seed)
+    return "".join("".join(rng.choices("0123456789", k=3)) + "A\n" for _ in range(size))
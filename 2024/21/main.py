@@ -1,5 +1,7 @@
 from typing import TypedDict, TextIO, Literal, TypeVar, cast
-from functools import cache
+import io
+
+from aoc.memo import memo
 
 
 def parse_door_codes(file: TextIO) -> list[str]:
@@ -119,7 +121,9 @@ def shortest_sequences_between_buttons(
     return [row_moves + col_moves, col_moves + row_moves]
 
 
-@cache
+# Persisted, so that deeper chains of keypads build on shallower ones from
+# previous runs.
+@memo(persist=True)
 def find_shortest_expanded_sequence(
     input: str, num_keypads: int, use_numpad=False
 ) -> int:
@@ -243,41 +247,59 @@ TEST_CASES: list[TestCase] = [
     },
 ]
 
-for test_case in TEST_CASES:
-    input_str = test_case["input"]
-
-    sequence_length = find_shortest_expanded_sequence(
-        input_str, num_keypads=3, use_numpad=True
-    )
 
-    expected_length = test_case["expected_sequence_length"]
-    assert (
-        sequence_length == expected_length
-    ), f"Input: {input_str}: Expected sequence length of {expected_length}, but got {sequence_length}"
+def parse(text: str) -> list[str]:
+    return parse_door_codes(io.StringIO(text))
 
-    complexity = calculate_complexity(input_str, sequence_length)
-    expected_complexity = test_case["expected_complexity"]
-    assert (
-        complexity == expected_complexity
-    ), f"Input: {input_str}: Expected complexity of {expected_complexity}, but got {complexity}"
 
-print("All tests passed.")
-
-with open("input.txt", "r") as file:
-    codes = parse_door_codes(file)
-    total_complexity = sum(
+def total_complexity(codes: list[str], num_keypads: int) -> int:
+    return sum(
         calculate_complexity(
-            code, find_shortest_expanded_sequence(code, num_keypads=3, use_numpad=True)
+            code,
+            find_shortest_expanded_sequence(
+                code, num_keypads=num_keypads, use_numpad=True
+            ),
         )
         for code in codes
     )
-    print("Part 1:", total_complexity)
 
-    # Part 2: The robots are now operating 25 directional keypads.
-    total_complexity = sum(
-        calculate_complexity(
-            code, find_shortest_expanded_sequence(code, num_keypads=26, use_numpad=True)
+
+def part1(codes: list[str]) -> int:
+    return total_complexity(codes, num_keypads=3)
+
+
+def part2(codes: list[str]) -> int:
+    # The robots are now operating 25 directional keypads.
+    return total_complexity(codes, num_keypads=26)
+
+
+def check_examples() -> None:
+    for test_case in TEST_CASES:
+        input_str = test_case["input"]
+
+        sequence_length = find_shortest_expanded_sequence(
+            input_str, num_keypads=3, use_numpad=True
         )
-        for code in codes
-    )
-    print("Part 2:", total_complexity)
+
+        expected_length = test_case["expected_sequence_length"]
+        assert (
+            sequence_length == expected_length
+        ), f"Input: {input_str}: Expected sequence length of {expected_length}, but got {sequence_length}"
+
+        complexity = calculate_complexity(input_str, sequence_length)
+        expected_complexity = test_case["expected_complexity"]
+        assert (
+            complexity == expected_complexity
+        ), f"Input: {input_str}: Expected complexity of {expected_complexity}, but got {complexity}"
+
+
+if __name__ == "__main__":
+    check_examples()
+    print("All tests passed.")
+
+    with open("input.txt", "r") as file:
+        codes = parse(file.read())
+        print("Part 1:", part1(codes))
+
+        # Part 2
+        print("Part 2:", part2(codes))
@@ -0,0 +1,12 @@
+import random
+
+# The real input has around 2,000 buyers.
+REAL_SIZE = 2000
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate an initial secret number for each of `size` buyers.
+    """
+    rng = random.Random(seed)
+    return "".join(f"{rng.randint(1, 16777215)}\n" for _ in range(size))
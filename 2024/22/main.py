@@ -1,11 +1,15 @@
-from typing import TextIO
-from collections import defaultdict
+from array import array
 
+from aoc.executor import parallel_map
+from aoc.instrument import profiled
+from aoc.reader import Source, ints, map_input
 
-def parse_initial_secrets(file: TextIO) -> list[int]:
-    return [int(line.strip()) for line in file]
 
+def parse_initial_secrets(source: Source) -> list[int]:
+    return ints(source).tolist()
 
+
+@profiled
 def evolve(secret: int) -> int:
     """
     Evolves a buyer's secret number into the next secret number in the sequence
@@ -46,99 +50,160 @@ def make_sequence(secret: int, steps: int) -> list[int]:
     return sequence
 
 
-def find_best_sale(sequences: list[list[int]]) -> tuple[tuple[int, int, int, int], int]:
+type PriceChanges = tuple[int, int, int, int]
+
+# A price is a single digit, so a change in price is from -9 to 9. That makes a
+# run of 4 changes a 4-digit number in base 19 (offsetting each by 9), which
+# packs it into a single int below this.
+WINDOWS = 19**4
+
+# The sales a single buyer would make: every run of 4 price changes they would
+# sell at, packed (see WINDOWS), and the price they would sell at for each.
+type BuyerSales = tuple[array, bytes]
+
+
+def unpack_window(window: int) -> PriceChanges:
+    """
+    Unpacks a run of 4 price changes packed into an int (see WINDOWS).
+    """
+    window, fourth = divmod(window, 19)
+    window, third = divmod(window, 19)
+    first, second = divmod(window, 19)
+    return (first - 9, second - 9, third - 9, fourth - 9)
+
+
+def find_buyer_sales(sequence: list[int]) -> BuyerSales:
+    """
+    Finds the price a single buyer would sell at for every sequence of 4
+    consecutive price changes that comes up in their sequence of secret
+    numbers.
+    """
+    offer_prices = [secret % 10 for secret in sequence]
+
+    # Keep track of the sale made for each sequence of 4 price changes. Once a
+    # hiding spot is sold, the monkey will move on, so only the first time a
+    # sequence comes up counts.
+    windows = array("l")
+    prices = bytearray()
+    seen: set[int] = set()
+    window = 0
+    for i in range(1, len(offer_prices)):
+        # Shift the change between this offer price and the previous one into
+        # the last 4, dropping the oldest.
+        change = offer_prices[i] - offer_prices[i - 1]
+        window = (window * 19 + change + 9) % WINDOWS
+        # The first offer price has no change before it, so it takes 4 more
+        # before there's a whole sequence to sell at. If this sequence occurs
+        # earlier, the monkey would have already made a sale and wouldn't make
+        # another one, so we skip it.
+        if i < 4 or window in seen:
+            continue
+        seen.add(window)
+        windows.append(window)
+        prices.append(offer_prices[i])
+    return windows, bytes(prices)
+
+
+def find_sales_for_secret(secret: int) -> BuyerSales:
+    """
+    Evolves a buyer's initial secret number and finds the sales it would make
+    (see find_buyer_sales).
+    """
+    return find_buyer_sales(make_sequence(secret, steps=2000))
+
+
+def find_best_sale(sequences: list[list[int]]) -> tuple[PriceChanges, int]:
     """
     Finds the sequence of 4 consecutive price changes that would result in the
     highest total banana sales across all monkeys, given a list of sequences of
     secret numbers for each monkey. Returns the sequence of price changes and
     the resulting total sales.
     """
-    offer_prices = [[secret % 10 for secret in sequence] for sequence in sequences]
-    # For each offer price in a sequence, calculate the change between it and
-    # the previous offer price. The first offer price in the sequence doesn't
-    # have a previous offer price to compare to, so we omit it from the list.
-    price_changes = [
-        [current - previous for previous, current in zip(prices, prices[1:])]
-        for prices in offer_prices
-    ]
+    return find_best_total_sale([find_buyer_sales(sequence) for sequence in sequences])
+
 
+def find_best_total_sale(
+    sales_per_buyer: list[BuyerSales],
+) -> tuple[PriceChanges, int]:
+    """
+    Adds up the sales every buyer would make for each sequence of 4 price
+    changes, and returns the sequence with the most sales in total, along with
+    those sales.
+    """
     # Keep track of the total sales that can be made for each sequence of 4
-    # price changes across all monkeys.
-    sales: dict[tuple[int, int, int, int], int] = defaultdict(int)
-
-    # For a given buyer, calculate the sales that can be made based on the
-    # offer prices and price changes at each step in the sequence.
-    for offer_prices, changes in zip(offer_prices, price_changes):
-        # Keep track of the sequences of 4 price changes that we've already
-        # seen; once a hiding spot is sold, the monkey will move on.
-        sequences_encountered: set[tuple[int, int, int, int]] = set()
-        # For every 4 consecutive price changes...
-        for i in range(len(changes) - 3):
-            # Identify the 4-tuple that would instruct the monkey to make a sale
-            # on the 4th step.
-            sequence = (changes[i], changes[i + 1], changes[i + 2], changes[i + 3])
-            # If this sequence occurs earlier, the monkey would have already
-            # made a sale and wouldn't make another one, so we skip it.
-            if sequence in sequences_encountered:
-                continue
-            # Otherwise, mark this sequence.
-            sequences_encountered.add(sequence)
-            # Check the price at the end of it. The price is offset by 4 steps
-            # due to the changes being calculated from the second price onwards.
-            price = offer_prices[i + 4]
-            # Increment the total sales for this unique sequence.
-            sales[sequence] += price
+    # price changes across all monkeys, by its packed window.
+    sales = [0] * WINDOWS
+    for windows, prices in sales_per_buyer:
+        for window, price in zip(windows, prices):
+            sales[window] += price
 
     # Find the sequence of price changes that would result in the most sales.
-    best_sequence = (0, 0, 0, 0)
-    max = 0
-    for sequence, sale in sales.items():
-        if sale > max:
-            max = sale
-            best_sequence = sequence
-    return best_sequence, max
-
-
-with open("test.txt", "r") as f:
-    initial_secrets = parse_initial_secrets(f)
-    secret_sequences = [make_sequence(secret, steps=2000) for secret in initial_secrets]
-    total = sum(sequence[-1] for sequence in secret_sequences)
-    assert total == 37327623, f"Expected 37327623, but got {total}"
-
-
-# Part 2
-with open("test2.txt", "r") as f:
-    test_sequences = [make_sequence(123, steps=10)]
-    test_sequence, test_sales = find_best_sale(test_sequences)
-    assert test_sales == 6, f"Expected 6, but got {test_sales}"
-    assert test_sequence == (
-        -1,
-        -1,
-        0,
-        2,
-    ), f"Expected (-1,-1,0,2), but got {test_sequence}"
-
-    initial_secrets = parse_initial_secrets(f)
-    secret_sequences = [make_sequence(secret, steps=2000) for secret in initial_secrets]
-    sell_sequence, total_sales = find_best_sale(secret_sequences)
-    assert total_sales == 23, f"Expected 23, but got {total_sales}"
-    assert sell_sequence == (
-        -2,
-        1,
-        -1,
-        3,
-    ), f"Expected (-2,1,-1,3), but got {sell_sequence}"
-
-print("All tests passed.")
-
-with open("input.txt", "r") as f:
-    initial_secrets = parse_initial_secrets(f)
-    secrets_for_buyers = [
-        make_sequence(secret, steps=2000) for secret in initial_secrets
-    ]
-    total = sum(secrets[-1] for secrets in secrets_for_buyers)
-    print("Part 1:", total)
+    best_window = max(range(WINDOWS), key=sales.__getitem__)
+    if not sales[best_window]:
+        return (0, 0, 0, 0), 0
+    return unpack_window(best_window), sales[best_window]
+
+
+def parse(text: Source) -> list[int]:
+    return parse_initial_secrets(text)
+
+
+def find_final_secret(secret: int) -> int:
+    return make_sequence(secret, steps=2000)[-1]
+
+
+# Every buyer's secret numbers evolve on their own, so the buyers can be
+# worked through in parallel (see aoc.executor).
+def part1(initial_secrets: list[int]) -> int:
+    return sum(parallel_map(find_final_secret, initial_secrets))
+
+
+def part2(initial_secrets: list[int]) -> int:
+    # Only each buyer's sales are sent back, not their 2001 secret numbers.
+    sales_per_buyer = parallel_map(find_sales_for_secret, initial_secrets)
+    _, total_sales = find_best_total_sale(sales_per_buyer)
+    return total_sales
+
+
+def check_examples() -> None:
+    with map_input("test.txt") as data:
+        initial_secrets = parse_initial_secrets(data)
+        total = part1(initial_secrets)
+        assert total == 37327623, f"Expected 37327623, but got {total}"
 
     # Part 2
-    sell_sequence, total_sales = find_best_sale(secrets_for_buyers)
-    print("Part 2:", total_sales)
+    with map_input("test2.txt") as data:
+        test_sequences = [make_sequence(123, steps=10)]
+        test_sequence, test_sales = find_best_sale(test_sequences)
+        assert test_sales == 6, f"Expected 6, but got {test_sales}"
+        assert test_sequence == (
+            -1,
+            -1,
+            0,
+            2,
+        ), f"Expected (-1,-1,0,2), but got {test_sequence}"
+
+        initial_secrets = parse_initial_secrets(data)
+        secret_sequences = [
+            make_sequence(secret, steps=2000) for secret in initial_secrets
+        ]
+        sell_sequence, total_sales = find_best_sale(secret_sequences)
+        assert total_sales == 23, f"Expected 23, but got {total_sales}"
+        assert sell_sequence == (
+            -2,
+            1,
+            -1,
+            3,
+        ), f"Expected (-2,1,-1,3), but got {sell_sequence}"
+
+
+if __name__ == "__main__":
+    check_examples()
+    print("All tests passed.")
+
+    with map_input("input.txt") as data:
+        initial_secrets = parse(data)
+        print("Part 1:", part1(initial_secrets))
+
+        # Part 2
+        print("Part 2:", part2(initial_secrets))
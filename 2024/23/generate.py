@@ -0,0 +1,34 @@
+import itertools
+import random
+import string
+
+# The real input has 3,380 connections.
+REAL_SIZE = 3380
+
+CLIQUE_SIZE = 13
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate `size` connections between computers, like `kh-tc`. Like the real
+    input, every computer has 13 connections on average, and there's a planted
+    LAN party of 13 computers that are all connected to each other.
+    """
+    rng = random.Random(seed)
+    names = [
+        "".join(pair) for pair in itertools.product(string.ascii_lowercase, repeat=2)
+    ]
+    computer_count = min(max(size * 2 // CLIQUE_SIZE, CLIQUE_SIZE + 1), len(names))
+    computers = rng.sample(names, computer_count)
+
+    connections: set[tuple[str, str]] = set()
+    for c1, c2 in itertools.combinations(computers[:CLIQUE_SIZE], 2):
+        connections.add((c1, c2))
+    while len(connections) < size:
+        c1, c2 = rng.sample(computers, 2)
+        if (c2, c1) not in connections:
+            connections.add((c1, c2))
+
+    lines = [f"{c1}-{c2}\n" for c1, c2 in connections]
+    rng.shuffle(lines)
+    return "".join(lines)
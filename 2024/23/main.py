@@ -1,5 +1,6 @@
 from typing import TextIO, cast
 from collections import defaultdict
+import io
 
 
 def build_network(file: TextIO) -> dict[str, set[str]]:
@@ -49,14 +50,17 @@ def find_largest_group(network: dict[str, set[str]]) -> tuple[str, ...]:
     # Starting with each node forming a group of size 1, look for the largest
     # group that we can form with connections of that node.
     for node in network:
-        groups = find_groups(node, set([node]), set())
+        groups = find_groups(network, node, set([node]), set())
         all_groups.update(groups)
 
     return max(all_groups, key=len)
 
 
 def find_groups(
-    node: str, current_group: set[str], groups: set[tuple[str, ...]]
+    network: dict[str, set[str]],
+    node: str,
+    current_group: set[str],
+    groups: set[tuple[str, ...]],
 ) -> set[tuple[str, ...]]:
     """
     Recursively find all groups that can be formed with the connections of a
@@ -78,7 +82,7 @@ def find_groups(
                 # ...add it to the set of groups and continue checking if we can
                 # expand it even further.
                 groups.add(new_group_tuple)
-                find_groups(connection, new_group, groups)
+                find_groups(network, connection, new_group, groups)
 
     return groups
 
@@ -87,29 +91,44 @@ def build_password(group: tuple[str, ...]) -> str:
     return ",".join(sorted(group))
 
 
-with open("test.txt", "r") as file:
-    network = build_network(file)
-    groups_of_three = find_groups_of_three(network)
-    assert (
-        len(groups_of_three) == 7
-    ), f"Expected 7 groups, but got {len(groups_of_three)}"
+def parse(text: str) -> dict[str, set[str]]:
+    return build_network(io.StringIO(text))
 
-    largest_group = find_largest_group(network)
-    assert (
-        len(largest_group) == 4
-    ), f"Expected 4 computers in the largest group, but got {len(largest_group)}"
 
-    password = build_password(largest_group)
-    assert password == "co,de,ka,ta", f"Expected 'co,de,ka,ta', but got '{password}'"
+def part1(network: dict[str, set[str]]) -> int:
+    return len(find_groups_of_three(network))
 
-print("All tests passed.")
 
-with open("input.txt", "r") as file:
-    network = build_network(file)
-    groups_of_three = find_groups_of_three(network)
-    print("Part 1:", len(groups_of_three))
+def part2(network: dict[str, set[str]]) -> str:
+    return build_password(find_largest_group(network))
 
-    # Part 2
-    largest_group = find_largest_group(network)
-    password = build_password(largest_group)
-    print("Part 2:", password)
+
+def check_examples() -> None:
+    with open("test.txt", "r") as file:
+        network = build_network(file)
+        groups_of_three = find_groups_of_three(network)
+        assert (
+            len(groups_of_three) == 7
+        ), f"Expected 7 groups, but got {len(groups_of_three)}"
+
+        largest_group = find_largest_group(network)
+        assert (
+            len(largest_group) == 4
+        ), f"Expected 4 computers in the largest group, but got {len(largest_group)}"
+
+        password = build_password(largest_group)
+        assert (
+            password == "co,de,ka,ta"
+        ), f"Expected 'co,de,ka,ta', but got '{password}'"
+
+
+if __name__ == "__main__":
+    check_examples()
+    print("All tests passed.")
+
+    with open("input.txt", "r") as file:
+        network = parse(file.read())
+        print("Part 1:", part1(network))
+
+        # Part 2
+        print("Part 2:", part2(network))
@@ -0,0 +1,24 @@
+import random
+
+# The real input has 500 schematics.
+REAL_SIZE = 500
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate `size` lock and key schematics, roughly half of each. Each one is
+    a 5x7 block of `#` and `.`, followed by a blank line (including the last,
+    which the parser relies on).
+    """
+    rng = random.Random(seed)
+    schematics: list[str] = []
+    for _ in range(size):
+        heights = [rng.randint(0, 5) for _ in range(5)]
+        is_lock = rng.random() < 0.5
+        rows: list[str] = []
+        for row in range(7):
+            # Locks are filled from the top down, keys from the bottom up.
+            level = row if is_lock else 6 - row
+            rows.append("".join("#" if level <= height else "." for height in heights))
+        schematics.append("\n".join(rows) + "\n\n")
+    return "".join(schematics)
@@ -1,4 +1,5 @@
 from typing import TextIO, Literal
+import io
 
 type Key = tuple[int, int, int, int, int]
 type Lock = tuple[int, int, int, int, int]
@@ -74,18 +75,25 @@ def try_pair(lock: Lock, key: Key) -> bool:
     return all(lock[i] + key[i] <= 5 for i in range(5))
 
 
-with open("test.txt", "r") as f:
-    locks, keys = parse_locks_and_keys(f)
-    print(locks)
-    print(keys)
-    possible_pairs = try_pairs(locks, keys)
-    assert possible_pairs == 3, f"Expected 3 but got {possible_pairs}"
+def parse(text: str) -> tuple[list[Lock], list[Key]]:
+    return parse_locks_and_keys(io.StringIO(text))
 
-print("All tests passed!")
 
-with open("input.txt", "r") as f:
-    locks, keys = parse_locks_and_keys(f)
-    print(len(locks))
-    print(len(keys))
-    possible_pairs = try_pairs(locks, keys)
-    print("Part 1:", possible_pairs)
+def part1(locks_and_keys: tuple[list[Lock], list[Key]]) -> int:
+    return try_pairs(*locks_and_keys)
+
+
+def check_examples() -> None:
+    with open("test.txt", "r") as f:
+        locks, keys = parse_locks_and_keys(f)
+        possible_pairs = try_pairs(locks, keys)
+        assert possible_pairs == 3, f"Expected 3 but got {possible_pairs}"
+
+
+if __name__ == "__main__":
+    check_examples()
+    print("All tests passed!")
+
+    with open("input.txt", "r") as f:
+        locks_and_keys = parse(f.read())
+        print("Part 1:", part1(locks_and_keys))
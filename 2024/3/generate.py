@@ -0,0 +1,43 @@
+import random
+
+# The real input is around 18,000 characters of corrupted memory.
+REAL_SIZE = 18000
+
+JUNK = "!@#$%^&*()[]{}<>+-_=,;:'who select from where why how what"
+TOKENS = ("mul", "do", "don't")
+
+
+def generate_token(rng: random.Random) -> str:
+    kind = rng.choices(TOKENS, weights=(8, 1, 1))[0]
+    if kind == "do":
+        return "do()"
+    if kind == "don't":
+        return "don't()"
+    # Some multiplications are subtly corrupted so that they don't count.
+    first, second = rng.randint(1, 999), rng.randint(1, 999)
+    if rng.random() < 0.2:
+        return rng.choice(
+            (f"mul({first} ,{second})", f"mul[{first},{second}]", f"mul({first},)")
+        )
+    return f"mul({first},{second})"
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate roughly `size` characters of corrupted memory: `mul(a,b)`, `do()`
+    and `don't()` instructions interspersed with junk, split over a handful of
+    lines like the real input.
+    """
+    rng = random.Random(seed)
+    chunks: list[str] = []
+    length = 0
+    while length < size:
+        junk = "".join(rng.choices(JUNK, k=rng.randint(0, 12)))
+        token = generate_token(rng)
+        chunks.append(junk + token)
+        length += len(junk) + len(token)
+
+    text = "".join(chunks)
+    line_length = max(size // 6, 1)
+    lines = [text[i : i + line_length] for i in range(0, len(text), line_length)]
+    return "\n".join(lines) + "\n"
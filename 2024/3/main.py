@@ -1,68 +1,130 @@
-from typing import TextIO
+import functools
 import re
+import sys
+from collections.abc import Iterable, Iterator
+from pathlib import Path
 
+from aoc.reader import CHUNK_SIZE, Source
 
-def read_file(file: TextIO) -> str:
-    # Replace all newlines with a space.
-    return file.read().strip().lower().replace("\n", " ")
+# Every instruction, in one pattern so they're all found in a single scan. The
+# program is lowercased first, so this matches "MUL(2,4)" and "Don't()" too.
+# Numbers are 1-3 digits long.
+INSTRUCTION_PATTERN = re.compile(
+    rb"mul\((?P<first>\d{1,3}),(?P<second>\d{1,3})\)|(?P<do>do\(\))|don't\(\)"
+)
+# The start of an instruction, running up to the end of a chunk, which may be
+# finished in the next one.
+PARTIAL_INSTRUCTION_PATTERN = re.compile(
+    rb"(?:m(?:u(?:l(?:\((?:\d{1,3}(?:,\d{0,3})?)?)?)?)?"
+    rb"|d(?:o(?:\(|n(?:'(?:t\(?)?)?)?)?)\Z"
+)
 
+# The sum of every multiplication, and of the enabled ones.
+type Totals = tuple[int, int]
 
-def find_mul_instructions(program: str) -> list[tuple[int, int]]:
-    # Regex to match "mul(#,#)" where each number is a named capture group
-    mul_regex = re.compile(r"mul\((?P<first>\d+),(?P<second>\d+)\)")
-    matches = mul_regex.findall(program)
-    return [(int(first), int(second)) for first, second in matches]
 
+class ProgramScanner:
+    # Whether the multiplications are enabled, as of the end of the last chunk.
+    enabled: bool
+    total: int
+    enabled_total: int
+    # The end of the last chunk, if it might be the start of an instruction.
+    tail: bytes
 
-def find_enabled_instructions(program: str) -> list[str]:
-    enabled_instructions: list[str] = []
-    # The beginning of the program is enabled, so we take any instructions up
-    # until the first "don't()".
-    enabled_instructions.append(program[: program.find("don't()")])
-    rest = program[program.find("don't()") :]
-    # Any other enabled instructions are those that are after a "do()" and
-    # before another "don't()", or the end of the program.
-    do_regex = re.compile(r"do\(\)(?P<instruction>.+?)(?:don't\(\)|$)")
-    enabled_instructions.extend(do_regex.findall(rest))
-    return enabled_instructions
+    def __init__(self) -> None:
+        self.enabled = True
+        self.total = 0
+        self.enabled_total = 0
+        self.tail = b""
 
+    def feed(self, chunk: bytes) -> None:
+        data = self.tail + chunk.lower()
+        end = 0
+        for match in INSTRUCTION_PATTERN.finditer(data):
+            first, second, do = match.group("first", "second", "do")
+            if first is not None:
+                product = int(first) * int(second)
+                self.total += product
+                if self.enabled:
+                    self.enabled_total += product
+            else:
+                self.enabled = do is not None
+            end = match.end()
+        # Only an unfinished instruction is carried over, so all that's held
+        # on to between chunks is at most one instruction's worth.
+        partial = PARTIAL_INSTRUCTION_PATTERN.search(data, end)
+        self.tail = data[partial.start() :] if partial else b""
 
-def sum_instructions(instructions: list[tuple[int, int]]) -> int:
-    return sum(first * second for first, second in instructions)
+    def totals(self) -> Totals:
+        return self.total, self.enabled_total
 
 
-with open("test.txt", "r") as file:
-    program = read_file(file)
-    instructions = find_mul_instructions(program)
-    print("instructions:", instructions)
-    total = sum_instructions(instructions)
+def scan_program(chunks: Iterable[bytes]) -> Totals:
+    """
+    Add up the multiplications in a program that comes in pieces, cut anywhere,
+    in one pass over it.
+    """
+    scanner = ProgramScanner()
+    for chunk in chunks:
+        scanner.feed(chunk)
+    return scanner.totals()
+
+
+def source_chunks(source: Source, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    data = memoryview(source.encode() if isinstance(source, str) else source)
+    for start in range(0, len(data), chunk_size):
+        yield bytes(data[start : start + chunk_size])
+
+
+# The program is scanned by the parts themselves, so that the time it takes
+# is put down to them rather than to parsing.
+def parse(text: Source) -> bytes:
+    return text.encode() if isinstance(text, str) else bytes(text)
+
+
+def part1(program: bytes) -> int:
+    total, _ = scan_program(source_chunks(program))
+    return total
+
+
+def part2(program: bytes) -> int:
+    _, enabled_total = scan_program(source_chunks(program))
+    return enabled_total
+
+
+def solve_file(path: str | Path, chunk_size: int = CHUNK_SIZE) -> Totals:
+    """
+    Add up the multiplications in the program in the file at `path`, reading
+    it `chunk_size` bytes at a time. Unlike `file_chunks`, which waits for the
+    end of a line, this holds no more than a chunk however long the lines are.
+    """
+    with open(path, "rb") as file:
+        return scan_program(iter(functools.partial(file.read, chunk_size), b""))
+
+
+def check_examples() -> None:
+    total, enabled_total = solve_file("test.txt")
     assert total == 161, f"Expected 161, but got {total}"
     # Part 2
-    enabled_instructions = find_enabled_instructions(program)
-    total = sum_instructions(
-        [
-            instr
-            for sublist in enabled_instructions
-            for instr in find_mul_instructions(sublist)
-        ]
-    )
-    assert total == 48, f"Expected 48, but got {total}"
-
-print("All tests passed!")
-
-with open("input.txt", "r") as file:
-    program = read_file(file)
-    instructions = find_mul_instructions(program)
-    total = sum_instructions(instructions)
+    assert enabled_total == 48, f"Expected 48, but got {enabled_total}"
+
+    # Instructions cut in two by the end of a chunk still count.
+    program = Path("test.txt").read_bytes()
+    for chunk_size in (1, 2, 3, 7):
+        totals = scan_program(source_chunks(program, chunk_size))
+        assert totals == (161, 48), f"Expected (161, 48), but got {totals}"
+
+    # Numbers longer than three digits don't make an instruction.
+    totals = scan_program([b"mul(1234,5)mul(2,3)mul(4,5678)"])
+    assert totals == (6, 6), f"Expected (6, 6), but got {totals}"
+
+
+if __name__ == "__main__":
+    check_examples()
+    print("All tests passed!")
+
+    total, enabled_total = solve_file(sys.argv[1] if len(sys.argv) > 1 else "input.txt")
     print("Part 1:", total)
 
     # Part 2
-    enabled_instructions = find_enabled_instructions(program)
-    total = sum_instructions(
-        [
-            instr
-            for sublist in enabled_instructions
-            for instr in find_mul_instructions(sublist)
-        ]
-    )
-    print("Part 2:", total)
+    print("Part 2:", enabled_total)
@@ -0,0 +1,16 @@
+import math
+import random
+
+# The real input is a 140x140 word search.
+REAL_SIZE = 140 * 140
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate a square word search of roughly `size` cells, made up only of the
+    letters X, M, A and S so that there are plenty of matches in every
+    direction.
+    """
+    rng = random.Random(seed)
+    side = max(math.isqrt(size), 4)
+    return "".join("".join(rng.choices("XMAS", k=side)) + "\n" for _ in range(side))
@@ -0,0 +1,35 @@
+import random
+
+# The real input has around 200 updates.
+REAL_SIZE = 200
+
+# Like the real input, there are 49 distinct pages, with an ordering rule for
+# every pair of them.
+PAGE_COUNT = 49
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate the page ordering rules followed by `size` updates. The rules are
+    derived from a random total order of the pages (listed in shuffled order),
+    and each update is an odd-length sample of pages, which is in the correct
+    order about half the time.
+    """
+    rng = random.Random(seed)
+    pages = rng.sample(range(10, 100), PAGE_COUNT)
+    rules = [
+        f"{before}|{after}"
+        for i, before in enumerate(pages)
+        for after in pages[i + 1 :]
+    ]
+    rng.shuffle(rules)
+
+    updates: list[str] = []
+    for _ in range(size):
+        length = rng.choice(range(5, 24, 2))
+        update = sorted(rng.sample(range(PAGE_COUNT), length))
+        if rng.random() < 0.5:
+            rng.shuffle(update)
+        updates.append(",".join(str(pages[index]) for index in update))
+
+    return "\n".join(rules) + "\n\n" + "\n".join(updates) + "\n"
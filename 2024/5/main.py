@@ -1,4 +1,5 @@
 from typing import TextIO, TypedDict, NotRequired
+import io
 
 # Read out the ordering rules and the updates from the file.
 type OrderingRule = tuple[int, int]
@@ -102,6 +103,7 @@ def run_test(rules: list[OrderingRule], test_case: TestCase) -> None:
         test_case.get("fixed"),
     )
 
+    order = build_before_lookup(rules)
     is_valid = validate_update(update, order)
 
     assert (
@@ -116,42 +118,49 @@ def run_test(rules: list[OrderingRule], test_case: TestCase) -> None:
     ), f"Failed to fix {update}: expected {fixed}, but got {fix_update(update, order)}"
 
 
-with open("test.txt", "r") as file:
-    ordering_rules, updates = parse_file(file)
-    order = build_before_lookup(ordering_rules)
+def parse(text: str) -> tuple[list[OrderingRule], list[Update]]:
+    return parse_file(io.StringIO(text))
 
-    for test_case in test_updates:
-        run_test(ordering_rules, test_case)
 
-    middle_pages = [
+def part1(parsed: tuple[list[OrderingRule], list[Update]]) -> int:
+    ordering_rules, updates = parsed
+    order = build_before_lookup(ordering_rules)
+    return sum(
         get_middle_page(update) for update in updates if validate_update(update, order)
-    ]
-    result = sum(middle_pages)
-    assert result == 143, f"Expected 143, but got {result}"
+    )
+
 
-    fixed_middle_pages = [
+def part2(parsed: tuple[list[OrderingRule], list[Update]]) -> int:
+    ordering_rules, updates = parsed
+    order = build_before_lookup(ordering_rules)
+    return sum(
         get_middle_page(fix_update(update, order))
         for update in updates
         if not validate_update(update, order)
-    ]
-    result = sum(fixed_middle_pages)
-    assert result == 123, f"Expected 123, but got {result}"
+    )
 
-print("All tests passed!")
 
-with open("input.txt", "r") as file:
-    ordering_rules, updates = parse_file(file)
-    order = build_before_lookup(ordering_rules)
+def check_examples() -> None:
+    with open("test.txt", "r") as file:
+        ordering_rules, updates = parse_file(file)
 
-    middle_pages = [
-        get_middle_page(update) for update in updates if validate_update(update, order)
-    ]
-    print("Part 1:", sum(middle_pages))
+        for test_case in test_updates:
+            run_test(ordering_rules, test_case)
 
-    # Part 2
-    fixed_middle_pages = [
-        get_middle_page(fix_update(update, order))
-        for update in updates
-        if not validate_update(update, order)
-    ]
-    print("Part 2:", sum(fixed_middle_pages))
+        result = part1((ordering_rules, updates))
+        assert result == 143, f"Expected 143, but got {result}"
+
+        result = part2((ordering_rules, updates))
+        assert result == 123, f"Expected 123, but got {result}"
+
+
+if __name__ == "__main__":
+    check_examples()
+    print("All tests passed!")
+
+    with open("input.txt", "r") as file:
+        parsed = parse(file.read())
+        print("Part 1:", part1(parsed))
+
+        # Part 2
+        print("Part 2:", part2(parsed))
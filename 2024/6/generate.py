@@ -0,0 +1,93 @@
+import math
+import random
+
+# The real input is a 130x130 map.
+REAL_SIZE = 130 * 130
+
+# Around 1 in 60 tiles in the real map is an obstacle.
+DENSITY = 0.017
+
+# How far past the rest of her patrol each straight stretch of it can go.
+MAX_MARGIN = 3
+
+# Turning right, from each direction the guard can face.
+RIGHT = {(-1, 0): (0, 1), (0, 1): (1, 0), (1, 0): (0, -1), (0, -1): (-1, 0)}
+
+
+def patrol(
+    obstacles: set[tuple[int, int]], side: int, start: tuple[int, int]
+) -> set[tuple[int, int]] | None:
+    """
+    The tiles the guard visits on her way off the map, starting facing up, or
+    None if she never leaves it.
+    """
+    (row, col), direction = start, (-1, 0)
+    seen: set[tuple[tuple[int, int], tuple[int, int]]] = set()
+    while ((row, col), direction) not in seen:
+        seen.add(((row, col), direction))
+        ahead = (row + direction[0], col + direction[1])
+        if not (0 <= ahead[0] < side and 0 <= ahead[1] < side):
+            return {position for position, _ in seen}
+        if ahead in obstacles:
+            direction = RIGHT[direction]
+        else:
+            row, col = ahead
+    return None
+
+
+def plan_patrol(
+    rng: random.Random, side: int, start: tuple[int, int]
+) -> set[tuple[int, int]]:
+    """
+    Place obstacles that turn the guard right, so that she spirals out from
+    `start` until she reaches the edge of the map and walks off it.
+
+    Each straight stretch goes a random margin past every tile she's visited
+    and every obstacle so far before it meets its own, so she never walks onto
+    either again and can't loop.
+    """
+    obstacles: set[tuple[int, int]] = set()
+    (row, col), direction = start, (-1, 0)
+    top, bottom, left, right = row, row, col, col
+    while True:
+        dr, dc = direction
+        margin = rng.randint(1, MAX_MARGIN)
+        if dr:
+            row = top - margin if dr < 0 else bottom + margin
+        else:
+            col = left - margin if dc < 0 else right + margin
+        obstacle = (row + dr, col + dc)
+        if not (0 <= obstacle[0] < side and 0 <= obstacle[1] < side):
+            return obstacles
+        obstacles.add(obstacle)
+        top, bottom = min(top, obstacle[0]), max(bottom, obstacle[0])
+        left, right = min(left, obstacle[1]), max(right, obstacle[1])
+        direction = RIGHT[direction]
+
+
+def generate(size: int, seed: int = 0, density: float = DENSITY) -> str:
+    """
+    Generate a square map of roughly `size` tiles, where the guard starts
+    facing up from near the middle and patrols most of the map before walking
+    off it (see plan_patrol). Tiles off her patrol are obstacles (`#`) with the
+    given probability, which doesn't change where she goes.
+    """
+    rng = random.Random(seed)
+    side = max(math.isqrt(size), 3)
+    start = (
+        rng.randrange(2 * side // 5, side - 2 * side // 5),
+        rng.randrange(2 * side // 5, side - 2 * side // 5),
+    )
+    obstacles = plan_patrol(rng, side, start)
+    visited = patrol(obstacles, side, start)
+    assert visited is not None, "The planned patrol loops"
+
+    map = [["." for _ in range(side)] for _ in range(side)]
+    for row in range(side):
+        for col in range(side):
+            if (row, col) in obstacles or (
+                (row, col) not in visited and rng.random() < density
+            ):
+                map[row][col] = "#"
+    map[start[0]][start[1]] = "^"
+    return "".join("".join(row) + "\n" for row in map)
@@ -1,20 +1,23 @@
 from typing import TextIO
-from concurrent.futures import ProcessPoolExecutor, as_completed, Future
-import copy
 
-type Map = list[list[str]]
+from aoc.executor import parallel_map
+from aoc.grid import Grid
+from aoc.instrument import profiled
 
+type Map = Grid
 
-def parse_map(file: TextIO) -> Map:
-    return [list(line.strip()) for line in file]
+# The character surrounding the map when we pad it, so that the guard walking
+# off the edge shows up as her stepping onto this rather than needing a bounds
+# check on every step.
+OFF_MAP = " "
 
 
-def find_guard(map: Map) -> tuple[int, int]:
-    return next((row, line.index("^")) for row, line in enumerate(map) if "^" in line)
+def parse_map(file: TextIO) -> Map:
+    return Grid.from_text(file.read())
 
 
-def is_in_bounds(map: Map, row: int, col: int) -> bool:
-    return 0 <= row < len(map) and 0 <= col < len(map[0])
+def find_guard(map: Map) -> tuple[int, int]:
+    return map.find("^")
 
 
 class Direction:
@@ -83,17 +86,20 @@ def count_unique(path: PathWithDirection) -> int:
     return len(set(pos for pos, _ in path))
 
 
-def walk_path(
-    map: Map,
-    initial_position: tuple[int, int],
-    # Part 2: If provided, will artificially introduce an obstacle at the given
-    # row and column.
-    obstacle_position: tuple[int, int] | None = None,
-) -> PathWithDirection | None:
+def pad_map(map: Map) -> Map:
+    """
+    A copy of the map with OFF_MAP all the way around it, for walk_path.
+    """
+    return map.padded(OFF_MAP)
+
+
+@profiled
+def walk_path(map: Map, initial_position: tuple[int, int]) -> PathWithDirection | None:
     """
-    Walk the full path of the guard, starting at the given row and column.
-    Returns a set representation of every square visited by the guard, or None
-    if the guard would end up in a cycle (Part 2).
+    Walk the full path of the guard, starting at the given row and column, on a
+    map that's already padded (see pad_map). Returns a set representation of
+    every square visited by the guard, or None if the guard would end up in a
+    cycle (Part 2).
     """
     # Track the squares visited by the guard, along with the direction the guard
     # was walking in when she visited that square (Part 2).
@@ -113,13 +119,13 @@ def walk_path(
         curr_row, curr_col = curr_position
         dr, dc = direction.forward
         new_row, new_col = curr_row + dr, curr_col + dc
+        cell = map[new_row, new_col]
         # If the guard would walk off the map, we're done.
-        if not is_in_bounds(map, new_row, new_col):
+        if cell == OFF_MAP:
             return visited_with_direction
 
-        # If the guard would hit an obstacle, real or simulated (for Part 2),
-        # turn right 90 degrees.
-        if map[new_row][new_col] == "#" or (new_row, new_col) == obstacle_position:
+        # If the guard would hit an obstacle, turn right 90 degrees.
+        if cell == "#":
             direction = direction.right
             continue
 
@@ -127,17 +133,24 @@ def walk_path(
         curr_position = (new_row, new_col)
 
 
-def walk_path_and_return_obstacle(
-    map: Map,
-    initial_position: tuple[int, int],
+def obstacle_causes_cycle(
+    start: tuple[Map, tuple[int, int]],
     obstacle_position: tuple[int, int],
-):
+) -> bool:
     """
-    Small wrapper around walk_path which returns the obstacle position if the
-    guard would get stuck in a cycle due to it.
+    Small wrapper around walk_path which checks whether the guard, starting from
+    the given (padded) map and initial position, would get stuck in a cycle due
+    to an obstacle at the given position.
     """
-    path = walk_path(map, initial_position, obstacle_position)
-    return obstacle_position if path is None else None
+    map, initial_position = start
+    # The obstacle is put on the map for this walk, and taken away again after,
+    # rather than walking a copy of the map with it on.
+    previous = map[obstacle_position]
+    map[obstacle_position] = "#"
+    try:
+        return walk_path(map, initial_position) is None
+    finally:
+        map[obstacle_position] = previous
 
 
 def find_obstacle_points(
@@ -145,32 +158,51 @@ def find_obstacle_points(
 ) -> set[tuple[int, int]]:
     """
     Find the number of points where the guard would hit an obstacle if she
-    continued walking in the same direction.
+    continued walking in the same direction. The map is padded (see pad_map),
+    and each check borrows it for its obstacle.
     """
-    # Use a ProcessPoolExecutor to parallelize the computation, since each check
-    # is independent of the others.
-    with ProcessPoolExecutor() as executor:
-        futures: list[Future] = []
-        for (row, col), direction in path:
-            dr, dc = direction.forward
-            obstacle_row, obstacle_col = row + dr, col + dc
-            if not is_in_bounds(map, obstacle_row, obstacle_col):
-                continue
-            futures.append(
-                executor.submit(
-                    walk_path_and_return_obstacle,
-                    copy.deepcopy(map),
-                    initial_position,
-                    (obstacle_row, obstacle_col),
-                )
-            )
-
-    return set([f.result() for f in as_completed(futures) if f.result() is not None])
+    # The guard passes some squares more than once, so collect the candidate
+    # obstacles first to only check each of them once.
+    candidates: set[tuple[int, int]] = set()
+    for (row, col), direction in path:
+        dr, dc = direction.forward
+        obstacle_position = (row + dr, col + dc)
+        if map.in_bounds(obstacle_position):
+            candidates.add(obstacle_position)
 
+    # Each check is independent of the others, so they can run in parallel
+    # (see aoc.executor). Every check walks the same map from the same place,
+    # which is shared with each worker once rather than sent or copied for
+    # every check.
+    obstacles = sorted(candidates)
+    causes_cycle = parallel_map(
+        obstacle_causes_cycle, obstacles, shared=(map, initial_position)
+    )
+    return {obstacle for obstacle, cycle in zip(obstacles, causes_cycle) if cycle}
 
-if __name__ == "__main__":
+
+def parse(text: str) -> Map:
+    return Grid.from_text(text)
+
+
+def part1(map: Map) -> int:
+    path = walk_path(pad_map(map), find_guard(map))
+    assert path is not None, "Expected a path, but got None"
+    return count_unique(path)
+
+
+def part2(map: Map) -> int:
+    guard_position = find_guard(map)
+    # Padded once, and walked by every check.
+    padded = pad_map(map)
+    path = walk_path(padded, guard_position)
+    assert path is not None, "Expected a path, but got None"
+    return len(find_obstacle_points(padded, guard_position, path))
+
+
+def check_examples() -> None:
     with open("test.txt", "r") as file:
-        map = parse_map(file)
+        map = pad_map(parse_map(file))
 
         guard_position = find_guard(map)
         assert guard_position == (
@@ -188,15 +220,14 @@ if __name__ == "__main__":
         obstacles = find_obstacle_points(map, guard_position, path)
         assert obstacles == set([(6, 3), (7, 6), (7, 7), (8, 1), (8, 3), (9, 7)])
 
+
+if __name__ == "__main__":
+    check_examples()
     print("All tests passed!")
 
     with open("input.txt", "r") as file:
-        map = parse_map(file)
-        guard_position = find_guard(map)
-        path = walk_path(map, guard_position)
-        assert path is not None, "Expected a path, but got None"
-        print("Part 1:", count_unique(path))
+        map = parse(file.read())
+        print("Part 1:", part1(map))
 
         # Part 2:
-        obstacles = find_obstacle_points(map, guard_position, path)
-        print("Part 2:", len(obstacles))
+        print("Part 2:", part2(map))
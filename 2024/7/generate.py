@@ -0,0 +1,32 @@
+import random
+
+# The real input has 850 equations.
+REAL_SIZE = 850
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate `size` calibration equations. Roughly two thirds of them have test
+    values that are reachable by combining the values with a random mix of `+`,
+    `*` and `||`; the rest have random test values which almost never are.
+    """
+    rng = random.Random(seed)
+    lines: list[str] = []
+    for _ in range(size):
+        values = [
+            rng.randint(1, rng.choice((9, 99, 999))) for _ in range(rng.randint(3, 12))
+        ]
+        if rng.random() < 2 / 3:
+            total = values[0]
+            for value in values[1:]:
+                op = rng.choice("+*|")
+                if op == "+":
+                    total += value
+                elif op == "*":
+                    total *= value
+                else:
+                    total = int(f"{total}{value}")
+        else:
+            total = rng.randint(1, 10**12)
+        lines.append(f"{total}: {' '.join(map(str, values))}\n")
+    return "".join(lines)
@@ -1,28 +1,36 @@
-from typing import TypedDict, TextIO, Callable
+import operator
+from typing import TypedDict, Callable
+
+from aoc.executor import parallel_map
+from aoc.instrument import profiled
+from aoc.reader import Source, int_lists, map_input
 
 
 type Equation = tuple[int, list[int]]
 
 
-def parse_input(file: TextIO) -> list[Equation]:
-    equations: list[Equation] = []
-    for line in file:
-        test_value, rest = line.split(":")
-        equation_values = list(map(int, rest.split()))
-        equations.append((int(test_value), equation_values))
-    return equations
+def parse_input(source: Source) -> list[Equation]:
+    # The test value is the first number on each line, before the ":".
+    return [(values[0], values[1:]) for values in int_lists(source) if values]
+
+
+def concatenate(a: int, b: int) -> int:
+    return int(str(a) + str(b))
 
 
+# Named functions rather than lambdas, so that the operations can be pickled
+# over to a process pool.
 OPERATIONS: dict[str, Callable] = {
-    "+": lambda a, b: a + b,
-    "*": lambda a, b: a * b,
-    "||": lambda a, b: int(str(a) + str(b)),
+    "+": operator.add,
+    "*": operator.mul,
+    "||": concatenate,
 }
 
 PART_1_OPS: list[Callable] = [OPERATIONS["+"], OPERATIONS["*"]]
 PART_2_OPS: list[Callable] = list(OPERATIONS.values())
 
 
+@profiled
 def all_totals(values: list[int], ops: list[Callable]) -> list[int]:
     """
     Find all possible totals for a list of values, using the provided
@@ -54,6 +62,11 @@ def is_valid(test_value: int, equation_values: list[int], ops: list[Callable]) -
     return test_value in totals
 
 
+def equation_is_valid(ops: list[Callable], equation: Equation) -> bool:
+    test_value, equation_values = equation
+    return is_valid(test_value, equation_values, ops)
+
+
 def split_is_valid(
     equations: list[Equation], ops: list[Callable]
 ) -> tuple[list[Equation], list[Equation]]:
@@ -61,13 +74,16 @@ def split_is_valid(
     Utility function to split a list of equations into two lists, one containing
     the valid equations and the other containing the invalid equations.
     """
+    # Every equation is checked on its own, so the checks can run in parallel
+    # (see aoc.executor).
+    valid = parallel_map(equation_is_valid, equations, shared=ops)
     valid_equations = []
     invalid_equations = []
-    for test_value, equation_values in equations:
-        if is_valid(test_value, equation_values, ops):
-            valid_equations.append((test_value, equation_values))
+    for equation, equation_valid in zip(equations, valid):
+        if equation_valid:
+            valid_equations.append(equation)
         else:
-            invalid_equations.append((test_value, equation_values))
+            invalid_equations.append(equation)
     return valid_equations, invalid_equations
 
 
@@ -135,47 +151,58 @@ TEST_CASES: list[TestCase] = [
     },
 ]
 
-for test_case in TEST_CASES:
-    test_value, equation_values, expected, expected_part2 = (
-        test_case["test_value"],
-        test_case["equation_values"],
-        test_case["expected"],
-        test_case["expected_part2"],
-    )
-
-    result = is_valid(test_value, equation_values, PART_1_OPS)
-    assert (
-        result == expected
-    ), f"Expected {expected} but got {result}: {test_value=}, {equation_values=}, part 1"
-
-    result = is_valid(test_value, equation_values, PART_2_OPS)
-    assert (
-        result == expected_part2
-    ), f"Expected {expected_part2} but got {result}: {test_value=}, {equation_values=}, part 2"
-
-with open("test.txt", "r") as file:
-    equations = parse_input(file)
-    valid, invalid = split_is_valid(equations, PART_1_OPS)
-    sum_valid = sum(test_value for test_value, _ in valid)
-    assert sum_valid == 3749, f"Part 1: Expected 3749 but got {sum_valid}"
 
-    # We only need to re-check those equations that were invalid in part 1.
-    valid_part2, _ = split_is_valid(invalid, PART_2_OPS)
-    sum_valid_part2 = sum(test_value for test_value, _ in valid_part2)
-    total_sum = sum_valid + sum_valid_part2
-    assert total_sum == 11387, f"Part 2: Expected 11387 but got {total_sum}"
+def parse(text: Source) -> list[Equation]:
+    return parse_input(text)
 
 
-print("All tests passed.")
+def part1(equations: list[Equation]) -> int:
+    valid, _ = split_is_valid(equations, PART_1_OPS)
+    return sum(test_value for test_value, _ in valid)
 
-with open("input.txt", "r") as file:
-    equations = parse_input(file)
-    valid, invalid = split_is_valid(equations, PART_1_OPS)
-    sum_valid = sum(test_value for test_value, _ in valid)
-    print("Part 1:", sum_valid)
 
+def part2(equations: list[Equation]) -> int:
+    valid, invalid = split_is_valid(equations, PART_1_OPS)
     # We only need to re-check those equations that were invalid in part 1.
     valid_part2, _ = split_is_valid(invalid, PART_2_OPS)
-    sum_valid_part2 = sum(test_value for test_value, _ in valid_part2)
-    sum_total = sum_valid + sum_valid_part2
-    print("Part 2:", sum_total)
+    return sum(test_value for test_value, _ in valid + valid_part2)
+
+
+def check_examples() -> None:
+    for test_case in TEST_CASES:
+        test_value, equation_values, expected, expected_part2 = (
+            test_case["test_value"],
+            test_case["equation_values"],
+            test_case["expected"],
+            test_case["expected_part2"],
+        )
+
+        result = is_valid(test_value, equation_values, PART_1_OPS)
+        assert (
+            result == expected
+        ), f"Expected {expected} but got {result}: {test_value=}, {equation_values=}, part 1"
+
+        result = is_valid(test_value, equation_values, PART_2_OPS)
+        assert (
+            result == expected_part2
+        ), f"Expected {expected_part2} but got {result}: {test_value=}, {equation_values=}, part 2"
+
+    with map_input("test.txt") as data:
+        equations = parse_input(data)
+        sum_valid = part1(equations)
+        assert sum_valid == 3749, f"Part 1: Expected 3749 but got {sum_valid}"
+
+        total_sum = part2(equations)
+        assert total_sum == 11387, f"Part 2: Expected 11387 but got {total_sum}"
+
+
+if __name__ == "__main__":
+    check_examples()
+    print("All tests passed.")
+
+    with map_input("input.txt") as data:
+        equations = parse(data)
+        print("Part 1:", part1(equations))
+
+        # Part 2
+        print("Part 2:", part2(equations))
@@ -0,0 +1,24 @@
+import math
+import random
+import string
+
+# The real input is a 50x50 map.
+REAL_SIZE = 50 * 50
+
+FREQUENCIES = string.digits + string.ascii_letters
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate a square map of roughly `size` tiles with antennas scattered over
+    it. Like the real input, about one tile in 13 is an antenna, with each
+    frequency used by a handful of antennas.
+    """
+    rng = random.Random(seed)
+    side = max(math.isqrt(size), 2)
+    map = [["."] * side for _ in range(side)]
+    antennas = side * side // 13
+    for index, position in enumerate(rng.sample(range(side * side), antennas)):
+        row, col = divmod(position, side)
+        map[row][col] = FREQUENCIES[index // 4 % len(FREQUENCIES)]
+    return "".join("".join(row) + "\n" for row in map)
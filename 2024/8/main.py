@@ -1,5 +1,6 @@
 from typing import TextIO, Callable
 from collections import defaultdict
+import io
 
 
 def parse_input(
@@ -104,26 +105,45 @@ def find_antinodes(
     return antinodes
 
 
-with open("test.txt", "r") as f:
-    antennas, (rows, cols) = parse_input(f)
-    antinodes = find_antinodes(antennas, rows, cols, find_antinodes_for_pair)
-    assert (
-        len(antinodes) == 14
-    ), f"Part 1: Expected 14 antinodes, but got {len(antinodes)}."
+type AntennaMap = tuple[dict[str, list[tuple[int, int]]], tuple[int, int]]
 
-    # Part 2:
-    antinodes = find_antinodes(antennas, rows, cols, find_all_antinodes_for_pair)
-    assert (
-        len(antinodes) == 34
-    ), f"Part 2: Expected 34 antinodes, but got {len(antinodes)}."
 
-print("All tests passed.")
+def parse(text: str) -> AntennaMap:
+    return parse_input(io.StringIO(text))
 
-with open("input.txt", "r") as f:
-    antennas, (rows, cols) = parse_input(f)
-    antinodes = find_antinodes(antennas, rows, cols, find_antinodes_for_pair)
-    print(f"Part 1: {len(antinodes)}")
 
-    # Part 2:
-    antinodes = find_antinodes(antennas, rows, cols, find_all_antinodes_for_pair)
-    print(f"Part 2: {len(antinodes)}")
+def part1(parsed: AntennaMap) -> int:
+    antennas, (rows, cols) = parsed
+    return len(find_antinodes(antennas, rows, cols, find_antinodes_for_pair))
+
+
+def part2(parsed: AntennaMap) -> int:
+    antennas, (rows, cols) = parsed
+    return len(find_antinodes(antennas, rows, cols, find_all_antinodes_for_pair))
+
+
+def check_examples() -> None:
+    with open("test.txt", "r") as f:
+        antennas, (rows, cols) = parse_input(f)
+        antinodes = find_antinodes(antennas, rows, cols, find_antinodes_for_pair)
+        assert (
+            len(antinodes) == 14
+        ), f"Part 1: Expected 14 antinodes, but got {len(antinodes)}."
+
+        # Part 2:
+        antinodes = find_antinodes(antennas, rows, cols, find_all_antinodes_for_pair)
+        assert (
+            len(antinodes) == 34
+        ), f"Part 2: Expected 34 antinodes, but got {len(antinodes)}."
+
+
+if __name__ == "__main__":
+    check_examples()
+    print("All tests passed.")
+
+    with open("input.txt", "r") as f:
+        parsed = parse(f.read())
+        print(f"Part 1: {part1(parsed)}")
+
+        # Part 2:
+        print(f"Part 2: {part2(parsed)}")
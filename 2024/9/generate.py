@@ -0,0 +1,17 @@
+import random
+
+# The real input is a single line of 19,999 digits.
+REAL_SIZE = 19999
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate a dense disk map of `size` digits. File lengths (even positions)
+    are never 0, while free space lengths (odd positions) can be.
+    """
+    rng = random.Random(seed)
+    digits = [
+        str(rng.randint(1, 9) if position % 2 == 0 else rng.randint(0, 9))
+        for position in range(size)
+    ]
+    return "".join(digits) + "\n"
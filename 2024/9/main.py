@@ -197,43 +197,56 @@ TEST_CASES: list[TestCase] = [
     },
 ]
 
-for test_index, test_case in enumerate(TEST_CASES):
-    input = test_case["input"]
-    expected_partial = test_case["expected_partial_checksum"]
-    expected_partial_checksum = test_case["partial_checksum"]
-    expected_full = test_case["expected_full_checksum"]
-
-    partial = compact_files_partial(input)
-
-    assert (
-        partial == [int(i) for i in expected_partial]
-    ), f"Test case {test_index} failed: got {"".join(map(str, partial))} but expected {expected_partial}"
-
-    checksum = calculate_checksum(partial)
-    assert (
-        checksum == expected_partial_checksum
-    ), f"Test case {test_index} failed: got {checksum} but expected {expected_partial_checksum}"
-
-    full = compact_files_full(input)
-
-    assert (
-        full == [int(i) for i in expected_full]
-    ), f"Test case {test_index} failed: got {"".join(map(str, full))} but expected {expected_full}"
-
-    checksum = calculate_checksum(full)
-    assert (
-        checksum == test_case["full_checksum"]
-    ), f"Test case {test_index} failed: got {checksum} but expected {test_case['full_checksum']}"
-
-print("All tests passed.")
-
-with open("input.txt", "r") as f:
-    dense_disk_map = f.read().strip()
-    blocks = compact_files_partial(dense_disk_map)
-    checksum = calculate_checksum(blocks)
-    print("Part 1:", checksum)
-
-    # Part 2
-    blocks = compact_files_full(dense_disk_map)
-    checksum = calculate_checksum(blocks)
-    print("Part 2:", checksum)
+
+def parse(text: str) -> str:
+    return text.strip()
+
+
+def part1(dense_disk_map: str) -> int:
+    return calculate_checksum(compact_files_partial(dense_disk_map))
+
+
+def part2(dense_disk_map: str) -> int:
+    return calculate_checksum(compact_files_full(dense_disk_map))
+
+
+def check_examples() -> None:
+    for test_index, test_case in enumerate(TEST_CASES):
+        input = test_case["input"]
+        expected_partial = test_case["expected_partial_checksum"]
+        expected_partial_checksum = test_case["partial_checksum"]
+        expected_full = test_case["expected_full_checksum"]
+
+        partial = compact_files_partial(input)
+
+        assert (
+            partial == [int(i) for i in expected_partial]
+        ), f"Test case {test_index} failed: got {"".join(map(str, partial))} but expected {expected_partial}"
+
+        checksum = calculate_checksum(partial)
+        assert (
+            checksum == expected_partial_checksum
+        ), f"Test case {test_index} failed: got {checksum} but expected {expected_partial_checksum}"
+
+        full = compact_files_full(input)
+
+        assert (
+            full == [int(i) for i in expected_full]
+        ), f"Test case {test_index} failed: got {"".join(map(str, full))} but expected {expected_full}"
+
+        checksum = calculate_checksum(full)
+        assert (
+            checksum == test_case["full_checksum"]
+        ), f"Test case {test_index} failed: got {checksum} but expected {test_case['full_checksum']}"
+
+
+if __name__ == "__main__":
+    check_examples()
+    print("All tests passed.")
+
+    with open("input.txt", "r") as f:
+        dense_disk_map = parse(f.read())
+        print("Part 1:", part1(dense_disk_map))
+
+        # Part 2
+        print("Part 2:", part2(dense_disk_map))
@@ -0,0 +1,12 @@
+import random
+
+# The real input has around 4,000 rotations.
+REAL_SIZE = 4000
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate `size` rotations of the dial, like `L68` or `R1000`.
+    """
+    rng = random.Random(seed)
+    return "".join(f"{rng.choice('LR')}{rng.randint(1, 999)}\n" for _ in range(size))
@@ -60,16 +60,31 @@ def apply_rotation(
     return new_position, pass_count
 
 
+def parse(text: str) -> list[Rotation]:
+    return [parse_rotation(line) for line in text.splitlines()]
+
+
+def part1(rotations: list[Rotation]) -> int:
+    current_position = 50
+    counts_at_zero = 0
+    for rotation in rotations:
+        current_position, _ = apply_rotation(rotation, current_position)
+        if current_position == 0:
+            counts_at_zero += 1
+    return counts_at_zero
+
+
+def part2(rotations: list[Rotation]) -> int:
+    current_position = 50
+    counts_passed_zero = 0
+    for rotation in rotations:
+        current_position, pass_count = apply_rotation(rotation, current_position)
+        counts_passed_zero += pass_count
+    return counts_passed_zero
+
+
 if __name__ == "__main__":
     with open("input.txt", "r") as f:
-        rotations = [parse_rotation(line) for line in f]
-        current_position = 50
-        counts_at_zero = 0
-        counts_passed_zero = 0
-        for rotation in rotations:
-            current_position, pass_count = apply_rotation(rotation, current_position)
-            if current_position == 0:
-                counts_at_zero += 1
-            counts_passed_zero += pass_count
-        print("Part 1:", counts_at_zero)
-        print("Part 2:", counts_passed_zero)
+        rotations = parse(f.read())
+        print("Part 1:", part1(rotations))
+        print("Part 2:", part2(rotations))
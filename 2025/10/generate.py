@@ -0,0 +1,43 @@
+import random
+
+# The real input has around 170 machines.
+REAL_SIZE = 170
+
+
+def generate_machine(rng: random.Random) -> str:
+    lights = rng.randint(3, 8)
+    buttons = [
+        sorted(rng.sample(range(lights), rng.randint(1, lights)))
+        for _ in range(rng.randint(lights - 2, lights + 3))
+    ]
+    # Every light needs at least one button wired to it, or its joltage can
+    # never change.
+    for light in range(lights):
+        if not any(light in button for button in buttons):
+            rng.choice(buttons).append(light)
+            buttons = [sorted(button) for button in buttons]
+
+    # Work backward from some random presses, so that both the indicator
+    # lights and the joltage requirements are always reachable.
+    toggles = [rng.randint(0, 1) for _ in buttons]
+    presses = [rng.randint(0, 20) for _ in buttons]
+    diagram = ["."] * lights
+    joltages = [0] * lights
+    for button, toggle, count in zip(buttons, toggles, presses):
+        for light in button:
+            if toggle:
+                diagram[light] = "." if diagram[light] == "#" else "#"
+            joltages[light] += count
+
+    wiring = " ".join(f"({','.join(map(str, button))})" for button in buttons)
+    return f"[{''.join(diagram)}] {wiring} {{{','.join(map(str, joltages))}}}"
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate `size` machines, each with an indicator light diagram, a set of
+    button wirings, and joltage requirements that some number of presses of
+    the buttons can reach.
+    """
+    rng = random.Random(seed)
+    return "".join(generate_machine(rng) + "\n" for _ in range(size))
@@ -1,5 +1,9 @@
-from functools import cache
-import pulp
+from aoc.executor import parallel_map
+from aoc.imports import lazy_import, load_now
+from aoc.memo import memo
+
+# PuLP is slow to import, and only Part 2 needs it.
+pulp = lazy_import("pulp")
 
 type LightState = str
 type Button = tuple[int, ...]
@@ -7,7 +11,9 @@ type JoltageConfiguration = tuple[int, ...]
 type MachineConfiguration = tuple[LightState, list[Button], JoltageConfiguration]
 
 
-@cache
+# There are only so many light states and buttons, but there's no need to
+# keep every combination around.
+@memo(maxsize=4096)
 def press_button_for_lights(light_state: LightState, button: Button) -> LightState:
     new_light_state = [char for char in light_state]
     for light_index in button:
@@ -27,10 +33,12 @@ def find_minimum_presses_for_lights(
 
     # Cache values once we've computed them.
     min_presses_cache: dict[LightState, int | float] = {}
+    # The states on the current sequence of button presses. Each machine gets
+    # its own, since machines can be solved at the same time on different
+    # threads.
+    encountered_states: set[LightState] = set()
 
-    def find_minimum_presses_helper(
-        light_state: LightState, encountered_states: set[LightState] = set()
-    ) -> int | float:
+    def find_minimum_presses_helper(light_state: LightState) -> int | float:
         # Detect a cycle: if we've seen this state before, we're in an infinite
         # loop and this sequence of button presses will never converge on the
         # target state.
@@ -48,7 +56,7 @@ def find_minimum_presses_for_lights(
         min_presses = float("inf")
         for button in buttons:
             new_light_state = press_button_for_lights(light_state, button)
-            presses = find_minimum_presses_helper(new_light_state, encountered_states)
+            presses = find_minimum_presses_helper(new_light_state)
             # Add one to the number of presses to account for the current button press.
             min_presses = min(min_presses, presses + 1)
 
@@ -130,42 +138,46 @@ def find_minimum_presses_for_joltage(
     return float("inf")
 
 
-with open("input.txt", "r") as file:
-    machine_configurations: list[MachineConfiguration] = []
-    for line in file:
-        components = line.strip().split(" ")
-
-        light_state = components[0].strip("[").strip("]")
+def parse_machine_configuration(line: str) -> MachineConfiguration:
+    components = line.strip().split(" ")
 
-        joltage_requirements_str = components[-1].strip("{").strip("}")
-        joltage_requirements = tuple(
-            int(joltage) for joltage in joltage_requirements_str.split(",")
-        )
+    light_state = components[0].strip("[").strip("]")
 
-        buttons_strs = components[1:-1]
-        buttons = [
-            tuple(int(button) for button in button_str.strip("(").strip(")").split(","))
-            for button_str in buttons_strs
-        ]
-        # Sort buttons by the number of counters they affect, in descending
-        # order. This is a heuristic to try to prioritize buttons that affect
-        # more joltage counters first.
-        buttons = sorted(buttons, key=lambda button: len(button), reverse=True)
-
-        machine_configurations.append((light_state, buttons, joltage_requirements))
-
-    print(
-        "Part 1:",
-        sum(
-            find_minimum_presses_for_lights(machine_configuration)
-            for machine_configuration in machine_configurations
-        ),
+    joltage_requirements_str = components[-1].strip("{").strip("}")
+    joltage_requirements = tuple(
+        int(joltage) for joltage in joltage_requirements_str.split(",")
     )
 
-    print(
-        "Part 2:",
-        sum(
-            find_minimum_presses_for_joltage(machine_configuration)
-            for machine_configuration in machine_configurations
-        ),
-    )
+    buttons_strs = components[1:-1]
+    buttons = [
+        tuple(int(button) for button in button_str.strip("(").strip(")").split(","))
+        for button_str in buttons_strs
+    ]
+    # Sort buttons by the number of counters they affect, in descending order.
+    # This is a heuristic to try to prioritize buttons that affect more joltage
+    # counters first.
+    buttons = sorted(buttons, key=lambda button: len(button), reverse=True)
+
+    return light_state, buttons, joltage_requirements
+
+
+def parse(text: str) -> list[MachineConfiguration]:
+    return [parse_machine_configuration(line) for line in text.splitlines()]
+
+
+# Every machine is configured on its own, so the machines can be solved in
+# parallel (see aoc.executor).
+def part1(machine_configurations: list[MachineConfiguration]) -> int | float:
+    return sum(parallel_map(find_minimum_presses_for_lights, machine_configurations))
+
+
+def part2(machine_configurations: list[MachineConfiguration]) -> int | float:
+    load_now(pulp)
+    return sum(parallel_map(find_minimum_presses_for_joltage, machine_configurations))
+
+
+if __name__ == "__main__":
+    with open("input.txt", "r") as file:
+        machine_configurations = parse(file.read())
+        print("Part 1:", part1(machine_configurations))
+        print("Part 2:", part2(machine_configurations))
@@ -0,0 +1,52 @@
+import itertools
+import random
+import string
+
+# The real input has around 600 devices.
+REAL_SIZE = 600
+
+# The devices the puzzle asks about by name.
+NAMED_DEVICES = {"you", "svr", "fft", "dac", "out"}
+
+
+def device_names(count: int) -> list[str]:
+    length = 3
+    while len(string.ascii_lowercase) ** length < count + len(NAMED_DEVICES):
+        length += 1
+    names = (
+        "".join(letters)
+        for letters in itertools.product(string.ascii_lowercase, repeat=length)
+    )
+    return list(itertools.islice((n for n in names if n not in NAMED_DEVICES), count))
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate a network of roughly `size` devices. Like the real input, the
+    devices form layers where outputs only ever lead to the next few layers,
+    so there are no cycles, and every path eventually ends at `out`. The
+    named devices are placed in order along the way: `svr` first, then `you`,
+    `fft` and `dac`.
+    """
+    rng = random.Random(seed)
+    names = device_names(max(size, 8))
+    rng.shuffle(names)
+
+    width = max(round(len(names) ** 0.5 / 2), 2)
+    layers = [names[index : index + width] for index in range(0, len(names), width)]
+    layers[0].insert(0, "svr")
+    layers[len(layers) // 6].append("you")
+    layers[len(layers) // 3].append("fft")
+    layers[2 * len(layers) // 3].append("dac")
+    layers.append(["out"])
+
+    lines: list[str] = []
+    for index, layer in enumerate(layers[:-1]):
+        # Draw from the next few layers, but always include the very next one
+        # so that nothing is left without somewhere to go.
+        candidates = [name for later in layers[index + 1 : index + 4] for name in later]
+        for device in layer:
+            outputs = rng.sample(candidates, min(rng.randint(1, 3), len(candidates)))
+            lines.append(f"{device}: {' '.join(outputs)}")
+    rng.shuffle(lines)
+    return "".join(line + "\n" for line in lines)
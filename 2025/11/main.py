@@ -1,45 +1,91 @@
-from functools import cache
+def nodes_in_topological_order(
+    graph: dict[str, list[str]], start: str, end: str
+) -> list[str]:
+    """
+    Every node reachable from start, ordered so that each node comes after all
+    the nodes it leads to. The graph is walked depth first with an explicit
+    stack, and a node is added once everything it leads to has been.
+    """
+    order: list[str] = []
+    done: set[str] = set()
+    # The nodes the walk is currently in the middle of, to catch cycles.
+    in_progress: set[str] = set()
+    stack = [start]
+    while stack:
+        node = stack[-1]
+        if node in done:
+            stack.pop()
+            continue
+        if node != end and node not in graph:
+            raise ValueError(f"start {node} not in graph")
+        unvisited = (
+            [target for target in graph[node] if target not in done]
+            if node != end
+            else []
+        )
+        if unvisited:
+            if node in in_progress:
+                raise ValueError(f"{node} is on a cycle")
+            in_progress.add(node)
+            stack.extend(unvisited)
+            continue
+        in_progress.discard(node)
+        done.add(node)
+        order.append(node)
+        stack.pop()
+    return order
 
 
 def find_paths(
     graph: dict[str, list[str]], start: str, end: str, required_nodes: set[str] = set()
 ) -> int:
-    @cache
-    def find_paths_helper(
-        start: str, end: str, nodes_still_needed: tuple[str, ...]
-    ) -> int:
-        if start == end:
+    """
+    Count the paths from start to end that pass through every one of the
+    required nodes. The number of paths from a node only depends on which of
+    the required nodes the path still needs to see, so each node gets a count
+    for every combination of them, worked out from the counts of the nodes it
+    leads to.
+    """
+    # Each required node gets a bit, so the nodes still needed fit in one int.
+    required_bits = {node: 1 << index for index, node in enumerate(required_nodes)}
+    combinations = range(1 << len(required_bits))
+
+    # paths_from[node][nodes_still_needed] is the number of valid paths.
+    paths_from: dict[str, list[int]] = {}
+    for node in nodes_in_topological_order(graph, start, end):
+        if node == end:
             # If we saw all the required nodes, we found a valid path and can
-            # count this one.
-            if len(nodes_still_needed) == 0:
-                return 1
-            # Otherwise, this path doesn't work.
-            else:
-                return 0
-
-        if start not in graph:
-            raise ValueError(f"start {start} not in graph")
-
-        if start in nodes_still_needed:
-            nodes_still_needed = tuple(
-                node for node in nodes_still_needed if node != start
-            )
-
-        return sum(
-            find_paths_helper(target, end, nodes_still_needed)
-            for target in graph[start]
-        )
+            # count this one. Otherwise, this path doesn't work.
+            paths_from[node] = [1 if needed == 0 else 0 for needed in combinations]
+            continue
+        not_required = ~required_bits.get(node, 0)
+        targets = [paths_from[target] for target in graph[node]]
+        paths_from[node] = [
+            sum(paths[needed & not_required] for paths in targets)
+            for needed in combinations
+        ]
 
-    return find_paths_helper(start, end, tuple(required_nodes))
+    return paths_from[start][-1]
 
 
-with open("input.txt", "r") as file:
+def parse(text: str) -> dict[str, list[str]]:
     graph = {}
-    for line in file:
+    for line in text.splitlines():
         source, targets = line.strip().split(": ")
-        targets = targets.split(" ")
-        graph[source] = targets
+        graph[source] = targets.split(" ")
+    return graph
+
+
+def part1(graph: dict[str, list[str]]) -> int:
+    return find_paths(graph, "you", "out")
+
+
+def part2(graph: dict[str, list[str]]) -> int:
+    return find_paths(graph, "svr", "out", {"dac", "fft"})
 
-    print("Part 1:", find_paths(graph, "you", "out"))
 
-    print("Part 2:", find_paths(graph, "svr", "out", {"dac", "fft"}))
+if __name__ == "__main__":
+    with open("input.txt", "r") as file:
+        graph = parse(file.read())
+        print("Part 1:", part1(graph))
+        print("Part 2:", part2(graph))
@@ -0,0 +1,19 @@
+import random
+
+# The real input has around 35 ranges.
+REAL_SIZE = 35
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate `size` product ID ranges on a single comma-separated line. Ranges
+    start anywhere from 2 to 10 digits long and span up to a few hundred
+    thousand IDs, so they regularly cross into numbers with more digits.
+    """
+    rng = random.Random(seed)
+    ranges: list[str] = []
+    for _ in range(size):
+        start = rng.randint(10, 10 ** rng.randint(2, 10))
+        end = start + rng.randint(0, 300000)
+        ranges.append(f"{start}-{end}")
+    return ",".join(ranges) + "\n"
@@ -0,0 +1,16 @@
+import random
+
+# The real input has 200 banks of 100 batteries each.
+REAL_SIZE = 200
+
+BANK_LENGTH = 100
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate `size` battery banks, each a line of joltage ratings from 1 to 9.
+    """
+    rng = random.Random(seed)
+    return "".join(
+        "".join(rng.choices("123456789", k=BANK_LENGTH)) + "\n" for _ in range(size)
+    )
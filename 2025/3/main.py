@@ -21,11 +21,20 @@ def greedy_battery_selection(bank: str, batteries_to_turn_on: int) -> int:
     return int(result_string)
 
 
+def parse(text: str) -> list[str]:
+    return [line.strip() for line in text.splitlines()]
+
+
+def part1(banks: list[str]) -> int:
+    return sum(greedy_battery_selection(bank, 2) for bank in banks)
+
+
+def part2(banks: list[str]) -> int:
+    return sum(greedy_battery_selection(bank, 12) for bank in banks)
+
+
 if __name__ == "__main__":
     with open("input.txt", "r") as f:
-        lines = [line.strip() for line in f.readlines()]
-        total_output_joltage = sum(greedy_battery_selection(bank, 2) for bank in lines)
-        print("Part 1:", total_output_joltage)
-
-        total_output_joltage = sum(greedy_battery_selection(bank, 12) for bank in lines)
-        print("Part 2:", total_output_joltage)
+        banks = parse(f.read())
+        print("Part 1:", part1(banks))
+        print("Part 2:", part2(banks))
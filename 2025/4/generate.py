@@ -0,0 +1,18 @@
+import math
+import random
+
+# The real input is a 137x137 grid.
+REAL_SIZE = 137 * 137
+
+
+def generate(size: int, seed: int = 0, density: float = 0.6) -> str:
+    """
+    Generate a square grid of roughly `size` cells, where each cell holds a
+    roll of paper (`@`) with the given probability.
+    """
+    rng = random.Random(seed)
+    side = max(math.isqrt(size), 1)
+    return "".join(
+        "".join("@" if rng.random() < density else "." for _ in range(side)) + "\n"
+        for _ in range(side)
+    )
@@ -1,16 +1,17 @@
-from typing import Literal, TextIO, cast
+from typing import TextIO
 
-type GridItem = Literal[".", "@"]
-type Grid = list[list[GridItem]]
+import numpy as np
+
+from aoc.grid import Grid, Mask
 
 
 def parse_grid(file: TextIO) -> Grid:
-    return [list(cast(list[GridItem], line.strip())) for line in file]
+    return Grid.from_text(file.read())
 
 
 # We want to check the eight adjacent cells to a given cell to see if there are
 # paper rolls in any of them.
-CELL_DELTAS: list[tuple[int, int]] = [
+CELL_DELTAS: tuple[tuple[int, int], ...] = (
     (-1, -1),
     (-1, 0),
     (-1, 1),
@@ -19,57 +20,60 @@ CELL_DELTAS: list[tuple[int, int]] = [
     (1, -1),
     (1, 0),
     (1, 1),
-]
+)
 
 MAX_NEIGHBOR_ROLLS = 4
 
 
-def is_roll_accessible(grid: Grid, row: int, col: int) -> bool:
-    # We count the number of paper rolls in the eight adjacent cells.
-    neighor_rolls = 0
-    for delta_row, delta_col in CELL_DELTAS:
-        neighbor_row = row + delta_row
-        neighbor_col = col + delta_col
-        # If the neighbor is within bounds and is a paper roll, count it.
-        if (
-            0 <= neighbor_row < len(grid)
-            and 0 <= neighbor_col < len(grid[0])
-            and grid[neighbor_row][neighbor_col] == "@"
-        ):
-            neighor_rolls += 1
-
-    return neighor_rolls < MAX_NEIGHBOR_ROLLS
+def find_accessible_rolls(grid: Grid) -> Mask:
+    """
+    Marks every paper roll in the grid that is accessible, i.e. has fewer than
+    MAX_NEIGHBOR_ROLLS paper rolls in the eight adjacent cells. Every cell is
+    checked at once: counting neighbors shifts the whole grid by each delta,
+    treating anything beyond the edges as empty.
+    """
+    neighbor_rolls = grid.count_neighbors("@", CELL_DELTAS)
+    return grid.mask("@") & (neighbor_rolls < MAX_NEIGHBOR_ROLLS)
 
 
 def remove_accessible_rolls(grid: Grid) -> int:
     """
     Removes all accessible rolls from the grid (mutating the grid by replacing
     "@" with "."), and returns the number of rolls removed.
+    NOTE: All the rolls that are accessible at the start are removed together,
+    rather than one by one, so a roll that only becomes accessible partway
+    through waits for the next call. Since removing rolls can only ever make
+    others more accessible, the total removed once nothing else can be is the
+    same either way.
     """
-    rolls_removed = 0
-    for row in range(len(grid)):
-        for col in range(len(grid[0])):
-            if grid[row][col] == "@" and is_roll_accessible(grid, row, col):
-                grid[row][col] = "."
-                rolls_removed += 1
-    return rolls_removed
+    accessible = find_accessible_rolls(grid)
+    grid.fill(accessible, ".")
+    return int(np.count_nonzero(accessible))
+
+
+def parse(text: str) -> Grid:
+    return Grid.from_text(text)
+
+
+def part1(grid: Grid) -> int:
+    return int(np.count_nonzero(find_accessible_rolls(grid)))
+
+
+def part2(grid: Grid) -> int:
+    # Removing rolls mutates the grid, so work on a copy.
+    grid = grid.copy()
+    total_rolls_removed = 0
+    while True:
+        rolls_removed = remove_accessible_rolls(grid)
+        total_rolls_removed += rolls_removed
+        # Stop once there are no more accessible rolls to remove.
+        if rolls_removed == 0:
+            break
+    return total_rolls_removed
 
 
 if __name__ == "__main__":
     with open("input.txt", "r") as f:
-        grid = parse_grid(f)
-        accessible_rolls = 0
-        for row in range(len(grid)):
-            for col in range(len(grid[0])):
-                if grid[row][col] == "@" and is_roll_accessible(grid, row, col):
-                    accessible_rolls += 1
-        print("Part 1:", accessible_rolls)
-
-        total_rolls_removed = 0
-        while True:
-            rolls_removed = remove_accessible_rolls(grid)
-            total_rolls_removed += rolls_removed
-            # Stop once there are no more accessible rolls to remove.
-            if rolls_removed == 0:
-                break
-        print("Part 2:", total_rolls_removed)
+        grid = parse(f.read())
+        print("Part 1:", part1(grid))
+        print("Part 2:", part2(grid))
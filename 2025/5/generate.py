@@ -0,0 +1,23 @@
+import random
+
+# The real input has 1,000 available ingredient IDs.
+REAL_SIZE = 1000
+
+MAX_ID = 10**15
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate the fresh ingredient ID ranges, a blank line, and then `size`
+    available ingredient IDs. Like the real input, there are about a fifth as
+    many ranges as IDs, and the ranges overlap a fair amount.
+    """
+    rng = random.Random(seed)
+    ranges: list[str] = []
+    for _ in range(max(size // 5, 1)):
+        start = rng.randint(1, MAX_ID)
+        end = start + rng.randint(0, MAX_ID // 200)
+        ranges.append(f"{start}-{end}\n")
+
+    ids = [f"{rng.randint(1, MAX_ID)}\n" for _ in range(size)]
+    return "".join(ranges) + "\n" + "".join(ids)
@@ -1,53 +1,44 @@
-def is_id_fresh(id: int, ranges: list[tuple[int, int]]) -> bool:
-    for start, end in ranges:
-        if start <= id <= end:
-            return True
-    return False
-
-
-def build_discrete_ranges(ranges: list[tuple[int, int]]) -> list[tuple[int, int]]:
-    # Sort based on the start of the range.
-    sorted_ranges = sorted(ranges, key=lambda x: x[0])
-    # Initialize the list of discrete ranges with the first range.
-    discrete_ranges: list[tuple[int, int]] = [sorted_ranges[0]]
-    for start, end in sorted_ranges:
-        # Check if the range overlaps with the previous range in the list.
-        last_start, last_end = discrete_ranges[-1]
-        if start <= last_end + 1:
-            # The range overlaps with the previous range. Merge them, taking the
-            # higher end of the two ranges to include both.
-            discrete_ranges[-1] = (last_start, max(last_end, end))
-        else:
-            # The range does not overlap with the previous range. Add it to the list.
-            discrete_ranges.append((start, end))
-    return discrete_ranges
-
-
-def count_size_of_range(range: tuple[int, int]) -> int:
-    start, end = range
-    # Range is inclusive.
-    return end - start + 1
-
-
-with open("input.txt", "r") as f:
-    ranges: list[tuple[int, int]] = []
-    line = f.readline().strip()
-    while line:
-        ranges.append(tuple[int, int](map(int, line.split("-"))))
-        line = f.readline().strip()
-
-    available_ids: list[int] = []
-    line = f.readline().strip()
-    while line:
-        available_ids.append(int(line))
-        line = f.readline().strip()
-
-    fresh_ids = [id for id in available_ids if is_id_fresh(id, ranges)]
-    print("Part 1:", len(fresh_ids))
-
-    discrete_ranges = build_discrete_ranges(ranges)
-
-    for range in discrete_ranges:
-        print(range, count_size_of_range(range))
-
-    print("Part 2:", sum(count_size_of_range(range) for range in discrete_ranges))
+import numpy as np
+
+from aoc.interval_set import IntervalSet
+from aoc.reader import Source, int_rows, map_input
+
+# The fresh ID ranges, and the available IDs as an int64 array, so that they
+# can all be looked up at once.
+type Inventory = tuple[list[tuple[int, int]], np.ndarray]
+
+
+def parse(text: Source) -> Inventory:
+    values, counts = int_rows(text)
+    # The ranges come first, two numbers to a line, and the available IDs
+    # after the blank line, one to a line.
+    blank_lines = (counts == 0).nonzero()[0]
+    num_range_lines = int(blank_lines[0]) if len(blank_lines) else len(counts)
+    num_range_values = int(counts[:num_range_lines].sum())
+    ranges = [
+        (start, end) for start, end in values[:num_range_values].reshape(-1, 2).tolist()
+    ]
+    available_ids = values[num_range_values:]
+    return ranges, available_ids
+
+
+def part1(inventory: Inventory) -> int:
+    ranges, available_ids = inventory
+    # Merging the ranges first means each ID only has to be looked up in one
+    # sorted list, rather than checked against every range.
+    fresh_ids = IntervalSet(ranges)
+    return int(fresh_ids.contains_many(available_ids).sum())
+
+
+def part2(inventory: Inventory) -> int:
+    ranges, _ = inventory
+    # Once merged, the ranges no longer overlap, so none of the IDs they
+    # contain are counted twice.
+    return IntervalSet(ranges).total_length()
+
+
+if __name__ == "__main__":
+    with map_input("input.txt") as data:
+        inventory = parse(data)
+        print("Part 1:", part1(inventory))
+        print("Part 2:", part2(inventory))
@@ -0,0 +1,30 @@
+import random
+
+# The real input has around 1,000 problems.
+REAL_SIZE = 1000
+
+NUMBER_ROWS = 4
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate a worksheet of `size` problems laid out side by side, separated by
+    a column of spaces. Each problem has a number on each of the first four
+    rows and its operation on the last. Numbers within a problem are aligned
+    either left or right, which matters when reading them by column.
+    """
+    rng = random.Random(seed)
+    rows: list[list[str]] = [[] for _ in range(NUMBER_ROWS + 1)]
+    for _ in range(size):
+        width = rng.randint(1, 4)
+        align_left = rng.random() < 0.5
+        numbers = [str(rng.randint(1, 10**width - 1)) for _ in range(NUMBER_ROWS)]
+        # Like the real input, numbers are stacked by length, so that reading
+        # a column top to bottom never skips over a gap in the middle.
+        numbers.sort(key=len, reverse=rng.random() < 0.5)
+        for row, number in zip(rows, numbers):
+            row.append(number.ljust(width) if align_left else number.rjust(width))
+        rows[NUMBER_ROWS].append(rng.choice("+*").ljust(width))
+    # Every row ends with a newline, including the last one, which the parser
+    # relies on to close off the final problem.
+    return "".join(" ".join(row) + " \n" for row in rows)
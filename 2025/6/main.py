@@ -66,14 +66,24 @@ def evaluate_problem(problem: Problem) -> int:
             return math.prod(numbers)
 
 
-with open("input.txt", "r") as f:
-    rows = f.readlines()
+def parse(text: str) -> list[str]:
+    # NOTE: Rows keep their trailing newline; the newline at the end of the
+    # operations row is what closes off the final problem.
+    return text.splitlines(keepends=True)
+
+
+def part1(rows: list[str]) -> int:
     problems = parse_problems(rows, parse_numbers_by_row)
-    solutions = [evaluate_problem(problem) for problem in problems]
-    print("Part 1:", sum(solutions))
+    return sum(evaluate_problem(problem) for problem in problems)
+
 
+def part2(rows: list[str]) -> int:
     problems = parse_problems(rows, parse_numbers_by_column)
-    for problem in problems:
-        evaluation = evaluate_problem(problem)
-    solutions = [evaluate_problem(problem) for problem in problems]
-    print("Part 2:", sum(solutions))
+    return sum(evaluate_problem(problem) for problem in problems)
+
+
+if __name__ == "__main__":
+    with open("input.txt", "r") as f:
+        rows = parse(f.read())
+        print("Part 1:", part1(rows))
+        print("Part 2:", part2(rows))
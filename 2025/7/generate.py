@@ -0,0 +1,27 @@
+import math
+import random
+
+# The real input is a 141 wide by 142 tall manifold.
+REAL_SIZE = 141 * 142
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate a square tachyon manifold of roughly `size` cells, with the beam
+    entering at the middle of the first row. Like the real input, splitters
+    only appear on every other row and never on the edges, and they fall
+    inside the triangle the beam can spread to.
+    """
+    rng = random.Random(seed)
+    side = max(math.isqrt(size), 3)
+    start = side // 2
+    rows = ["." * start + "S" + "." * (side - start - 1)]
+    for row_index in range(1, side):
+        row = ["."] * side
+        if row_index % 2 == 0:
+            spread = row_index // 2
+            for col in range(max(start - spread, 1), min(start + spread, side - 2) + 1):
+                if (col - start) % 2 == spread % 2 and rng.random() < 0.8:
+                    row[col] = "^"
+        rows.append("".join(row))
+    return "".join(row + "\n" for row in rows)
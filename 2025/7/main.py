@@ -1,4 +1,4 @@
-import functools
+from collections import defaultdict
 
 
 def split_beams(row: str, beam_positions: set[int]) -> tuple[int, set[int]]:
@@ -20,40 +20,55 @@ def split_beams(row: str, beam_positions: set[int]) -> tuple[int, set[int]]:
     return splits, new_beam_positions
 
 
-@functools.cache
-def count_timelines_for_beam(col: int, rows: tuple[str, ...]) -> int:
-    if len(rows) == 1:
-        return 1
-
-    next_row, rest_rows = rows[0], rows[1:]
-    row_length = len(next_row)
-    if next_row[col] == "^":
-        # If this beam would encounter a splitter in the current row, count the
-        # timelines for each of the two new beams.
-        left_timelines = 0
-        right_timelines = 0
-        if col - 1 >= 0:
-            left_timelines = count_timelines_for_beam(col - 1, rest_rows)
-        if col + 1 < row_length:
-            right_timelines = count_timelines_for_beam(col + 1, rest_rows)
-        return left_timelines + right_timelines
-    else:
-        # Otherwise, the beam continues in the same direction; we continue
-        # counting timelines for the next row.
-        return count_timelines_for_beam(col, rest_rows)
-
-
-with open("input.txt", "r") as f:
-    rows = [line.strip() for line in f.readlines()]
+def count_timelines_for_beam(col: int, rows: list[str]) -> int:
+    """
+    Count the timelines of a beam starting in the given column of the first
+    row, working down one row at a time. Beams that end up in the same column
+    behave the same from then on, so rather than following each timeline on
+    its own, we keep how many timelines have a beam in each column.
+    """
+    timelines_by_col = {col: 1}
+    # The beams pass through every row but the last.
+    for row in rows[:-1]:
+        row_length = len(row)
+        next_timelines_by_col: defaultdict[int, int] = defaultdict(int)
+        for beam_col, timelines in timelines_by_col.items():
+            if row[beam_col] == "^":
+                # If this beam would encounter a splitter in the current row,
+                # each of its timelines continues with each of the two new
+                # beams.
+                if beam_col - 1 >= 0:
+                    next_timelines_by_col[beam_col - 1] += timelines
+                if beam_col + 1 < row_length:
+                    next_timelines_by_col[beam_col + 1] += timelines
+            else:
+                # Otherwise, the beam continues in the same direction.
+                next_timelines_by_col[beam_col] += timelines
+        timelines_by_col = next_timelines_by_col
+    return sum(timelines_by_col.values())
+
+
+def parse(text: str) -> list[str]:
+    return [line.strip() for line in text.splitlines()]
+
+
+def part1(rows: list[str]) -> int:
     beam_positions: set[int] = set()
     # Find the starting position of the beam in the first row.
-    beam_start_col = rows[0].index("S")
-    beam_positions.add(beam_start_col)
+    beam_positions.add(rows[0].index("S"))
     total_splits = 0
     for row in rows[1:]:
         splits, beam_positions = split_beams(row, beam_positions)
         total_splits += splits
-    print("Part 1:", total_splits)
+    return total_splits
+
+
+def part2(rows: list[str]) -> int:
+    return count_timelines_for_beam(rows[0].index("S"), rows)
+
 
-    timelines = count_timelines_for_beam(beam_start_col, tuple(rows))
-    print("Part 2:", timelines)
+if __name__ == "__main__":
+    with open("input.txt", "r") as f:
+        rows = parse(f.read())
+        print("Part 1:", part1(rows))
+        print("Part 2:", part2(rows))
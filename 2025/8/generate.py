@@ -0,0 +1,16 @@
+import random
+
+# The real input has 1,000 junction boxes.
+REAL_SIZE = 1000
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate `size` junction boxes as `X,Y,Z` lines, scattered uniformly over
+    the same space as the real input.
+    """
+    rng = random.Random(seed)
+    return "".join(
+        f"{rng.randint(0, 99999)},{rng.randint(0, 99999)},{rng.randint(0, 99999)}\n"
+        for _ in range(size)
+    )
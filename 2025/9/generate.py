@@ -0,0 +1,43 @@
+import math
+import random
+
+# The real input has around 500 red tiles.
+REAL_SIZE = 500
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generate a loop of roughly `size` red tiles, where each tile is in the
+    same row or column as the next, like the real input. The loop is built by
+    walking around a circle with a jittery radius and stepping horizontally,
+    then vertically, between consecutive points. Every point gets a distinct
+    x and y coordinate, so that no line of green tiles has zero length.
+    """
+    rng = random.Random(seed)
+    points = max(size // 2, 2)
+    xs = rng.sample(range(1, 100000), points)
+    ys = rng.sample(range(1, 100000), points)
+    # Match the coordinates up by angle around the center so the loop winds
+    # around it once instead of jumping back and forth across it.
+    angles = sorted(rng.uniform(0, math.tau) for _ in range(points))
+    by_x = sorted(xs, key=lambda x: x)
+    by_y = sorted(ys, key=lambda y: y)
+    corners: list[tuple[int, int]] = []
+    for angle in angles:
+        radius = rng.uniform(0.6, 1.0)
+        x_rank = round((math.cos(angle) * radius + 1) / 2 * (points - 1))
+        y_rank = round((math.sin(angle) * radius + 1) / 2 * (points - 1))
+        corners.append((x_rank, y_rank))
+
+    # Ranks may collide, so hand out the actual coordinates in rank order.
+    x_order = sorted(range(points), key=lambda i: (corners[i][0], i))
+    y_order = sorted(range(points), key=lambda i: (corners[i][1], i))
+    x_for = {index: by_x[rank] for rank, index in enumerate(x_order)}
+    y_for = {index: by_y[rank] for rank, index in enumerate(y_order)}
+
+    tiles: list[tuple[int, int]] = []
+    for index in range(points):
+        next_index = (index + 1) % points
+        tiles.append((x_for[index], y_for[index]))
+        tiles.append((x_for[next_index], y_for[index]))
+    return "".join(f"{x},{y}\n" for x, y in tiles)
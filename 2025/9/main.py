@@ -1,3 +1,5 @@
+from aoc.reader import Source, int_block, map_input
+
 type Tile = tuple[int, int]
 
 
@@ -61,16 +63,17 @@ def rectangle_contains_line(
     return contains_y and overlaps_x
 
 
-with open("input.txt", "r") as f:
-    red_tile_coordinates: list[Tile] = []
-    for line in f:
-        x, y = line.strip().split(",")
-        red_tile_coordinates.append((int(x), int(y)))
+def parse(text: Source) -> list[Tile]:
+    return [(x, y) for x, y in int_block(text).tolist()]
+
 
-    # Calculate the size of all the possible rectangles that can be formed by
-    # pairs of red tiles as opposite corners, then sort them from largest to
-    # smallest.
-    all_areas: list[tuple[Tile, Tile, int]] = sorted(
+def sorted_rectangles(red_tile_coordinates: list[Tile]) -> list[tuple[Tile, Tile, int]]:
+    """
+    Calculate the size of all the possible rectangles that can be formed by
+    pairs of red tiles as opposite corners, then sort them from largest to
+    smallest.
+    """
+    return sorted(
         [
             (tile_1, tile_2, rectangle_area(tile_1, tile_2))
             for tile_1 in red_tile_coordinates
@@ -80,10 +83,14 @@ with open("input.txt", "r") as f:
         reverse=True,
     )
 
+
+def part1(red_tile_coordinates: list[Tile]) -> int:
     # The largest rectangle is the first one in the list. Its size is the third
     # element of the tuple.
-    print("Part 1:", all_areas[0][2])
+    return sorted_rectangles(red_tile_coordinates)[0][2]
 
+
+def part2(red_tile_coordinates: list[Tile]) -> int:
     # Pairs of adjacent red tiles form lines of green tiles surrounding the
     # interior area of green tiles. We start with the final pair that wraps the
     # list (the final tile and the first one), since all the others are easy to
@@ -100,7 +107,15 @@ with open("input.txt", "r") as f:
     # lines. This disqualifies it from being the largest green tile rectangle.
     # The first qualifying rectangle is the largest one that does not contain
     # any of the lines.
-    for rectangle in all_areas:
+    for rectangle in sorted_rectangles(red_tile_coordinates):
         if not any(rectangle_contains_line(rectangle, line) for line in lines):
-            print("Part 2:", rectangle[2])
-            break
+            return rectangle[2]
+
+    raise ValueError("No rectangle fits inside the loop")
+
+
+if __name__ == "__main__":
+    with map_input("input.txt") as data:
+        red_tile_coordinates = parse(data)
+        print("Part 1:", part1(red_tile_coordinates))
+        print("Part 2:", part2(red_tile_coordinates))
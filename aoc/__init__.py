@@ -0,0 +1,5 @@
+"""
+Shared tooling for running and benchmarking the Advent of Code solutions. Run
+`python -m aoc --help` from any of the year environments to see what's
+available.
+"""
@@ -0,0 +1,456 @@
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+from aoc import answers, memo_store, parse_cache
+from aoc.bench import bench_day, format_duration, format_results
+from aoc.days import day_label, discover_days, input_path, load_generator
+from aoc.executor import BACKENDS
+from aoc.imports import format_imports, measure_imports
+from aoc.memory import format_bytes, format_memory, over_budget, parse_size
+from aoc.regression import (
+    BASELINE_PATH,
+    DEFAULT_SETTINGS,
+    DEFAULT_TOLERANCE,
+    Measurement,
+    compare,
+    format_comparisons,
+    has_regressions,
+    load_baseline,
+    measure_day,
+    updated_baseline,
+    write_baseline,
+)
+from aoc.run_all import run_all, to_json, to_markdown, write_report
+from aoc.sampler import DEFAULT_FREQUENCY, format_hottest, sample_day, write_collapsed
+from aoc.scaling import DEFAULT_FACTORS, format_sweep, sweep
+
+CACHE_HELP = (
+    "parse through the parsed input cache, so the parse step times a cache load"
+)
+MEMORY_BUDGET_HELP = (
+    "fail if any step's peak memory goes over this size (like 512M or 2G); "
+    "implies --memory"
+)
+EXECUTOR_HELP = (
+    "what the days that split up their work run it on (default: $AOC_EXECUTOR, or auto)"
+)
+
+
+def report_over_budget(label: str, steps: list[str], budget: int) -> None:
+    print(
+        f"{label}: {', '.join(steps)} went over the memory budget of "
+        f"{format_bytes(budget)}",
+        file=sys.stderr,
+    )
+
+
+def bench(args: argparse.Namespace) -> int:
+    path = Path(args.input) if args.input else input_path(args.year, args.day)
+    if not path.exists():
+        print(f"No input found at {path}; pass one with --input", file=sys.stderr)
+        return 1
+
+    memory = args.memory or args.memory_budget is not None
+    try:
+        results = bench_day(
+            args.year, args.day, path, args.repeat, args.warmup, args.cache, memory
+        )
+    except answers.WrongAnswer as error:
+        print(error, file=sys.stderr)
+        return 1
+    cached = ", parse cached" if args.cache else ""
+    print(
+        f"{args.year} day {args.day} ({path.name}, {args.repeat} runs after "
+        f"{args.warmup} warmup{cached})"
+    )
+    print(format_results(results))
+    if not memory:
+        return 0
+
+    measured = {
+        result["step"]: result["memory"]
+        for result in results
+        if result["memory"] is not None
+    }
+    print()
+    print(format_memory(measured))
+    budget: int | None = args.memory_budget
+    if budget is None:
+        return 0
+    peaks = {step: stats["peak"] for step, stats in measured.items()}
+    failed = over_budget(peaks, budget)
+    if failed:
+        report_over_budget(f"{args.year} day {args.day}", failed, budget)
+        return 1
+    return 0
+
+
+def scale(args: argparse.Namespace) -> int:
+    results = sweep(
+        args.year,
+        args.day,
+        args.factors,
+        args.seed,
+        args.repeat,
+        args.budget,
+        args.cache,
+    )
+    cached = ", parse cached" if args.cache else ""
+    print(
+        f"{args.year} day {args.day} (generated with seed {args.seed}, median of "
+        f"{args.repeat} runs per size{cached})"
+    )
+    print(format_sweep(results))
+    return 0
+
+
+def generate(args: argparse.Namespace) -> int:
+    generator = load_generator(args.year, args.day)
+    if args.size is not None:
+        size = args.size
+    else:
+        size = max(round(generator.REAL_SIZE * args.factor), 1)
+    text = generator.generate(size, args.seed)
+    if args.output:
+        Path(args.output).write_text(text)
+    else:
+        sys.stdout.write(text)
+    return 0
+
+
+def run_all_days(args: argparse.Namespace) -> int:
+    days = discover_days(args.years or None)
+    start = time.perf_counter()
+    memory = args.memory or args.memory_budget is not None
+    reports = run_all(days, args.workers, not args.no_examples, memory, args.executor)
+    elapsed = time.perf_counter() - start
+    if args.format == "json":
+        write_report(to_json(reports), args.output)
+    else:
+        write_report(to_markdown(reports, elapsed), args.output)
+
+    failed = any(report["status"] == "failed" for report in reports)
+    budget: int | None = args.memory_budget
+    if budget is None:
+        return 1 if failed else 0
+    for report in reports:
+        peaks = {
+            step["step"]: step["peak"]
+            for step in report["steps"]
+            if step["peak"] is not None
+        }
+        steps = over_budget(peaks, budget)
+        if steps:
+            label = f"{report['year']} day {report['day']}"
+            report_over_budget(label, steps, budget)
+            failed = True
+    return 1 if failed else 0
+
+
+def regress(args: argparse.Namespace) -> int:
+    path = Path(args.baseline)
+    baseline = load_baseline(path)
+    if baseline is None and not args.update_baseline:
+        print(
+            f"No baseline found at {path}; create one with --update-baseline",
+            file=sys.stderr,
+        )
+        return 1
+    # Measure the way the baseline was measured, unless it's being replaced.
+    settings = (
+        baseline["settings"]
+        if baseline is not None and not args.update_baseline
+        else DEFAULT_SETTINGS.copy()
+    )
+    if args.factor is not None:
+        if not args.update_baseline:
+            print("--factor only applies with --update-baseline", file=sys.stderr)
+            return 1
+        settings["factor"] = args.factor
+    if args.repeat is not None:
+        settings["repeat"] = args.repeat
+
+    measurements: dict[str, Measurement] = {}
+    for year, day in discover_days(args.years or None):
+        print(f"Measuring {year} day {day}...", file=sys.stderr)
+        measurements[day_label(year, day)] = measure_day(year, day, settings)
+
+    if args.update_baseline:
+        write_baseline(updated_baseline(baseline, measurements, settings), path)
+        print(f"Baseline written to {path}")
+        # Measurements taken another way can't be compared with the old ones.
+        if baseline is None or baseline["settings"] != settings:
+            return 0
+    assert baseline is not None
+    comparisons = compare(baseline, measurements, args.tolerance)
+    print(format_comparisons(comparisons))
+    return 1 if has_regressions(comparisons) and not args.update_baseline else 0
+
+
+def sample(args: argparse.Namespace) -> int:
+    if args.factor is not None:
+        generator = load_generator(args.year, args.day)
+        size = max(round(generator.REAL_SIZE * args.factor), 1)
+        text = generator.generate(size, args.seed)
+        source = f"generated at {format(args.factor, 'g')}x with seed {args.seed}"
+    else:
+        path = Path(args.input) if args.input else input_path(args.year, args.day)
+        if not path.exists():
+            print(f"No input found at {path}; pass one with --input", file=sys.stderr)
+            return 1
+        text = path.read_text()
+        source = path.name
+
+    # Only this process is sampled, so the work stays in it unless asked not to.
+    os.environ.setdefault("AOC_EXECUTOR", "serial")
+    report = sample_day(args.year, args.day, text, args.frequency)
+    print(f"{args.year} day {args.day} ({source}, sampled at {args.frequency} Hz)")
+    for step in report["steps"]:
+        answer = "" if step["answer"] is None else f"  {step['answer']}"
+        print(
+            f"{step['step']:<8}{format_duration(step['elapsed']):>12}"
+            f"{step['samples']:>8} samples{answer}"
+        )
+    print()
+    print(format_hottest(report["stacks"], args.top))
+    output = Path(args.output) if args.output else None
+    path = write_collapsed(report["stacks"], f"{args.year}-{args.day}", output)
+    print(f"\nCollapsed stacks written to {path}")
+    return 0
+
+
+def startup(args: argparse.Namespace) -> int:
+    report = measure_imports(args.year, args.day, args.top)
+    print(f"{args.year} day {args.day} (imports in a fresh interpreter)")
+    print(format_imports(report))
+    return 0
+
+
+def clear_cache(args: argparse.Namespace) -> int:
+    removed = parse_cache.clear_cache()
+    print(f"Removed {removed} cached parsed inputs from {parse_cache.cache_dir()}")
+    removed = memo_store.clear_store()
+    print(f"Removed {removed} memoized results from {memo_store.store_path()}")
+    return 0
+
+
+def forget_answers(args: argparse.Namespace) -> int:
+    if args.day is not None and args.year is None:
+        print("A day needs a year", file=sys.stderr)
+        return 1
+    day = day_label(args.year, args.day) if args.day is not None else None
+    removed = answers.forget_answers(day)
+    print(f"Removed {removed} recorded answers from {answers.store_path()}")
+    return 0
+
+
+def parse_factors(value: str) -> tuple[float, ...]:
+    return tuple(float(factor) for factor in value.split(","))
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m aoc")
+    subparsers = parser.add_subparsers(required=True)
+
+    bench_parser = subparsers.add_parser(
+        "bench", help="time parsing and both parts of a single day"
+    )
+    bench_parser.add_argument("year", type=int)
+    bench_parser.add_argument("day", type=int)
+    bench_parser.add_argument("-n", "--repeat", type=int, default=10)
+    bench_parser.add_argument("--warmup", type=int, default=2)
+    bench_parser.add_argument(
+        "--input", help="path to the puzzle input (defaults to the day's input.txt)"
+    )
+    bench_parser.add_argument("--cache", action="store_true", help=CACHE_HELP)
+    bench_parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="also measure each step's peak memory and top allocation sites",
+    )
+    bench_parser.add_argument(
+        "--memory-budget", type=parse_size, help=MEMORY_BUDGET_HELP
+    )
+    bench_parser.add_argument("--executor", choices=BACKENDS, help=EXECUTOR_HELP)
+    bench_parser.set_defaults(handler=bench)
+
+    scale_parser = subparsers.add_parser(
+        "scale",
+        help="time a day on generated inputs of increasing size and fit the growth",
+    )
+    scale_parser.add_argument("year", type=int)
+    scale_parser.add_argument("day", type=int)
+    scale_parser.add_argument(
+        "--factors",
+        type=parse_factors,
+        default=DEFAULT_FACTORS,
+        help="comma-separated multiples of the real input size (default: 1,10,100)",
+    )
+    scale_parser.add_argument("--seed", type=int, default=0)
+    scale_parser.add_argument("-n", "--repeat", type=int, default=3)
+    scale_parser.add_argument(
+        "--budget",
+        type=float,
+        default=60.0,
+        help="stop growing a step once its median takes longer than this many seconds",
+    )
+    scale_parser.add_argument("--cache", action="store_true", help=CACHE_HELP)
+    scale_parser.add_argument("--executor", choices=BACKENDS, help=EXECUTOR_HELP)
+    scale_parser.set_defaults(handler=scale)
+
+    generate_parser = subparsers.add_parser(
+        "generate", help="write a synthetic puzzle input for a day"
+    )
+    generate_parser.add_argument("year", type=int)
+    generate_parser.add_argument("day", type=int)
+    size_group = generate_parser.add_mutually_exclusive_group()
+    size_group.add_argument(
+        "--factor", type=float, default=1, help="multiple of the real input size"
+    )
+    size_group.add_argument("--size", type=int, help="size in the generator's units")
+    generate_parser.add_argument("--seed", type=int, default=0)
+    generate_parser.add_argument(
+        "-o", "--output", help="file to write (default: stdout)"
+    )
+    generate_parser.set_defaults(handler=generate)
+
+    run_all_parser = subparsers.add_parser(
+        "run-all",
+        help="check the examples and solve the real input of every day, in parallel",
+    )
+    run_all_parser.add_argument(
+        "years", type=int, nargs="*", help="years to run (default: all of them)"
+    )
+    run_all_parser.add_argument(
+        "-j", "--workers", type=int, help="worker processes (default: one per core)"
+    )
+    run_all_parser.add_argument(
+        "--no-examples", action="store_true", help="skip the example checks"
+    )
+    run_all_parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="also measure each step's peak memory (which slows every step down)",
+    )
+    run_all_parser.add_argument(
+        "--memory-budget", type=parse_size, help=MEMORY_BUDGET_HELP
+    )
+    run_all_parser.add_argument(
+        "--format", choices=("markdown", "json"), default="markdown"
+    )
+    run_all_parser.add_argument(
+        "-o", "--output", help="file to write the summary to (default: stdout)"
+    )
+    run_all_parser.add_argument("--executor", choices=BACKENDS, help=EXECUTOR_HELP)
+    run_all_parser.set_defaults(handler=run_all_days)
+
+    regress_parser = subparsers.add_parser(
+        "regress",
+        help="benchmark every day and fail if any step got slower or hungrier "
+        "than the baseline",
+    )
+    regress_parser.add_argument(
+        "years", type=int, nargs="*", help="years to check (default: all of them)"
+    )
+    regress_parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=DEFAULT_TOLERANCE,
+        help="how much slower or bigger a step can get before it counts as a "
+        "regression, as a fraction of its baseline (default: %(default)s)",
+    )
+    regress_parser.add_argument(
+        "--baseline", default=BASELINE_PATH, help="default: benchmarks/baseline.json"
+    )
+    regress_parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="record these measurements as the new baseline",
+    )
+    regress_parser.add_argument(
+        "--factor",
+        type=float,
+        help="with --update-baseline, the generated input size, as a multiple of "
+        "the real input's (default: 1)",
+    )
+    regress_parser.add_argument(
+        "-n", "--repeat", type=int, help="timed runs per step (default: the baseline's)"
+    )
+    regress_parser.add_argument("--executor", choices=BACKENDS, help=EXECUTOR_HELP)
+    regress_parser.set_defaults(handler=regress)
+
+    sample_parser = subparsers.add_parser(
+        "sample",
+        help="profile a day by sampling its stack, writing collapsed stacks for a "
+        "flamegraph",
+    )
+    sample_parser.add_argument("year", type=int)
+    sample_parser.add_argument("day", type=int)
+    sample_input_group = sample_parser.add_mutually_exclusive_group()
+    sample_input_group.add_argument(
+        "--input", help="path to the puzzle input (defaults to the day's input.txt)"
+    )
+    sample_input_group.add_argument(
+        "--factor",
+        type=float,
+        help="sample a generated input instead, at this multiple of the real size",
+    )
+    sample_parser.add_argument("--seed", type=int, default=0)
+    sample_parser.add_argument(
+        "--frequency",
+        type=int,
+        default=DEFAULT_FREQUENCY,
+        help="samples per second of CPU time (default: %(default)s)",
+    )
+    sample_parser.add_argument(
+        "--top", type=int, default=10, help="how many of the hottest functions to list"
+    )
+    sample_parser.add_argument(
+        "-o",
+        "--output",
+        help="file to write the collapsed stacks to (default: one in "
+        ".aoc-cache/profiles/)",
+    )
+    sample_parser.add_argument("--executor", choices=BACKENDS, help=EXECUTOR_HELP)
+    sample_parser.set_defaults(handler=sample)
+
+    startup_parser = subparsers.add_parser(
+        "startup", help="report how long loading a day takes, import by import"
+    )
+    startup_parser.add_argument("year", type=int)
+    startup_parser.add_argument("day", type=int)
+    startup_parser.add_argument(
+        "--top", type=int, default=10, help="how many of the slowest imports to list"
+    )
+    startup_parser.set_defaults(handler=startup)
+
+    clear_cache_parser = subparsers.add_parser(
+        "clear-cache", help="delete every cached parsed input and memoized result"
+    )
+    clear_cache_parser.set_defaults(handler=clear_cache)
+
+    forget_answers_parser = subparsers.add_parser(
+        "forget-answers",
+        help="delete the recorded answers for a day (default: for every day)",
+    )
+    forget_answers_parser.add_argument("year", type=int, nargs="?")
+    forget_answers_parser.add_argument("day", type=int, nargs="?")
+    forget_answers_parser.set_defaults(handler=forget_answers)
+
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    # Set for the whole process, so that run-all's and regress's worker
+    # processes pick it up too.
+    if getattr(args, "executor", None):
+        os.environ["AOC_EXECUTOR"] = args.executor
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,113 @@
+"""
+A local store of puzzle answers, so that every benchmark doubles as a
+correctness check.
+
+Answers are keyed on the SHA-256 of the input together with the part. The
+first time a part is solved for an input, its answer is recorded; from then
+on, every run on that input (`bench`, `scale`, `run-all` and `regress` all
+check) has to come up with the same answer, or it fails with a `WrongAnswer`
+rather than quietly reporting a better time. That goes for generated inputs
+too, so a faster algorithm can be checked against the old one on inputs far
+bigger than the real one.
+
+The first answer for an input is trusted, so record it with a solution you
+believe in. If it turns out to be wrong, `python -m aoc forget-answers` drops
+it. Answers live in a SQLite database, `.aoc-cache/answers.sqlite` (under
+`AOC_CACHE_DIR`, if it's set), so that `run-all`'s workers can all check and
+record at once. Unlike the caches next to it, `clear-cache` leaves it alone.
+"""
+
+import contextlib
+import hashlib
+import os
+import sqlite3
+from pathlib import Path
+from typing import Any, Literal
+
+from aoc.days import REPO_ROOT
+
+# How long to wait for another process to finish writing, in seconds.
+BUSY_TIMEOUT = 30
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS answers (
+    input TEXT NOT NULL,
+    part TEXT NOT NULL,
+    day TEXT NOT NULL,
+    answer TEXT NOT NULL,
+    PRIMARY KEY (input, part)
+) WITHOUT ROWID;
+"""
+
+# Whether an answer was just recorded, or matched the one recorded before.
+type Check = Literal["recorded", "matched"]
+
+
+class WrongAnswer(ValueError):
+    pass
+
+
+def store_path() -> Path:
+    root = os.environ.get("AOC_CACHE_DIR")
+    return (Path(root) if root else REPO_ROOT / ".aoc-cache") / "answers.sqlite"
+
+
+def input_hash(text: str) -> str:
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def connect() -> sqlite3.Connection:
+    path = store_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(path, timeout=BUSY_TIMEOUT)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.executescript(SCHEMA)
+    return connection
+
+
+def check_answer(day: str, input_sha256: str, part: str, answer: Any) -> Check:
+    """
+    Record `answer` as the answer to `part` for the input with the given hash,
+    or, if one was recorded already, raise a `WrongAnswer` unless they're the
+    same. Answers are compared as strings, the way they're printed.
+    """
+    value = str(answer)
+    with contextlib.closing(connect()) as db, db:
+        inserted = db.execute(
+            "INSERT OR IGNORE INTO answers (input, part, day, answer) "
+            "VALUES (?, ?, ?, ?)",
+            (input_sha256, part, day, value),
+        ).rowcount
+        (expected,) = db.execute(
+            "SELECT answer FROM answers WHERE input = ? AND part = ?",
+            (input_sha256, part),
+        ).fetchone()
+    if expected != value:
+        raise WrongAnswer(
+            f"{day} {part} answered {value}, but {expected} was recorded for this "
+            f"input ({input_sha256[:12]})"
+        )
+    return "recorded" if inserted else "matched"
+
+
+def forget_answers(day: str | None = None) -> int:
+    """
+    Delete the recorded answers for `day` (like "2024/11"), or for every day,
+    returning how many there were.
+    """
+    if not store_path().exists():
+        return 0
+    with contextlib.closing(connect()) as db, db:
+        if day is None:
+            return db.execute("DELETE FROM answers").rowcount
+        return db.execute("DELETE FROM answers WHERE day = ?", (day,)).rowcount
+
+
+def format_check(answer: Any, check: Check | None) -> str:
+    if answer is None:
+        return ""
+    if check == "recorded":
+        return f"{answer} (new)"
+    if check == "matched":
+        return f"{answer} ✓"
+    return str(answer)
@@ -0,0 +1,174 @@
+"""
+In-process benchmarking of a single day's solution. Parsing and each part are
+timed separately, so that interpreter startup and the example checks in each
+`main.py` don't muddy the numbers. Each part's answer is checked against the
+answer store (see `aoc.answers`), so a faster solution that gets the wrong
+answer fails instead of posting a better time.
+"""
+
+import functools
+import math
+import statistics
+import time
+from pathlib import Path
+from typing import Any, Callable, TypedDict
+
+from aoc.answers import Check, check_answer, format_check, input_hash
+from aoc.days import PARTS, day_label, load_day, reset_caches
+from aoc.memory import MemoryStats, measure_memory
+from aoc.parse_cache import cached_parse
+
+
+class Stats(TypedDict):
+    runs: int
+    min: float
+    median: float
+    p95: float
+
+
+class StepResult(TypedDict):
+    step: str
+    answer: Any
+    stats: Stats
+    # How the answer compared with the answer store (None for parsing).
+    check: Check | None
+    # Only measured when asked for, since tracing allocations is slow.
+    memory: MemoryStats | None
+
+
+def summarize(samples: list[float]) -> Stats:
+    """
+    Summarize a list of timings (in seconds). The 95th percentile uses the
+    nearest-rank method, so with fewer than 20 samples it is just the maximum.
+    """
+    ordered = sorted(samples)
+    rank = max(math.ceil(0.95 * len(ordered)), 1)
+    return {
+        "runs": len(ordered),
+        "min": ordered[0],
+        "median": statistics.median(ordered),
+        "p95": ordered[rank - 1],
+    }
+
+
+def time_repeated(
+    fn: Callable[[], Any],
+    repeat: int,
+    warmup: int,
+    before_each: Callable[[], None] | None = None,
+) -> tuple[Any, list[float]]:
+    """
+    Call `fn` `warmup` times without recording anything, then `repeat` more
+    times, timing each call. `before_each` runs (untimed) ahead of every call.
+    Returns the result of the final call along with the recorded timings.
+    """
+    result: Any = None
+    samples: list[float] = []
+    for iteration in range(warmup + repeat):
+        if before_each is not None:
+            before_each()
+        start = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - start
+        if iteration >= warmup:
+            samples.append(elapsed)
+    return result, samples
+
+
+def bench_day(
+    year: int,
+    day: int,
+    path: Path,
+    repeat: int = 10,
+    warmup: int = 2,
+    cache: bool = False,
+    memory: bool = False,
+) -> list[StepResult]:
+    """
+    Benchmark parsing and both parts of a day's solution against the input at
+    `path`. Memoized functions in the solution are cleared before every call,
+    so each repetition is a full solve rather than a cache lookup.
+
+    With `cache`, the input is parsed through the parsed input cache (see
+    `aoc.parse_cache`), so the parse step times loading a cached entry.
+
+    With `memory`, each step is run once more after it's timed, with its
+    allocations traced (see `aoc.memory`).
+
+    Raises a `WrongAnswer` if a part's answer doesn't match the one recorded
+    for this input.
+    """
+    if repeat < 1:
+        raise ValueError("Need at least one timed repetition")
+
+    module = load_day(year, day)
+    text = path.read_text()
+    label, input_sha256 = day_label(year, day), input_hash(text)
+
+    def reset() -> None:
+        reset_caches(module)
+
+    results: list[StepResult] = []
+    if cache:
+        # Make sure the entry exists, so that every timed run is a hit.
+        cached_parse(module, text)
+        parse = functools.partial(cached_parse, module, text)
+    else:
+        parse = functools.partial(module.parse, text)
+    parsed, samples = time_repeated(parse, repeat, warmup)
+    memory_stats = measure_memory(parse)[1] if memory else None
+    results.append(
+        {
+            "step": "parse",
+            "answer": None,
+            "stats": summarize(samples),
+            "check": None,
+            "memory": memory_stats,
+        }
+    )
+
+    for part in PARTS:
+        solve = getattr(module, part, None)
+        if solve is None:
+            continue
+        run = functools.partial(solve, parsed)
+        answer, samples = time_repeated(run, repeat, warmup, reset)
+        check = check_answer(label, input_sha256, part, answer)
+        memory_stats = None
+        if memory:
+            reset()
+            memory_stats = measure_memory(run)[1]
+        results.append(
+            {
+                "step": part,
+                "answer": answer,
+                "stats": summarize(samples),
+                "check": check,
+                "memory": memory_stats,
+            }
+        )
+
+    return results
+
+
+def format_duration(seconds: float) -> str:
+    if seconds >= 1:
+        return f"{seconds:.3f} s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.3f} ms"
+    return f"{seconds * 1e6:.1f} µs"
+
+
+def format_results(results: list[StepResult]) -> str:
+    lines = [f"{'step':<8}{'min':>12}{'median':>12}{'p95':>12}  answer"]
+    for result in results:
+        stats = result["stats"]
+        answer = format_check(result["answer"], result["check"])
+        lines.append(
+            f"{result['step']:<8}"
+            f"{format_duration(stats['min']):>12}"
+            f"{format_duration(stats['median']):>12}"
+            f"{format_duration(stats['p95']):>12}"
+            f"  {answer}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,123 @@
+"""
+Discovery and loading of the individual puzzle solutions. Every day lives in
+its own `{year}/{day}/main.py` and exposes the same small surface:
+
+- `parse(text)` turns the raw puzzle input into whatever structure the day
+  works with.
+- `part1(parsed)` and `part2(parsed)` compute the answers from that structure.
+  Neither is allowed to mutate `parsed`, so the same parsed input can be reused
+  across parts and repetitions. (Day 25 only has a first part.)
+
+Most days also have a `generate.py` next to the solution, which produces
+synthetic inputs of any size for the scaling benchmark.
+
+The modules are imported by path, since their directories aren't valid package
+names.
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+from types import ModuleType
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+PARTS = ("part1", "part2")
+
+type DayKey = tuple[int, int]
+
+
+def day_label(year: int, day: int) -> str:
+    return f"{year}/{day}"
+
+
+def day_dir(year: int, day: int) -> Path:
+    return REPO_ROOT / str(year) / str(day)
+
+
+def discover_days(years: list[int] | None = None) -> list[DayKey]:
+    """
+    Find every (year, day) pair with a Python solution, in chronological order.
+    If no years are given, all years with Python solutions are included (2023
+    is TypeScript, so it never shows up here).
+    """
+    days: list[DayKey] = []
+    for year_dir in REPO_ROOT.iterdir():
+        if not year_dir.name.isdigit():
+            continue
+        year = int(year_dir.name)
+        if years is not None and year not in years:
+            continue
+        for main in year_dir.glob("*/main.py"):
+            if main.parent.name.isdigit():
+                days.append((year, int(main.parent.name)))
+    return sorted(days)
+
+
+def module_name(year: int, day: int, script: str = "main") -> str:
+    name = f"aoc_{year}_{day:02d}"
+    return name if script == "main" else f"{name}_{script}"
+
+
+def load_script(year: int, day: int, script: str) -> ModuleType:
+    """
+    Import one of the scripts in a day's directory by path. The module is
+    registered in `sys.modules` so that anything it sends to a process pool
+    can be pickled by reference.
+    """
+    name = module_name(year, day, script)
+    if name in sys.modules:
+        return sys.modules[name]
+
+    path = day_dir(year, day) / f"{script}.py"
+    if not path.exists():
+        raise ValueError(f"No {script}.py found for {year} day {day}")
+    return import_path(name, path)
+
+
+def import_path(name: str, path: Path) -> ModuleType:
+    """
+    Import the module at `path` as `name`, registering it in `sys.modules`.
+    """
+    spec = importlib.util.spec_from_file_location(name, path)
+    if spec is None or spec.loader is None:
+        raise ValueError(f"Unable to load {path}")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[name]
+        raise
+    return module
+
+
+def load_day(year: int, day: int) -> ModuleType:
+    """
+    Import the solution module for the given day.
+    """
+    return load_script(year, day, "main")
+
+
+def load_generator(year: int, day: int) -> ModuleType:
+    """
+    Import the synthetic input generator for the given day. Each `generate.py`
+    exposes `generate(size, seed=0)`, returning puzzle input text, along with
+    `REAL_SIZE`, the `size` that roughly matches a real puzzle input.
+    """
+    return load_script(year, day, "generate")
+
+
+def input_path(year: int, day: int) -> Path:
+    return day_dir(year, day) / "input.txt"
+
+
+def reset_caches(module: ModuleType) -> None:
+    """
+    Clear any memoized functions defined at the top level of a solution module,
+    so that a repeated run does the same work as the first one did.
+    """
+    for value in vars(module).values():
+        cache_clear = getattr(value, "cache_clear", None)
+        if callable(cache_clear):
+            cache_clear()
@@ -0,0 +1,209 @@
+"""
+One way for every day to farm out its independent pieces of work (a check per
+candidate obstacle, a solve per machine, a sequence per buyer), whatever runs
+them. `parallel_map(fn, items)` is `[fn(item) for item in items]`, run on one
+of these backends:
+
+- `serial`: in the calling thread, one after another.
+- `threads`: on a thread pool. Under the GIL this only helps work that waits
+  on something else (like PuLP, which hands each solve to a CBC subprocess).
+  Each thread gets its own copy of `shared` (see below).
+- `processes`: on a process pool, with the items sent over in chunks so a
+  worker makes one round trip per chunk rather than one per item. Anything
+  every item needs (`shared`, like the map all of the obstacle checks walk)
+  is handed to each worker once, when it starts, instead of being pickled
+  along with every item. Workers start however the platform starts them by
+  default, and import the solution `fn` comes from by path if they have to.
+- `free-threaded`: threads, on a free-threaded build of CPython with the GIL
+  disabled, where they run Python code in parallel without any of the
+  pickling. Where the GIL is enabled, this falls back to processes.
+- `auto`: free-threaded threads if the GIL is disabled, processes if there's
+  more than one core, and serial otherwise. Starting a process pool takes a
+  while, so the items get a head start in the calling thread, and only those
+  still left after it go to a pool. Work that's quick all told never starts
+  one.
+
+The backend comes from the `AOC_EXECUTOR` environment variable (or the
+`--executor` flag of `bench`, `scale`, `run-all` and `regress`, which sets it),
+and defaults to `auto`. `AOC_WORKERS` caps the number of workers, which
+otherwise is one per core.
+"""
+
+import copy
+import functools
+import importlib
+import math
+import os
+import pickle
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Literal, cast
+
+from aoc.days import import_path
+
+type Backend = Literal["serial", "threads", "processes", "free-threaded", "auto"]
+
+BACKENDS: tuple[Backend, ...] = (
+    "auto",
+    "serial",
+    "threads",
+    "processes",
+    "free-threaded",
+)
+
+# How many chunks to split the items into per worker. More than one evens out
+# chunks that take longer than others.
+CHUNKS_PER_WORKER = 4
+
+# How long `auto` works through the items in the calling thread, in seconds,
+# before handing the rest to a process pool. That's about what starting one
+# costs, so farming out work is never much slower than not.
+SERIAL_HEAD_START = 0.1
+
+# The state shared by every item, in a process pool's worker.
+_shared: Any = None
+# Each thread pool worker's own copy of it.
+_thread_state = threading.local()
+
+
+def free_threading_available() -> bool:
+    # `sys._is_gil_enabled` only exists from Python 3.13 on.
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+def num_workers() -> int:
+    workers = os.environ.get("AOC_WORKERS")
+    if workers:
+        return max(int(workers), 1)
+    return os.cpu_count() or 1
+
+
+def requested_backend(backend: str | None = None) -> str:
+    """
+    The backend asked for: `backend` if given, else the one in `AOC_EXECUTOR`.
+    """
+    return backend or os.environ.get("AOC_EXECUTOR") or "auto"
+
+
+def resolve_backend(backend: str | None = None) -> Backend:
+    """
+    The backend to actually run on: the one requested (see `requested_backend`),
+    with `auto` and `free-threaded` settled for this interpreter and machine.
+    """
+    backend = requested_backend(backend)
+    if backend not in BACKENDS:
+        raise ValueError(
+            f"Unknown executor {backend!r}; expected one of {', '.join(BACKENDS)}"
+        )
+    if backend == "auto":
+        if free_threading_available():
+            return "threads"
+        return "processes" if num_workers() > 1 else "serial"
+    if backend == "free-threaded":
+        return "threads" if free_threading_available() else "processes"
+    return cast(Backend, backend)
+
+
+def _init_worker(module: tuple[str, str | None], shared: bytes) -> None:
+    global _shared
+    # A worker that wasn't forked has to import the module `fn` is from itself
+    # before anything from it can be unpickled, by path if it's a solution.
+    name, path = module
+    if name not in sys.modules:
+        try:
+            importlib.import_module(name)
+        except ModuleNotFoundError:
+            if path is None:
+                raise
+            import_path(name, Path(path))
+    _shared = pickle.loads(shared)
+
+
+def _init_thread(shared: Any) -> None:
+    _thread_state.shared = copy.deepcopy(shared)
+
+
+def _run_in_thread[R](fn: Callable[..., R], item: Any) -> R:
+    return fn(_thread_state.shared, item)
+
+
+def _run_chunk[T, R](fn: Callable[..., R], chunk: list[T], has_shared: bool) -> list[R]:
+    if has_shared:
+        return [fn(_shared, item) for item in chunk]
+    return [fn(item) for item in chunk]
+
+
+def process_pool(workers: int, fn: Callable[..., Any], shared: Any) -> Executor:
+    # `shared` is pickled up front, so that it's only unpickled once the
+    # worker has imported `fn`'s module, which it may need.
+    module = sys.modules.get(fn.__module__)
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(
+            (fn.__module__, getattr(module, "__file__", None)),
+            pickle.dumps(shared),
+        ),
+    )
+
+
+def parallel_map[T, R](
+    fn: Callable[..., R],
+    items: Iterable[T],
+    shared: Any = None,
+    backend: str | None = None,
+) -> list[R]:
+    """
+    Call `fn` on every item, returning the results in the same order as the
+    items. With `shared`, it's called as `fn(shared, item)` instead. `fn` can
+    use `shared` as scratch space while it works on an item, as long as it
+    puts it back the way it was: each thread or process in a pool works on
+    its own copy, one item at a time. For the process backend, `fn`, the
+    items and their results all have to be picklable, so `fn` should be a
+    module-level function rather than a lambda or a closure.
+    """
+    items = list(items)
+    has_shared = shared is not None
+    automatic = requested_backend(backend) == "auto"
+    backend = resolve_backend(backend)
+    workers = min(num_workers(), len(items))
+
+    def call(item: T) -> R:
+        return fn(shared, item) if has_shared else fn(item)
+
+    if backend == "serial" or workers <= 1:
+        return [call(item) for item in items]
+
+    done: list[R] = []
+    if backend == "processes" and automatic:
+        deadline = time.perf_counter() + SERIAL_HEAD_START
+        for item in items:
+            done.append(call(item))
+            if time.perf_counter() > deadline:
+                break
+        items = items[len(done) :]
+        workers = min(workers, len(items))
+        if workers <= 1:
+            return done + [call(item) for item in items]
+
+    if backend == "threads":
+        if not has_shared:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                return list(executor.map(fn, items))
+        with ThreadPoolExecutor(
+            max_workers=workers, initializer=_init_thread, initargs=(shared,)
+        ) as executor:
+            return list(executor.map(functools.partial(_run_in_thread, fn), items))
+
+    size = math.ceil(len(items) / (workers * CHUNKS_PER_WORKER))
+    chunks = [items[start : start + size] for start in range(0, len(items), size)]
+    with process_pool(workers, fn, shared) as executor:
+        results = executor.map(
+            _run_chunk, [fn] * len(chunks), chunks, [has_shared] * len(chunks)
+        )
+        return done + [result for chunk in results for result in chunk]
@@ -0,0 +1,204 @@
+"""
+Sorting lists of integers too big to fit in memory, for the puzzles that sort
+their input and then walk it in order.
+
+Values are added a chunk at a time to a `RunWriter`, which sorts them in runs
+of a fixed length and spills each run to a file of raw int64s. `merge_runs`
+then reads the runs back a block at a time and merges them into one sorted
+stream of blocks, which can be done as many times as needed. Rather than
+picking values one at a time off a heap, each step finds the smallest of the
+runs' last buffered values: nothing still on disk can be below it, so
+everything buffered up to it is merged and handed out in one go with NumPy.
+With too many runs to buffer a block from each at once (or to keep open at
+once), `reduce_runs` merges groups of them into longer runs first.
+
+Either way, memory use is set by the run and block lengths, not the size of
+the input: at most one run is held while writing, and one block per run
+(plus what's left of the previous one) while merging. The run files go
+wherever `tempfile` puts things (see `TMPDIR`), or in a given directory.
+"""
+
+import contextlib
+import itertools
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO
+
+from aoc.imports import lazy_import
+
+if TYPE_CHECKING:
+    import numpy as np
+else:
+    np = lazy_import("numpy")
+
+# The most runs merged at once, which is also how many files are open at once.
+MAX_FAN_IN = 64
+
+# A block of values, out of a stream of them.
+type Block = np.ndarray
+
+
+class RunWriter:
+    directory: Path
+    run_length: int
+    # What the run files are named for, so several writers can share a
+    # directory.
+    name: str
+    paths: list[Path]
+    # The values added since the last run was written.
+    pending: list["np.ndarray"]
+    num_pending: int
+
+    def __init__(self, directory: Path, run_length: int, name: str = "run") -> None:
+        if run_length < 1:
+            raise ValueError("Runs need to hold at least one value")
+        self.directory = directory
+        self.run_length = run_length
+        self.name = name
+        self.paths = []
+        self.pending = []
+        self.num_pending = 0
+
+    def add(self, values: "np.ndarray") -> None:
+        values = np.asarray(values, dtype=np.int64)
+        while len(values):
+            take = min(self.run_length - self.num_pending, len(values))
+            self.pending.append(values[:take])
+            self.num_pending += take
+            values = values[take:]
+            if self.num_pending == self.run_length:
+                self.spill()
+
+    def spill(self) -> None:
+        if not self.num_pending:
+            return
+        run = np.concatenate(self.pending)
+        run.sort()
+        path = self.directory / f"{self.name}-{len(self.paths)}.bin"
+        run.tofile(path)
+        self.paths.append(path)
+        self.pending = []
+        self.num_pending = 0
+
+    def finish(self) -> list[Path]:
+        """
+        Write out whatever is left, returning the paths of every run.
+        """
+        self.spill()
+        return self.paths
+
+
+def read_blocks(file: BinaryIO, block_length: int) -> Iterator[Block]:
+    while len(block := np.fromfile(file, dtype=np.int64, count=block_length)):
+        yield block
+
+
+def reduce_runs(
+    paths: list[Path], block_length: int, fan_in: int = MAX_FAN_IN
+) -> list[Path]:
+    """
+    Merge groups of run files into longer runs (next to the originals, which
+    are deleted), until there are no more than `fan_in` of them to merge in
+    one pass. Returns the runs that are left.
+    """
+    if fan_in < 2:
+        raise ValueError("Need to merge at least two runs at a time")
+    while len(paths) > fan_in:
+        merged: list[Path] = []
+        for group in itertools.batched(paths, fan_in):
+            # Named for the group's first run, so it's as unique as that is.
+            path = group[0].with_name(f"merged-{group[0].name}")
+            with open(path, "wb") as file:
+                for block in merge_runs(list(group), block_length):
+                    block.tofile(file)
+            merged.append(path)
+            # The runs are in the merged one now, so they don't need the disk.
+            for run in group:
+                run.unlink()
+        paths = merged
+    return paths
+
+
+def merge_runs(paths: list[Path], block_length: int) -> Iterator[Block]:
+    """
+    Merge sorted run files into one sorted stream, in blocks of values, reading
+    each run `block_length` values at a time. Every run is open at once, so
+    there shouldn't be more than `reduce_runs` leaves.
+    """
+    with contextlib.ExitStack() as stack:
+        files = [stack.enter_context(open(path, "rb")) for path in paths]
+        runs = [read_blocks(file, block_length) for file in files]
+        buffers = [next(run, None) for run in runs]
+        while True:
+            live = [
+                (index, buffer)
+                for index, buffer in enumerate(buffers)
+                if buffer is not None
+            ]
+            if not live:
+                return
+            # No run can have anything below its last buffered value still on
+            # disk, so everything up to the smallest of those is final.
+            bound = min(buffer[-1] for _, buffer in live)
+            taken: list[np.ndarray] = []
+            for index, buffer in live:
+                end = int(np.searchsorted(buffer, bound, side="right"))
+                taken.append(buffer[:end])
+                if end < len(buffer):
+                    buffers[index] = buffer[end:]
+                else:
+                    buffers[index] = next(runs[index], None)
+            block = np.concatenate(taken)
+            block.sort(kind="stable")
+            yield block
+
+
+def lockstep(
+    first: Iterable[Block], second: Iterable[Block]
+) -> Iterator[tuple[Block, Block]]:
+    """
+    Pair up two streams of blocks by position: each pair holds the next
+    values of both, the same number from each, whatever sizes the blocks
+    come in. Stops at the end of the shorter stream.
+    """
+    first_blocks, second_blocks = iter(first), iter(second)
+    a = b = np.zeros(0, dtype=np.int64)
+    while True:
+        if not len(a) and (a := next(first_blocks, None)) is None:
+            return
+        if not len(b) and (b := next(second_blocks, None)) is None:
+            return
+        length = min(len(a), len(b))
+        yield a[:length], b[:length]
+        a, b = a[length:], b[length:]
+
+
+def group_counts(blocks: Iterable[Block]) -> Iterator[tuple[Block, Block]]:
+    """
+    Turn a sorted stream of blocks into a stream of distinct values and how
+    many times each comes up. A value that spans blocks is only handed out
+    once, with its full count.
+    """
+    carry_value: int | None = None
+    carry_count = 0
+    for block in blocks:
+        if not len(block):
+            continue
+        starts = np.flatnonzero(np.diff(block)) + 1
+        values = block[np.concatenate(([0], starts))]
+        counts = np.diff(np.concatenate(([0], starts, [len(block)])))
+        if carry_value is not None:
+            if values[0] == carry_value:
+                counts[0] += carry_count
+            else:
+                values = np.concatenate(([carry_value], values))
+                counts = np.concatenate(([carry_count], counts))
+        # The last value may go on into the next block, so it's held back.
+        carry_value, carry_count = int(values[-1]), int(counts[-1])
+        if len(values) > 1:
+            yield values[:-1], counts[:-1]
+    if carry_value is not None:
+        yield (
+            np.array([carry_value], dtype=np.int64),
+            np.array([carry_count], dtype=np.int64),
+        )
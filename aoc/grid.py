@@ -0,0 +1,407 @@
+"""
+A two-dimensional grid of characters, for the many puzzles that take place on a
+map. Cells are stored one byte each in a `uint8` NumPy array rather than as a
+list of lists of one-character strings, which takes about 1/60th of the memory
+and lets whole-grid questions ("which cells have at least four neighboring
+rolls?", "where does XMAS read out, in any direction?") be answered with array
+operations instead of Python loops.
+
+Positions are `(row, col)` tuples, like everywhere else in the solutions.
+"""
+
+from collections.abc import Iterator
+from typing import Self
+
+import numpy as np
+import numpy.typing as npt
+
+type Position = tuple[int, int]
+type Cells = npt.NDArray[np.uint8]
+type Mask = npt.NDArray[np.bool_]
+
+# Offsets to the four orthogonal neighbors of a cell, clockwise from above.
+ORTHOGONAL: tuple[Position, ...] = ((-1, 0), (0, 1), (1, 0), (0, -1))
+# Offsets to all eight neighbors of a cell, clockwise from above.
+ALL_DIRECTIONS: tuple[Position, ...] = (
+    (-1, 0),
+    (-1, 1),
+    (0, 1),
+    (1, 1),
+    (1, 0),
+    (1, -1),
+    (0, -1),
+    (-1, -1),
+)
+
+# How many cells `word_masks` matches words against at once. Working through
+# the grid a band of rows at a time keeps the masks it combines small enough
+# to stay in cache, and its memory use from growing with the grid.
+BAND_CELLS = 1 << 18
+
+
+def shift[T: np.generic](
+    values: npt.NDArray[T], delta_row: int, delta_col: int, fill: object
+) -> npt.NDArray[T]:
+    """
+    Returns an array the same shape as `values`, where each entry holds the
+    value `delta_row` rows and `delta_col` columns away from it in `values`,
+    or `fill` if that would be out of bounds. For example, with a delta of
+    (-1, 0), every entry holds the value of the cell above it.
+    """
+    height, width = values.shape
+    shifted = np.full_like(values, fill)
+    if abs(delta_row) >= height or abs(delta_col) >= width:
+        return shifted
+    shifted[
+        max(-delta_row, 0) : height - max(delta_row, 0),
+        max(-delta_col, 0) : width - max(delta_col, 0),
+    ] = values[
+        max(delta_row, 0) : height - max(-delta_row, 0),
+        max(delta_col, 0) : width - max(-delta_col, 0),
+    ]
+    return shifted
+
+
+def all_of(masks: list[Mask], out: Mask) -> Mask:
+    """
+    AND the masks together into `out`, which must be the same shape as them.
+    """
+    if len(masks) == 1:
+        np.copyto(out, masks[0])
+    else:
+        np.logical_and(masks[0], masks[1], out=out)
+        for mask in masks[2:]:
+            out &= mask
+    return out
+
+
+class Grid:
+    """
+    A rectangular grid of ASCII characters.
+
+    A grid can be padded with a border of some character (see `padded`), which
+    is useful for removing bounds checks: a guard walking off the map just
+    steps onto a border cell instead. Padding doesn't change the coordinates
+    of the original cells, so `grid.padded("#")[-1, 0]` is the border cell
+    just above `grid[0, 0]`, and `height`, `width`, `find` and friends all
+    describe the grid without its border.
+    """
+
+    cells: Cells
+    # How many cells of border surround the grid on each side.
+    border: int
+    # Indexing a memoryview of the cells is a little over twice as fast as
+    # indexing the array itself, which adds up in search loops that look at
+    # one cell at a time.
+    _view: memoryview
+
+    def __init__(self, cells: Cells, border: int = 0) -> None:
+        if cells.ndim != 2:
+            raise ValueError(f"Expected a 2D array of cells, got {cells.ndim}D")
+        self.cells = cells
+        self.border = border
+        self._view = memoryview(cells)
+
+    def __getstate__(self) -> tuple[Cells, int]:
+        return self.cells, self.border
+
+    def __setstate__(self, state: tuple[Cells, int]) -> None:
+        self.__init__(*state)
+
+    @classmethod
+    def from_text(cls, text: str) -> Self:
+        """
+        Build a grid from text with one row per line. Whitespace at either end
+        of a line is ignored, as are blank lines.
+        """
+        rows = [line.strip() for line in text.splitlines() if line.strip()]
+        width = len(rows[0]) if rows else 0
+        if any(len(row) != width for row in rows):
+            raise ValueError("Every row of a grid must be the same length")
+        # A bytearray gives a writable array without copying the data again.
+        data = bytearray("".join(rows), "ascii")
+        return cls(np.frombuffer(data, dtype=np.uint8).reshape(len(rows), width))
+
+    @classmethod
+    def full(cls, height: int, width: int, char: str) -> Self:
+        return cls(np.full((height, width), ord(char), dtype=np.uint8))
+
+    def to_text(self) -> str:
+        """
+        The inverse of `from_text`: one line per row, each ending in a newline.
+        The border (if any) isn't included.
+        """
+        interior = self.interior
+        newlines = np.full((interior.shape[0], 1), ord("\n"), dtype=np.uint8)
+        return np.hstack((interior, newlines)).tobytes().decode("ascii")
+
+    def __str__(self) -> str:
+        return self.to_text()
+
+    def __repr__(self) -> str:
+        return f"Grid(height={self.height}, width={self.width})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Grid):
+            return NotImplemented
+        return np.array_equal(self.interior, other.interior)
+
+    def copy(self) -> Self:
+        return type(self)(self.cells.copy(), self.border)
+
+    @property
+    def interior(self) -> Cells:
+        """
+        A view of the cells without the border.
+        """
+        if self.border == 0:
+            return self.cells
+        return self.cells[self.border : -self.border, self.border : -self.border]
+
+    @property
+    def height(self) -> int:
+        return self.cells.shape[0] - 2 * self.border
+
+    @property
+    def width(self) -> int:
+        return self.cells.shape[1] - 2 * self.border
+
+    def __getitem__(self, position: Position) -> str:
+        return chr(self._view[position[0] + self.border, position[1] + self.border])
+
+    def __setitem__(self, position: Position, char: str) -> None:
+        self.cells[position[0] + self.border, position[1] + self.border] = ord(char)
+
+    @property
+    def num_nodes(self) -> int:
+        """
+        How many node IDs the grid's cells (including the border) use. See
+        `node`.
+        """
+        return self.cells.size
+
+    def node(self, position: Position) -> int:
+        """
+        A flat integer ID for a position, for graph searches (see
+        `aoc.search`). Cells sharing a row have consecutive IDs, and the cell
+        below is `stride` IDs further on.
+        """
+        return (position[0] + self.border) * self.stride + position[1] + self.border
+
+    def position(self, node: int) -> Position:
+        """
+        The inverse of `node`.
+        """
+        row, col = divmod(node, self.stride)
+        return row - self.border, col - self.border
+
+    @property
+    def stride(self) -> int:
+        return self.cells.shape[1]
+
+    def in_bounds(self, position: Position) -> bool:
+        return 0 <= position[0] < self.height and 0 <= position[1] < self.width
+
+    def positions(self) -> list[Position]:
+        """
+        Every position in the grid, row by row.
+        """
+        return [(row, col) for row in range(self.height) for col in range(self.width)]
+
+    def neighbors(
+        self, position: Position, directions: tuple[Position, ...] = ORTHOGONAL
+    ) -> list[Position]:
+        """
+        The positions next to `position` in each of the given directions, leaving
+        out any that fall outside the grid.
+        """
+        row, col = position
+        return [
+            (row + delta_row, col + delta_col)
+            for delta_row, delta_col in directions
+            if self.in_bounds((row + delta_row, col + delta_col))
+        ]
+
+    def mask(self, chars: str) -> Mask:
+        """
+        A boolean array marking every cell holding any of the given characters.
+        """
+        codes = list(chars.encode("ascii"))
+        if len(codes) == 1:
+            return self.interior == codes[0]
+        return np.isin(self.interior, codes)
+
+    def find_all(self, char: str) -> list[Position]:
+        """
+        The positions of every cell holding `char`, row by row.
+        """
+        rows, cols = np.nonzero(self.mask(char))
+        return list(zip(rows.tolist(), cols.tolist()))
+
+    def find(self, char: str) -> Position:
+        """
+        The position of the first cell holding `char`, reading row by row.
+        Raises a ValueError if there isn't one.
+        """
+        matches = np.flatnonzero(self.mask(char))
+        if len(matches) == 0:
+            raise ValueError(f"{char!r} not found in grid")
+        row, col = divmod(int(matches[0]), self.width)
+        return row, col
+
+    def fill(self, mask: Mask, char: str) -> None:
+        """
+        Set every cell marked in `mask` (the shape of the grid) to `char`.
+        """
+        self.interior[mask] = ord(char)
+
+    def padded(self, char: str, width: int = 1) -> Self:
+        """
+        A copy of the grid with an extra `width` cells of `char` around every
+        side. Positions in the copy are the same as in the original.
+        """
+        cells = np.pad(self.cells, width, constant_values=ord(char))
+        return type(self)(cells, self.border + width)
+
+    def shifted(self, delta_row: int, delta_col: int, fill: str) -> Cells:
+        """
+        For every cell in the grid, the character code of the cell `delta_row`
+        rows and `delta_col` columns away (or `fill`, beyond the edge). When
+        the border is wide enough, this is a view of the grid, not a copy.
+        """
+        if max(abs(delta_row), abs(delta_col)) <= self.border:
+            return self.cells[
+                self.border + delta_row : self.border + delta_row + self.height,
+                self.border + delta_col : self.border + delta_col + self.width,
+            ]
+        return shift(self.interior, delta_row, delta_col, ord(fill))
+
+    def count_neighbors(
+        self, char: str, directions: tuple[Position, ...] = ALL_DIRECTIONS
+    ) -> npt.NDArray[np.uint8]:
+        """
+        For every cell in the grid, how many of its neighbors in the given
+        directions hold `char`.
+        """
+        code = ord(char)
+        counts = np.zeros((self.height, self.width), dtype=np.uint8)
+        for delta_row, delta_col in directions:
+            counts += self.shifted(delta_row, delta_col, "\0") == code
+        return counts
+
+    def band_height(self, band_cells: int) -> int:
+        """
+        How many rows make up a band of about `band_cells` cells: at least one,
+        however wide the grid is, and no more than the grid has.
+        """
+        return max(min(band_cells // max(self.width, 1), self.height), 1)
+
+    def _word_bands(
+        self,
+        word: str,
+        directions: tuple[Position, ...],
+        anchor: int,
+        band_cells: int,
+    ) -> Iterator[tuple[int, int, list[tuple[Position, list[Mask]] | None]]]:
+        """
+        For each band of rows in the grid, top to bottom, the band's first row
+        and last row (exclusive), along with what `word_masks` ANDs together
+        for each direction: where the cells the word fits in start, relative
+        to the band, and the matching cells for each letter of the word, all
+        slices lined up with those cells. Directions the word doesn't fit in
+        the band in get None.
+        """
+        height, width = self.height, self.width
+        cells = self.interior
+        offsets = [index - anchor for index in range(len(word))]
+        reach = max(abs(offset) for offset in offsets)
+        band_height = self.band_height(band_cells)
+        # Where each letter is, in the rows the word can reach from a band.
+        # These are reused from band to band, since allocating arrays this big
+        # afresh for each one costs more than comparing the cells.
+        buffers = {
+            char: np.empty((min(band_height + 2 * reach, height), width), dtype=bool)
+            for char in set(word)
+        }
+        for top in range(0, height, band_height):
+            bottom = min(top + band_height, height)
+            start, end = max(top - reach, 0), min(bottom + reach, height)
+            letters = {
+                char: np.equal(cells[start:end], ord(char), out=buffer[: end - start])
+                for char, buffer in buffers.items()
+            }
+            matches: list[tuple[Position, list[Mask]] | None] = []
+            for delta_row, delta_col in directions:
+                rows = [offset * delta_row for offset in offsets]
+                cols = [offset * delta_col for offset in offsets]
+                # The cells the whole word fits in, from that direction.
+                first_row = max(top, -min(rows))
+                last_row = min(bottom, height - max(rows))
+                first_col, last_col = -min(cols), width - max(cols)
+                if first_row >= last_row or first_col >= last_col:
+                    matches.append(None)
+                    continue
+                # The same rows, counted from the start of the letters'.
+                first, last = first_row - start, last_row - start
+                slices = [
+                    letters[char][
+                        first + row : last + row, first_col + col : last_col + col
+                    ]
+                    for char, row, col in zip(word, rows, cols)
+                ]
+                matches.append(((first_row - top, first_col), slices))
+            yield top, bottom, matches
+
+    def word_masks(
+        self,
+        word: str,
+        directions: tuple[Position, ...] = ALL_DIRECTIONS,
+        anchor: int = 0,
+        band_cells: int = BAND_CELLS,
+    ) -> Iterator[list[Mask]]:
+        """
+        For each band of rows in the grid, top to bottom, a mask per direction
+        marking the cells where `word` reads out in a straight line in that
+        direction, with its `anchor`-th letter on the cell. A word can't run
+        off the edge of the grid, so no padding is needed.
+
+        Each letter is compared against the band (and the rows around it that
+        the word can reach) only once, and each direction's mask is the AND of
+        slices of those comparisons, shifted to line up with the anchor.
+        """
+        for top, bottom, matches in self._word_bands(
+            word, directions, anchor, band_cells
+        ):
+            masks: list[Mask] = []
+            for match in matches:
+                mask = np.zeros((bottom - top, self.width), dtype=bool)
+                if match is not None:
+                    (row, col), slices = match
+                    height, width = slices[0].shape
+                    all_of(slices, mask[row : row + height, col : col + width])
+                masks.append(mask)
+            yield masks
+
+    def count_word(
+        self,
+        word: str,
+        directions: tuple[Position, ...] = ALL_DIRECTIONS,
+        band_cells: int = BAND_CELLS,
+    ) -> int:
+        """
+        How many times `word` reads out in a straight line in the grid, in any
+        of the given directions.
+        """
+        # Counting doesn't need the masks lined up, so one buffer, as big as a
+        # band, does for all of them.
+        buffer = np.empty(self.band_height(band_cells) * self.width, dtype=bool)
+        total = 0
+        for _, _, matches in self._word_bands(word, directions, 0, band_cells):
+            for match in matches:
+                if match is None:
+                    continue
+                _, slices = match
+                height, width = slices[0].shape
+                fits = buffer[: height * width].reshape(height, width)
+                total += int(np.count_nonzero(all_of(slices, fits)))
+        return total
@@ -0,0 +1,141 @@
+"""
+Keeping heavy dependencies off the startup path.
+
+`lazy_import("numpy")` returns a module object straight away, but only actually
+imports the module the first time one of its attributes is used. A solution
+that only needs NumPy (or PuLP) for one part can import it lazily at the top,
+like any other import, and the other part never pays for it.
+
+`measure_imports` reports where a day's startup time goes, from the output of
+`python -X importtime`, in a fresh interpreter so nothing is already imported.
+"""
+
+import importlib.util
+import sys
+from types import ModuleType
+from typing import TypedDict
+
+# How many of the slowest top-level imports to report.
+TOP_IMPORTS = 10
+
+# Lines of `-X importtime` output look like
+# "import time:       318 |      59803 |   pulp.pulp" (times in microseconds,
+# with the name indented by how deeply nested the import was).
+IMPORT_TIME_PREFIX = "import time:"
+
+
+def lazy_import(name: str) -> ModuleType:
+    """
+    Import the module `name` lazily. If it has already been imported (lazily
+    or not), that module is returned.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+def load_now(module: ModuleType) -> ModuleType:
+    """
+    Finish loading a lazily imported module right away. Older versions of
+    Python's lazy loader aren't thread-safe, so a lazy module that's about to
+    be used from several threads at once (see `aoc.executor`) has to be loaded
+    first.
+    """
+    # Looking up any attribute loads the module.
+    module.__spec__  # noqa: B018
+    return module
+
+
+# Solutions import this module, so it keeps its own imports light too: the
+# import time report is the only thing that needs subprocess.
+subprocess = lazy_import("subprocess")
+
+
+class ImportTime(TypedDict):
+    module: str
+    # In seconds.
+    self: float
+    cumulative: float
+
+
+class ImportReport(TypedDict):
+    # The time spent importing everything, and how much of it was the
+    # interpreter's own startup (`site` and the encodings) rather than the
+    # day's imports.
+    total: float
+    interpreter: float
+    top: list[ImportTime]
+
+
+def parse_import_times(output: str) -> list[ImportTime]:
+    """
+    The top-level imports (not the ones they trigger in turn) from the output
+    of `-X importtime`, in the order they finished.
+    """
+    imports: list[ImportTime] = []
+    for line in output.splitlines():
+        if not line.startswith(IMPORT_TIME_PREFIX):
+            continue
+        self_time, cumulative, module = line.removeprefix(IMPORT_TIME_PREFIX).split("|")
+        # Skip the header line, and anything imported by another import.
+        if not self_time.strip().isdigit() or module.startswith("  "):
+            continue
+        module = module.strip()
+        imports.append(
+            {
+                "module": module,
+                "self": int(self_time) / 1e6,
+                "cumulative": int(cumulative) / 1e6,
+            }
+        )
+    return imports
+
+
+def measure_imports(year: int, day: int, top: int = TOP_IMPORTS) -> ImportReport:
+    """
+    Load a day's solution in a fresh interpreter with `-X importtime`, and
+    summarize how long its imports took.
+    """
+    code = f"from aoc.days import load_day; load_day({year}, {day})"
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    imports = parse_import_times(process.stderr)
+    interpreter = {"site", "encodings"}
+    return {
+        "total": sum(entry["cumulative"] for entry in imports),
+        "interpreter": sum(
+            entry["cumulative"] for entry in imports if entry["module"] in interpreter
+        ),
+        "top": sorted(imports, key=lambda entry: -entry["cumulative"])[:top],
+    }
+
+
+def format_imports(report: ImportReport) -> str:
+    # Not imported at the top, since aoc.bench brings in NumPy, the kind of
+    # thing solutions import this module to avoid loading.
+    from aoc.bench import format_duration
+
+    lines = [
+        f"imports took {format_duration(report['total'])} in total "
+        f"({format_duration(report['interpreter'])} of it interpreter startup)",
+        f"{'module':<32}{'cumulative':>14}{'self':>14}",
+    ]
+    for entry in report["top"]:
+        lines.append(
+            f"{entry['module']:<32}"
+            f"{format_duration(entry['cumulative']):>14}"
+            f"{format_duration(entry['self']):>14}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,236 @@
+"""
+Opt-in instrumentation of a solution's hot functions. Decorating a function with
+`@profiled` records, for every run with `AOC_PROFILE=1` set:
+
+- how many times it was called,
+- its cumulative time (from entering the outermost call to leaving it, so a
+  recursive function isn't counted once per level),
+- its self time (the cumulative time minus the time spent in other profiled
+  functions it called, including itself),
+- and the deepest it recursed.
+
+When the process exits, the numbers are written to a JSON trace in
+`.aoc-cache/profiles/` (or `AOC_PROFILE_DIR`), and summarized on stderr. Worker
+processes forked by a pool (like 2024 day 6's) write their own traces.
+
+Without `AOC_PROFILE=1`, `@profiled` returns the function untouched, so it costs
+nothing at all and can stay on the hottest loops. The switch is read once, when
+this module is imported.
+"""
+
+import functools
+import json
+import multiprocessing
+import multiprocessing.util
+import os
+import sys
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import TypedDict
+
+from aoc.days import REPO_ROOT
+
+enabled = os.environ.get("AOC_PROFILE", "") not in ("", "0")
+
+# Named groups of counts, like {"memo f": {"hits": 3, "misses": 1}}.
+type Counters = dict[str, dict[str, int]]
+
+
+class FunctionStats(TypedDict):
+    calls: int
+    # In seconds.
+    cumulative: float
+    self: float
+    max_depth: int
+
+
+class Trace(TypedDict):
+    argv: list[str]
+    pid: int
+    # Seconds from importing this module to writing the trace.
+    wall: float
+    functions: dict[str, FunctionStats]
+    counters: Counters
+
+
+stats: dict[str, FunctionStats] = {}
+# Other modules that keep counts of their own, like `aoc.memo`'s hits and
+# misses, register a function returning them (as named groups of counts) and
+# one resetting them. Unlike the function stats, these are counted whether or
+# not profiling is enabled, and only reported when it is.
+counter_sources: list[tuple[Callable[[], Counters], Callable[[], None]]] = []
+started = time.perf_counter()
+
+
+class Frame:
+    __slots__ = ("child_time", "start")
+
+    def __init__(self, start: float) -> None:
+        self.start = start
+        # Time spent in profiled functions called from this one.
+        self.child_time = 0.0
+
+
+class ThreadState(threading.local):
+    def __init__(self) -> None:
+        # The profiled calls in progress on this thread, innermost last.
+        self.frames: list[Frame] = []
+        # How many calls of each function are in progress on this thread.
+        self.depths: dict[str, int] = {}
+
+
+state = ThreadState()
+
+
+def profiled[**P, R](fn: Callable[P, R]) -> Callable[P, R]:
+    """
+    Record call counts and timings for `fn` when profiling is enabled. When it
+    isn't, `fn` is returned as is.
+    """
+    if not enabled:
+        return fn
+
+    name = f"{fn.__module__}.{fn.__qualname__}"
+
+    @functools.wraps(fn)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        frames = state.frames
+        entry = stats.get(name)
+        if entry is None:
+            entry = stats[name] = {
+                "calls": 0,
+                "cumulative": 0.0,
+                "self": 0.0,
+                "max_depth": 0,
+            }
+        depth = state.depths.get(name, 0) + 1
+        state.depths[name] = depth
+        entry["calls"] += 1
+        entry["max_depth"] = max(entry["max_depth"], depth)
+
+        frame = Frame(time.perf_counter())
+        frames.append(frame)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - frame.start
+            frames.pop()
+            if frames:
+                frames[-1].child_time += elapsed
+            entry["self"] += elapsed - frame.child_time
+            state.depths[name] = depth - 1
+            if depth == 1:
+                entry["cumulative"] += elapsed
+
+    return wrapper
+
+
+def reset() -> None:
+    global started
+    global state
+    stats.clear()
+    state = ThreadState()
+    for _, reset_counters in counter_sources:
+        reset_counters()
+    started = time.perf_counter()
+
+
+def trace() -> Trace:
+    return {
+        "argv": sys.argv,
+        "pid": os.getpid(),
+        "wall": time.perf_counter() - started,
+        "functions": {name: entry.copy() for name, entry in stats.items()},
+        "counters": collect_counters(),
+    }
+
+
+def profile_dir() -> Path:
+    directory = os.environ.get("AOC_PROFILE_DIR")
+    return Path(directory) if directory else REPO_ROOT / ".aoc-cache" / "profiles"
+
+
+def write_trace(path: Path | None = None) -> Path:
+    """
+    Write the trace so far to `path`, or to a new file named for the time and
+    process in the profile directory. Returns where it was written.
+    """
+    if path is None:
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        path = profile_dir() / f"{stamp}-{os.getpid()}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(trace(), indent=2))
+    return path
+
+
+def format_stats(functions: dict[str, FunctionStats]) -> str:
+    # Imported here rather than at the top, since the solutions import this
+    # module and most of them have no other reason to load aoc.bench (and
+    # NumPy along with it).
+    from aoc.bench import format_duration
+
+    lines = [f"{'function':<48}{'calls':>10}{'cumulative':>14}{'self':>14}{'depth':>7}"]
+    ordered = sorted(functions.items(), key=lambda item: -item[1]["self"])
+    for name, entry in ordered:
+        lines.append(
+            f"{name:<48}{entry['calls']:>10}"
+            f"{format_duration(entry['cumulative']):>14}"
+            f"{format_duration(entry['self']):>14}"
+            f"{entry['max_depth']:>7}"
+        )
+    return "\n".join(lines)
+
+
+def add_counter_source(
+    collect: Callable[[], Counters], reset: Callable[[], None]
+) -> None:
+    counter_sources.append((collect, reset))
+
+
+def collect_counters() -> Counters:
+    counters: Counters = {}
+    for collect, _ in counter_sources:
+        counters.update(collect())
+    return counters
+
+
+def format_counters(groups: Counters) -> str:
+    return "\n".join(
+        f"{name}: " + ", ".join(f"{count} {key}" for key, count in group.items())
+        for name, group in groups.items()
+    )
+
+
+def write_trace_at_exit() -> None:
+    counters = collect_counters()
+    if not stats and not any(any(group.values()) for group in counters.values()):
+        return
+    path = write_trace()
+    # Pool workers only write their traces; one summary per run is plenty.
+    if multiprocessing.parent_process() is None:
+        print(f"Profile written to {path}", file=sys.stderr)
+        if stats:
+            print(format_stats(stats), file=sys.stderr)
+        if counters:
+            print(format_counters(counters), file=sys.stderr)
+
+
+def start_tracing(_: object = None) -> None:
+    """
+    Start a fresh trace for this process, written out when it exits.
+    """
+    reset()
+    # A multiprocessing finalizer runs both when this process exits and when a
+    # worker process does (which skips plain atexit handlers).
+    multiprocessing.util.Finalize(None, write_trace_at_exit, exitpriority=0)
+
+
+if enabled:
+    start_tracing()
+    # Worker processes forked by a pool drop their parent's finalizers, and
+    # would otherwise report the parent's calls alongside their own, so each
+    # starts a trace of its own. (The function doubles as the object the hook
+    # is registered under, which only has to be weak-referenceable.)
+    multiprocessing.util.register_after_fork(start_tracing, start_tracing)
@@ -0,0 +1,110 @@
+"""
+Sets of integers stored as sorted, disjoint, inclusive ranges, for the puzzles
+that test IDs against lists of ranges.
+
+However the ranges come in (overlapping, touching, in any order), they are
+merged once up front and kept in two parallel int64 arrays of starts and ends,
+like `aoc.search`'s distances. That makes testing a value a binary search over
+the starts, and testing a whole NumPy array of values at once a single
+`searchsorted`, so checking many IDs against many ranges is a sort and a sweep
+rather than a loop over every pair. An intersection walks the two sorted
+lists of ranges together in one pass, and a union just merges them again.
+"""
+
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING
+
+from aoc.imports import lazy_import
+
+if TYPE_CHECKING:
+    import numpy as np
+else:
+    # Only batch lookups need NumPy.
+    np = lazy_import("numpy")
+
+# An inclusive range of integers, from start to end.
+type Interval = tuple[int, int]
+
+
+class IntervalSet:
+    starts: array
+    # The end of each interval, which is part of it.
+    ends: array
+
+    def __init__(self, intervals: Iterable[Interval] = ()) -> None:
+        self.starts = array("q")
+        self.ends = array("q")
+        for start, end in sorted(intervals):
+            if start > end:
+                raise ValueError(f"Interval {start}-{end} ends before it starts")
+            # Intervals that overlap or touch the last one are merged into it.
+            if self.ends and start <= self.ends[-1] + 1:
+                self.ends[-1] = max(self.ends[-1], end)
+            else:
+                self.starts.append(start)
+                self.ends.append(end)
+
+    def __len__(self) -> int:
+        """
+        The number of (merged) intervals. See `total_length` for the number of
+        integers in them.
+        """
+        return len(self.starts)
+
+    def __iter__(self) -> Iterator[Interval]:
+        return zip(self.starts, self.ends)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+        return self.starts == other.starts and self.ends == other.ends
+
+    def __repr__(self) -> str:
+        return f"IntervalSet({list(self)})"
+
+    def __contains__(self, value: int) -> bool:
+        # The last interval starting at or before the value is the only one it
+        # can be in.
+        index = bisect_right(self.starts, value) - 1
+        return index >= 0 and value <= self.ends[index]
+
+    def contains_many(self, values: "np.ndarray") -> "np.ndarray":
+        """
+        Whether each of `values` is in the set, as a boolean array.
+        """
+        starts = np.frombuffer(self.starts, dtype=np.int64)
+        ends = np.frombuffer(self.ends, dtype=np.int64)
+        values = np.asarray(values, dtype=np.int64)
+        if not len(starts):
+            return np.zeros(values.shape, dtype=bool)
+        indexes = np.searchsorted(starts, values, side="right") - 1
+        return (indexes >= 0) & (values <= ends[np.maximum(indexes, 0)])
+
+    def total_length(self) -> int:
+        """
+        The number of integers in the set.
+        """
+        return sum(self.ends) - sum(self.starts) + len(self)
+
+    def union(self, other: "IntervalSet") -> "IntervalSet":
+        return IntervalSet([*self, *other])
+
+    def intersection(self, other: "IntervalSet") -> "IntervalSet":
+        intervals: list[Interval] = []
+        index = other_index = 0
+        while index < len(self) and other_index < len(other):
+            start = max(self.starts[index], other.starts[other_index])
+            end = min(self.ends[index], other.ends[other_index])
+            if start <= end:
+                intervals.append((start, end))
+            # Whichever interval ends first can't overlap anything else.
+            if self.ends[index] < other.ends[other_index]:
+                index += 1
+            else:
+                other_index += 1
+        return IntervalSet(intervals)
+
+    __or__ = union
+    __and__ = intersection
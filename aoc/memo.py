@@ -0,0 +1,190 @@
+"""
+Memoization for the recursive solutions, in place of `functools.cache`.
+
+`@memo` works like `@cache` (and is just as fast, since unless asked otherwise
+it *is* `functools.lru_cache` underneath), with a few additions:
+
+- `maxsize` bounds how many results are kept, evicting either the least
+  recently used entry (`policy="lru"`) or the oldest one (`policy="fifo"`).
+- Every memoized function is registered, so `input_scope()` can clear all of
+  them once a puzzle input is done with. Otherwise, entries from the example
+  input stay alive (and keep growing) while the real input runs, and a long
+  batch run over many inputs never lets go of any of them.
+- Hits, misses and evictions are reported in profiles (see `aoc.instrument`)
+  next to the timings. Unlike `functools.cache`'s statistics, the counts carry
+  on across `cache_clear()`, since benchmarks clear caches between every
+  repetition. Memoized functions that are created on every call (like a helper
+  closure) share one set of counts between them, but should clear their cache
+  before they go out of scope for their counts to be kept.
+- `@memo(persist=True)` keeps results across runs, in the on-disk store in
+  `aoc.memo_store`, when `AOC_MEMO_STORE=1` is set. Without it, such functions
+  are memoized in memory like any other. (The switch is read once, when this
+  module is imported.)
+"""
+
+import contextlib
+import functools
+import os
+import weakref
+from collections.abc import Callable, Iterator
+from typing import Any, Literal, Protocol
+
+from aoc import instrument
+
+persist_enabled = os.environ.get("AOC_MEMO_STORE", "") not in ("", "0")
+
+type Policy = Literal["lru", "fifo"]
+type Counts = dict[str, int]
+
+
+class Memoized(Protocol):
+    def __call__(self, *args: Any, **kwargs: Any) -> Any: ...
+    def cache_info(self) -> functools._CacheInfo: ...
+    def cache_clear(self) -> None: ...
+
+
+class FifoCache:
+    """
+    A bounded cache that evicts the oldest entry first, no matter how often it
+    has been used since. It quacks like `functools.lru_cache`'s wrapper, but is
+    written in Python, so it's slower on hits.
+    """
+
+    def __init__(self, fn: Callable[..., Any], maxsize: int) -> None:
+        functools.update_wrapper(self, fn)
+        self.fn = fn
+        self.maxsize = maxsize
+        # Dicts keep their keys in insertion order, oldest first.
+        self.cache: dict[Any, Any] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        key = args if not kwargs else (*args, FifoCache, *kwargs.items())
+        try:
+            result = self.cache[key]
+        except KeyError:
+            pass
+        else:
+            self.hits += 1
+            return result
+        self.misses += 1
+        result = self.fn(*args, **kwargs)
+        if key not in self.cache and len(self.cache) >= self.maxsize:
+            del self.cache[next(iter(self.cache))]
+        self.cache[key] = result
+        return result
+
+    def cache_info(self) -> functools._CacheInfo:
+        return functools._CacheInfo(
+            self.hits, self.misses, self.maxsize, len(self.cache)
+        )
+
+    def cache_clear(self) -> None:
+        self.cache.clear()
+        self.hits = self.misses = 0
+
+
+# Every memoized function that's still alive, for `input_scope` to clear and
+# `collect_counts` to count.
+registry: weakref.WeakSet[Any] = weakref.WeakSet()
+# Counts from caches that have since been cleared, by function name.
+banked: dict[str, Counts] = {}
+
+
+def current_counts(memoized: Memoized) -> Counts:
+    """
+    The counts for a memoized function since its cache was last cleared. Every
+    miss adds an entry, so any entries missing from the cache were evicted.
+    """
+    info = memoized.cache_info()
+    evictions = 0 if info.maxsize is None else max(info.misses - info.currsize, 0)
+    return {"hits": info.hits, "misses": info.misses, "evictions": evictions}
+
+
+def add_counts(total: Counts, counts: Counts) -> None:
+    for key, count in counts.items():
+        total[key] = total.get(key, 0) + count
+
+
+def memo(
+    fn: Callable[..., Any] | None = None,
+    *,
+    maxsize: int | None = None,
+    policy: Policy = "lru",
+    persist: bool = False,
+) -> Any:
+    """
+    Memoize `fn`. Use it bare, as `@memo`, to keep every result (until the
+    cache is cleared), or as `@memo(maxsize=1024)` to keep only so many.
+    `persist=True` stores every result on disk too, when that's enabled, so
+    its arguments and results need to be picklable.
+    """
+    if fn is None:
+        return functools.partial(memo, maxsize=maxsize, policy=policy, persist=persist)
+    if maxsize is not None and maxsize < 1:
+        raise ValueError("maxsize must be at least 1 (or None, for no limit)")
+    if persist and maxsize is not None:
+        raise ValueError("persistent caches can't be bounded")
+
+    memoized: Any
+    if persist and persist_enabled:
+        # Only imported when it's used, since it brings in sqlite3.
+        from aoc.memo_store import PersistentCache
+
+        memoized = PersistentCache(fn)
+    elif maxsize is not None and policy == "fifo":
+        memoized = FifoCache(fn, maxsize)
+    else:
+        memoized = functools.lru_cache(maxsize)(fn)
+    name = f"{fn.__module__}.{fn.__qualname__}"
+    memoized.memo_name = name
+    clear = memoized.cache_clear
+
+    def cache_clear() -> None:
+        add_counts(banked.setdefault(name, {}), current_counts(memoized))
+        clear()
+
+    memoized.cache_clear = cache_clear
+    registry.add(memoized)
+    return memoized
+
+
+def collect_counts() -> dict[str, Counts]:
+    """
+    The hits, misses and evictions of every memoized function so far, by name.
+    """
+    totals = {name: counts.copy() for name, counts in banked.items()}
+    for memoized in list(registry):
+        add_counts(totals.setdefault(memoized.memo_name, {}), current_counts(memoized))
+    return {f"memo {name}": counts for name, counts in sorted(totals.items())}
+
+
+def reset_counts() -> None:
+    banked.clear()
+    for memoized in list(registry):
+        memoized.cache_clear()
+    banked.clear()
+
+
+instrument.add_counter_source(collect_counts, reset_counts)
+
+
+def clear_all() -> None:
+    """
+    Clear the cache of every memoized function.
+    """
+    for memoized in list(registry):
+        memoized.cache_clear()
+
+
+@contextlib.contextmanager
+def input_scope() -> Iterator[None]:
+    """
+    Scope memoized results to one puzzle input: every memoized function's
+    cache is cleared when the block exits.
+    """
+    try:
+        yield
+    finally:
+        clear_all()
@@ -0,0 +1,344 @@
+"""
+A persistent backend for `@memo(persist=True)`, so recursive counts computed in
+one run are already there at the start of the next.
+
+Entries live in one SQLite database, `.aoc-cache/memo.sqlite` (under
+`AOC_CACHE_DIR`, if it's set), in WAL mode so any number of processes (like
+`run-all`'s workers) can read it while another writes. Like the parsed input
+cache, each function's entries are versioned by the SHA-256 of the file it's
+defined in: once the solution is edited, its old entries are dropped the next
+time it's run.
+
+A persistent function still keeps its results in memory, and only looks in the
+store on a miss, so a warm run only ever reads the entries it actually needs
+(the top-level calls, usually). When the store has nothing for the function
+yet, it isn't looked in at all, and when it keeps coming up empty, it stops
+being looked in, so a cold run costs about what it would without it. New
+entries are written when the cache is cleared and when the process exits,
+rather than one at a time.
+
+Arguments and results are pickled, except that sets and frozensets (like 2024
+day 19's towel patterns, which are part of every key) are stored once, in their
+own table, and referred to by a digest of their sorted contents. That keeps the
+keys small, and the same from one process to the next, which a pickled set,
+whose order depends on string hashing, would not be.
+"""
+
+import functools
+import hashlib
+import io
+import multiprocessing.util
+import os
+import pickle
+import sqlite3
+import sys
+import weakref
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from aoc.days import REPO_ROOT
+
+# How long to wait for another process to finish writing, in seconds.
+BUSY_TIMEOUT = 30
+
+# How many more times the store can come up empty than not before a function
+# stops looking in it (until its cache is next cleared).
+STORE_MISS_LIMIT = 1024
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS versions (
+    function TEXT PRIMARY KEY,
+    source TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS entries (
+    function TEXT NOT NULL,
+    key BLOB NOT NULL,
+    value BLOB NOT NULL,
+    PRIMARY KEY (function, key)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS sets (
+    digest TEXT PRIMARY KEY,
+    data BLOB NOT NULL
+) WITHOUT ROWID;
+"""
+
+
+def store_path() -> Path:
+    root = os.environ.get("AOC_CACHE_DIR")
+    return (Path(root) if root else REPO_ROOT / ".aoc-cache") / "memo.sqlite"
+
+
+# One connection per process (a connection can't be shared with forked
+# workers), opened on first use.
+connection: sqlite3.Connection | None = None
+connection_for: tuple[int, Path] | None = None
+
+
+def connect() -> sqlite3.Connection:
+    global connection
+    global connection_for
+    path = store_path()
+    if connection is None or connection_for != (os.getpid(), path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(path, timeout=BUSY_TIMEOUT)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.executescript(SCHEMA)
+        connection_for = (os.getpid(), path)
+    return connection
+
+
+@functools.cache
+def source_hash(path: str) -> str:
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+# Encoding
+
+# The digest and encoding of every frozenset that's been encoded and is still
+# alive, by its id. Sets are only held weakly, and dropped from here once they
+# die, so their ids can't be reused by another set while they're in here.
+# Mutable sets aren't kept at all, since they could change between calls.
+encoded_sets: dict[int, tuple[weakref.ref[frozenset[Any]], str, bytes]] = {}
+
+
+def encode_set(value: set[Any] | frozenset[Any]) -> tuple[str, bytes]:
+    entry = encoded_sets.get(id(value))
+    if entry is not None and entry[0]() is value:
+        return entry[1], entry[2]
+    # Sorted by their own encodings, so the order doesn't depend on hashing.
+    encoder = Encoder()
+    items = sorted(encoder.encode(item) for item in value)
+    data = pickle.dumps((type(value).__name__, items), protocol=5)
+    digest = hashlib.sha256(data).hexdigest()
+    if isinstance(value, frozenset):
+        key = id(value)
+        encoded_sets[key] = (
+            weakref.ref(value, lambda _: encoded_sets.pop(key, None)),
+            digest,
+            data,
+        )
+    return digest, data
+
+
+class Encoder:
+    """
+    Pickles values, with any sets in them replaced by their digests, which are
+    collected in `sets` along with the sets' own encodings. Equal values always
+    encode the same way, so encodings can be looked up as keys.
+    """
+
+    def __init__(self) -> None:
+        self.sets: dict[str, bytes] = {}
+        # Setting up a pickler takes longer than pickling a small key, so the
+        # one pickler is reused, writing over the same buffer every time.
+        self.buffer = io.BytesIO()
+        self.pickler = pickle.Pickler(self.buffer, protocol=5)
+        # Without the memo, a string that appears twice is pickled the same way
+        # whether or not both are the same object.
+        self.pickler.fast = True
+        self.pickler.persistent_id = self.persistent_id  # type: ignore[method-assign]
+
+    def persistent_id(self, obj: Any) -> str | None:
+        if type(obj) is not set and type(obj) is not frozenset:
+            return None
+        digest, data = encode_set(obj)
+        self.sets[digest] = data
+        return digest
+
+    def encode(self, value: Any) -> bytes:
+        self.buffer.seek(0)
+        self.buffer.truncate()
+        self.pickler.dump(value)
+        return self.buffer.getvalue()
+
+
+class PersistentCache:
+    """
+    An unbounded cache backed by the store. It quacks like
+    `functools.lru_cache`'s wrapper, but is written in Python, so it's slower
+    on hits than an in-memory `@memo`.
+    """
+
+    def __init__(self, fn: Callable[..., Any]) -> None:
+        functools.update_wrapper(self, fn)
+        self.fn = fn
+        self.function = f"{fn.__module__}.{fn.__qualname__}"
+        module = sys.modules.get(fn.__module__)
+        if module is None or module.__file__ is None:
+            raise ValueError(f"{fn.__module__} has no source file to version it by")
+        self.source = module.__file__
+        self.cache: dict[Any, Any] = {}
+        # Keys computed (rather than found in the store) since the last flush.
+        self.added: list[Any] = []
+        # Which process last checked the store for this function's entries
+        # (since a forked worker needs a connection of its own), and whether
+        # it's still worth looking in.
+        self.opened_in: int | None = None
+        self.db: sqlite3.Connection | None = None
+        self.lookup = False
+        self.store_hits = 0
+        self.store_misses = 0
+        self.encoder = Encoder()
+        # Sets decoded from the store, by digest.
+        self.sets: dict[str, Any] = {}
+        self.hits = 0
+        self.misses = 0
+        caches.add(self)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        key = args if not kwargs else (*args, PersistentCache, *kwargs.items())
+        try:
+            result = self.cache[key]
+        except KeyError:
+            pass
+        else:
+            self.hits += 1
+            return result
+        if self.opened_in != os.getpid():
+            self.open()
+        if self.lookup:
+            row = self.db.execute(  # type: ignore[union-attr]
+                "SELECT value FROM entries WHERE function = ? AND key = ?",
+                (self.function, self.encoder.encode(key)),
+            ).fetchone()
+            if row is not None:
+                self.hits += 1
+                self.store_hits += 1
+                result = self.cache[key] = self.decode(row[0])
+                return result
+            self.store_misses += 1
+            # A run that's mostly computing new entries would spend more time
+            # looking for them than computing them, so it stops looking.
+            if self.store_misses - self.store_hits > STORE_MISS_LIMIT:
+                self.lookup = False
+        self.misses += 1
+        result = self.fn(*args, **kwargs)
+        if key not in self.cache:
+            self.added.append(key)
+        self.cache[key] = result
+        return result
+
+    def open(self) -> None:
+        """
+        Drop any entries stored by other versions of the function, and check
+        whether there are any left to look in.
+        """
+        self.opened_in = os.getpid()
+        self.db = db = connect()
+        source = source_hash(self.source)
+        row = db.execute(
+            "SELECT source FROM versions WHERE function = ?", (self.function,)
+        ).fetchone()
+        if row is None or row[0] != source:
+            with db:
+                db.execute("DELETE FROM entries WHERE function = ?", (self.function,))
+                db.execute(
+                    "INSERT OR REPLACE INTO versions (function, source) VALUES (?, ?)",
+                    (self.function, source),
+                )
+        self.lookup = (
+            db.execute(
+                "SELECT 1 FROM entries WHERE function = ? LIMIT 1", (self.function,)
+            ).fetchone()
+            is not None
+        )
+        self.store_hits = self.store_misses = 0
+
+    def load_set(self, digest: str) -> Any:
+        if digest not in self.sets:
+            (data,) = self.db.execute(  # type: ignore[union-attr]
+                "SELECT data FROM sets WHERE digest = ?", (digest,)
+            ).fetchone()
+            container, items = pickle.loads(data)
+            decoded = (self.decode(item) for item in items)
+            self.sets[digest] = (
+                set(decoded) if container == "set" else frozenset(decoded)
+            )
+        return self.sets[digest]
+
+    def decode(self, data: bytes) -> Any:
+        unpickler = pickle.Unpickler(io.BytesIO(data))
+        unpickler.persistent_load = self.load_set  # type: ignore[method-assign]
+        return unpickler.load()
+
+    def flush(self) -> None:
+        """
+        Write the entries computed since the last flush to the store.
+        """
+        if not self.added:
+            return
+        encoder = Encoder()
+        rows = [
+            (self.function, encoder.encode(key), encoder.encode(self.cache[key]))
+            for key in self.added
+        ]
+        self.added = []
+        source = source_hash(self.source)
+        db = connect()
+        with db:
+            row = db.execute(
+                "SELECT source FROM versions WHERE function = ?", (self.function,)
+            ).fetchone()
+            # If the solution has been edited since this process loaded it, the
+            # store belongs to the new version now.
+            if row is not None and row[0] != source:
+                return
+            db.execute(
+                "INSERT OR IGNORE INTO versions (function, source) VALUES (?, ?)",
+                (self.function, source),
+            )
+            db.executemany(
+                "INSERT OR IGNORE INTO sets (digest, data) VALUES (?, ?)",
+                encoder.sets.items(),
+            )
+            db.executemany(
+                "INSERT OR REPLACE INTO entries (function, key, value) "
+                "VALUES (?, ?, ?)",
+                rows,
+            )
+
+    def cache_info(self) -> functools._CacheInfo:
+        return functools._CacheInfo(self.hits, self.misses, None, len(self.cache))
+
+    def cache_clear(self) -> None:
+        self.flush()
+        self.cache.clear()
+        self.hits = self.misses = 0
+        # Look in the store afresh next time, now that it has these entries.
+        self.opened_in = None
+
+
+caches: weakref.WeakSet[PersistentCache] = weakref.WeakSet()
+
+
+def flush_all() -> None:
+    for cache in list(caches):
+        cache.flush()
+
+
+def clear_store() -> int:
+    """
+    Delete every stored entry, returning how many there were.
+    """
+    path = store_path()
+    if not path.exists():
+        return 0
+    db = connect()
+    with db:
+        (count,) = db.execute("SELECT COUNT(*) FROM entries").fetchone()
+        db.execute("DELETE FROM entries")
+        db.execute("DELETE FROM sets")
+        db.execute("DELETE FROM versions")
+    db.execute("VACUUM")
+    return count
+
+
+def flush_at_exit(_: object = None) -> None:
+    # Like `aoc.instrument`'s traces, this needs to run when pool workers exit
+    # too, and forked workers drop their parent's finalizers.
+    multiprocessing.util.Finalize(None, flush_all, exitpriority=1)
+
+
+flush_at_exit()
+multiprocessing.util.register_after_fork(flush_at_exit, flush_at_exit)
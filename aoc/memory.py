@@ -0,0 +1,141 @@
+"""
+Peak memory accounting for the steps of a solution, with `tracemalloc`.
+
+For each step, two things are recorded:
+
+- the peak number of bytes allocated at once while it ran (on top of whatever
+  was already allocated when it started), which is what blows up when a step
+  materializes every combination of something, and
+- the lines responsible for the most memory the step allocated and was still
+  holding on to when it returned, like its result or the entries it added to
+  a cache. (`tracemalloc` can't say where the memory was at the moment of the
+  peak, only what's allocated at the moment it's asked.)
+
+Tracing every allocation slows Python code down a lot, so steps are measured
+in a separate run from the one that's timed.
+"""
+
+import re
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, TypedDict
+
+from aoc.days import REPO_ROOT
+
+# How many lines to report as the top allocation sites of each step.
+TOP_SITES = 5
+
+SIZE_UNITS = {"": 1, "k": 10**3, "m": 10**6, "g": 10**9}
+
+
+class AllocationSite(TypedDict):
+    # "path/to/file.py:123"
+    location: str
+    size: int
+    count: int
+
+
+class MemoryStats(TypedDict):
+    peak: int
+    top: list[AllocationSite]
+
+
+def display_path(filename: str) -> str:
+    """
+    Paths inside the repository are shown relative to its root.
+    """
+    path = Path(filename)
+    return (
+        str(path.relative_to(REPO_ROOT)) if path.is_relative_to(REPO_ROOT) else filename
+    )
+
+
+def measure_memory(
+    fn: Callable[[], Any], top: int = TOP_SITES
+) -> tuple[Any, MemoryStats]:
+    """
+    Call `fn` with allocations traced, returning its result along with its
+    peak memory use and top allocation sites. If tracing was already on (say,
+    with `python -X tracemalloc`), it is left on afterwards.
+    """
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        baseline = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        result = fn()
+        peak = tracemalloc.get_traced_memory()[1] - baseline
+        after = tracemalloc.take_snapshot()
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+
+    # Leave out the allocations made by tracemalloc and this module.
+    filters = [
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, __file__),
+    ]
+    differences = after.filter_traces(filters).compare_to(
+        before.filter_traces(filters), "lineno"
+    )
+    sites: list[AllocationSite] = [
+        {
+            "location": f"{display_path(difference.traceback[0].filename)}:"
+            f"{difference.traceback[0].lineno}",
+            "size": difference.size_diff,
+            "count": difference.count_diff,
+        }
+        for difference in differences[:top]
+        if difference.size_diff > 0
+    ]
+    return result, {"peak": max(peak, 0), "top": sites}
+
+
+def format_bytes(count: int) -> str:
+    if count >= 1e6:
+        return f"{count / 1e6:.1f} MB"
+    if count >= 1e3:
+        return f"{count / 1e3:.1f} kB"
+    return f"{count} B"
+
+
+def parse_size(value: str) -> int:
+    """
+    Parse a size like `512M`, `1.5G` or `800000` (bytes) into a number of
+    bytes. Units are decimal, to match how sizes are reported.
+    """
+    match = re.fullmatch(r"\s*([\d.]+)\s*([kmg]?)b?\s*", value.lower())
+    if match is None:
+        raise ValueError(f"Invalid size {value!r}")
+    number, unit = match.groups()
+    return round(float(number) * SIZE_UNITS[unit])
+
+
+def over_budget(peaks: dict[str, int], budget: int | None) -> list[str]:
+    """
+    The steps (of those in `peaks`) that used more memory than `budget` bytes,
+    if there is a budget.
+    """
+    if budget is None:
+        return []
+    return [step for step, peak in peaks.items() if peak > budget]
+
+
+def format_memory(results: dict[str, MemoryStats]) -> str:
+    lines = [f"{'step':<8}{'peak':>12}  top allocation sites (still held)"]
+    for step, stats in results.items():
+        sites = stats["top"]
+        first = (
+            f"{format_bytes(sites[0]['size']):>10}  {sites[0]['location']}"
+            if sites
+            else ""
+        )
+        lines.append(f"{step:<8}{format_bytes(stats['peak']):>12}  {first}")
+        for site in sites[1:]:
+            lines.append(
+                f"{'':<20}  {format_bytes(site['size']):>10}  {site['location']}"
+            )
+    return "\n".join(lines)
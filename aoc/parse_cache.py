@@ -0,0 +1,350 @@
+"""
+A cache of parsed puzzle inputs, so repeated runs over the same (possibly huge,
+generated) input don't pay for parsing every time.
+
+Entries are keyed on the SHA-256 of the input text together with the SHA-256 of
+the day's `main.py` and of every module in `aoc` it uses (like `aoc.reader` or
+`aoc.grid`, which most parsers hand the work to), directly or through each
+other. Those stand in for the parser's version: any edit to the solution or to
+the helpers it parses with invalidates its cached inputs, rather than relying
+on someone to remember to bump a number.
+
+Parsed structures are stored in a small binary format instead of being pickled
+wholesale. The shapes that come up again and again in these puzzles get a
+packed representation:
+
+- `str`, and lists of strings (one buffer of text plus an array of lengths).
+- `Grid`s, stored as their raw cells. These are loaded without copying at all:
+  the grid's array is the memory-mapped file itself.
+- Lists of rows of single characters (stored like lists of strings).
+- Sequences of integers, and lists of integer rows, like coordinates or
+  reports (packed into int64 arrays, plus row lengths where rows vary).
+- NumPy arrays of numbers, stored as their raw data and, like grids, loaded
+  without copying.
+- Tuples combining any of the above, like `(left_list, right_list)`.
+
+Anything else falls back to pickle. Files are memory-mapped when loaded, so the
+packed arrays are read straight out of the page cache into the rebuilt lists.
+"""
+
+import array
+import contextlib
+import hashlib
+import json
+import mmap
+import os
+import pickle
+import struct
+import sys
+import tempfile
+from collections.abc import Sequence
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable
+
+import numpy as np
+
+from aoc.days import REPO_ROOT
+from aoc.grid import Grid
+
+MAGIC = b"AOCPARSE1\n"
+# Every buffer starts on an 8-byte boundary, so int64 arrays can be viewed in
+# place without copying.
+ALIGNMENT = 8
+
+INT64_MIN, INT64_MAX = -(2**63), 2**63 - 1
+
+type Node = dict[str, Any]
+
+
+def cache_dir() -> Path:
+    """
+    Where parsed inputs are cached. Defaults to `.aoc-cache/parsed` in the
+    repository root, but `AOC_CACHE_DIR` can point the whole cache elsewhere.
+    """
+    root = os.environ.get("AOC_CACHE_DIR")
+    return (Path(root) if root else REPO_ROOT / ".aoc-cache") / "parsed"
+
+
+def sha256_file(path: str | Path) -> str:
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+def aoc_dependencies(module: ModuleType) -> list[Path]:
+    """
+    The source files of the modules in the `aoc` package that `module` uses
+    (anything it imported from them, or the modules themselves), along with
+    the ones those use, and so on.
+    """
+    package = {
+        name: loaded
+        for name, loaded in sys.modules.items()
+        if (name == "aoc" or name.startswith("aoc.")) and loaded is not None
+    }
+    by_id = {id(loaded): name for name, loaded in package.items()}
+    found: dict[str, Path] = {}
+    pending = [module]
+    while pending:
+        for value in vars(pending.pop()).values():
+            # A lazily imported module loads as soon as an attribute of it is
+            # looked at, so modules are only ever recognized by identity.
+            if isinstance(value, ModuleType):
+                name = by_id.get(id(value))
+            else:
+                name = getattr(value, "__module__", None)
+            if not isinstance(name, str) or name not in package or name in found:
+                continue
+            dependency = package[name]
+            file = getattr(dependency, "__file__", None)
+            if file is None:
+                continue
+            found[name] = Path(file)
+            pending.append(dependency)
+    return sorted(found.values())
+
+
+def cache_path(module: ModuleType, text: str) -> Path:
+    """
+    The cache file for `text` parsed by `module`'s `parse`.
+    """
+    if module.__file__ is None:
+        raise ValueError(f"{module.__name__} has no source file to version it by")
+    input_hash = hashlib.sha256(text.encode()).hexdigest()
+    sources = [module.__file__, *aoc_dependencies(module)]
+    versions = ":".join(sha256_file(source) for source in sources)
+    key = hashlib.sha256(f"{input_hash}:{versions}".encode()).hexdigest()
+    return cache_dir() / f"{module.__name__}-{key[:32]}.bin"
+
+
+def cached_parse(module: ModuleType, text: str) -> Any:
+    """
+    Parse `text` with `module.parse`, going through the cache. A corrupt or
+    unreadable cache entry is treated as a miss and rewritten.
+    """
+    path = cache_path(module, text)
+    if path.exists():
+        try:
+            return load(path)
+        except (OSError, ValueError, pickle.UnpicklingError):
+            pass
+    parsed = module.parse(text)
+    dump(parsed, path)
+    return parsed
+
+
+def clear_cache() -> int:
+    """
+    Delete every cached parsed input, returning how many there were.
+    """
+    directory = cache_dir()
+    if not directory.exists():
+        return 0
+    paths = list(directory.glob("*.bin"))
+    for path in paths:
+        path.unlink(missing_ok=True)
+    return len(paths)
+
+
+# Encoding
+
+
+def is_int64(value: Any) -> bool:
+    # bools are ints too, but they need to come back as bools.
+    return type(value) is int and INT64_MIN <= value <= INT64_MAX
+
+
+def is_char_row(value: Any) -> bool:
+    return type(value) is list and all(
+        type(char) is str and len(char) == 1 for char in value
+    )
+
+
+def encode(value: Any, buffers: list[bytes]) -> Node:
+    """
+    Describe `value` as a JSON-serializable node, appending the raw data it
+    refers to onto `buffers`.
+    """
+
+    def add(buffer: bytes) -> int:
+        buffers.append(buffer)
+        return len(buffers) - 1
+
+    def add_text(strings: Sequence[str]) -> tuple[int, int]:
+        lengths = array.array("q", map(len, strings))
+        return add("".join(strings).encode()), add(lengths.tobytes())
+
+    if type(value) is str:
+        return {"kind": "str", "text": add(value.encode())}
+
+    if type(value) is Grid:
+        return {
+            "kind": "grid",
+            "shape": list(value.cells.shape),
+            "border": value.border,
+            "cells": add(value.cells.tobytes()),
+        }
+
+    if type(value) is np.ndarray and value.dtype.kind in "biuf":
+        return {
+            "kind": "ndarray",
+            "dtype": value.dtype.str,
+            "shape": list(value.shape),
+            "data": add(np.ascontiguousarray(value).tobytes()),
+        }
+
+    # Only plain lists and tuples, since subclasses (like named tuples) need
+    # pickling to come back as themselves.
+    if isinstance(value, (list, tuple)) and type(value) in (list, tuple):
+        container = type(value).__name__
+        if value and all(type(item) is str for item in value):
+            text, lengths = add_text(value)
+            return {
+                "kind": "strings",
+                "container": container,
+                "text": text,
+                "lengths": lengths,
+            }
+        if value and all(is_char_row(row) for row in value):
+            text, lengths = add_text(["".join(row) for row in value])
+            return {"kind": "char-rows", "text": text, "lengths": lengths}
+        if all(is_int64(item) for item in value):
+            values = add(array.array("q", value).tobytes())
+            return {"kind": "ints", "container": container, "values": values}
+        row_type = type(value[0]) if value else None
+        if (
+            row_type in (list, tuple)
+            and container == "list"
+            and all(type(row) is row_type for row in value)
+            and all(is_int64(item) for row in value for item in row)
+        ):
+            flat = array.array("q", (item for row in value for item in row))
+            lengths = array.array("q", map(len, value))
+            return {
+                "kind": "int-rows",
+                "row": row_type.__name__,
+                "values": add(flat.tobytes()),
+                "lengths": add(lengths.tobytes()),
+            }
+        if container == "tuple":
+            return {"kind": "tuple", "items": [encode(item, buffers) for item in value]}
+
+    return {"kind": "pickle", "data": add(pickle.dumps(value, protocol=5))}
+
+
+def dump(value: Any, path: Path) -> None:
+    """
+    Write `value` to `path`. The file is written to a temporary name first and
+    moved into place, so concurrent readers never see a partial entry.
+    """
+    buffers: list[bytes] = []
+    root = encode(value, buffers)
+
+    offsets: list[int] = []
+    position = 0
+    for buffer in buffers:
+        offsets.append(position)
+        position += len(buffer) + -len(buffer) % ALIGNMENT
+    header = json.dumps(
+        {"root": root, "buffers": [[o, len(b)] for o, b in zip(offsets, buffers)]}
+    ).encode()
+    # Pad the header so that the data section starts on an aligned offset.
+    preamble = len(MAGIC) + 8 + len(header)
+    header += b" " * (-preamble % ALIGNMENT)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(dir=path.parent, delete=False) as file:
+        file.write(MAGIC)
+        file.write(struct.pack("<q", len(header)))
+        file.write(header)
+        for buffer in buffers:
+            file.write(buffer)
+            file.write(b"\0" * (-len(buffer) % ALIGNMENT))
+    os.replace(file.name, path)
+
+
+# Decoding
+
+
+def decode(node: Node, buffer: Callable[[int], memoryview]) -> Any:
+    """
+    Rebuild a value from its node, where `buffer(index)` returns a view of one
+    of the raw buffers it refers to.
+    """
+
+    def split_text(text: int, lengths: int) -> list[str]:
+        joined = str(buffer(text), "utf-8")
+        strings: list[str] = []
+        position = 0
+        for length in buffer(lengths).cast("q"):
+            strings.append(joined[position : position + length])
+            position += length
+        return strings
+
+    match node["kind"]:
+        case "str":
+            return str(buffer(node["text"]), "utf-8")
+        case "strings":
+            strings = split_text(node["text"], node["lengths"])
+            return tuple(strings) if node["container"] == "tuple" else strings
+        case "char-rows":
+            return [list(row) for row in split_text(node["text"], node["lengths"])]
+        case "ints":
+            values = buffer(node["values"]).cast("q").tolist()
+            return tuple(values) if node["container"] == "tuple" else values
+        case "int-rows":
+            values = buffer(node["values"]).cast("q").tolist()
+            row_type = tuple if node["row"] == "tuple" else list
+            rows: list[Any] = []
+            position = 0
+            for length in buffer(node["lengths"]).cast("q"):
+                rows.append(row_type(values[position : position + length]))
+                position += length
+            return rows
+        case "grid":
+            # The cells are used in place, straight out of the mapped file.
+            cells = np.frombuffer(buffer(node["cells"]), dtype=np.uint8)
+            return Grid(cells.reshape(node["shape"]), node["border"])
+        case "ndarray":
+            # Used in place too, like a grid's cells.
+            data = np.frombuffer(buffer(node["data"]), dtype=np.dtype(node["dtype"]))
+            return data.reshape(node["shape"])
+        case "tuple":
+            return tuple(decode(item, buffer) for item in node["items"])
+        case "pickle":
+            return pickle.loads(buffer(node["data"]))
+        case kind:
+            raise ValueError(f"Unknown cache entry kind {kind}")
+
+
+def load(path: Path) -> Any:
+    with open(path, "rb") as file:
+        # A private, copy-on-write mapping, so that anything built directly on
+        # top of it (like a grid) can be modified without touching the file.
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY)
+    view = memoryview(mapped)
+    # Slices of the mapped file share its memory. Once the value is rebuilt,
+    # each is released, unless it's still backing part of the value.
+    views: list[memoryview] = []
+    try:
+        if view[: len(MAGIC)] != MAGIC:
+            raise ValueError(f"{path} is not a parsed input cache entry")
+        (header_length,) = struct.unpack_from("<q", view, len(MAGIC))
+        data_start = len(MAGIC) + 8 + header_length
+        header = json.loads(bytes(view[len(MAGIC) + 8 : data_start]))
+        buffers = header["buffers"]
+
+        def buffer(index: int) -> memoryview:
+            offset, length = buffers[index]
+            start = data_start + offset
+            views.append(view[start : start + length])
+            return views[-1]
+
+        return decode(header["root"], buffer)
+    finally:
+        for sliced in [*views, view]:
+            with contextlib.suppress(BufferError):
+                sliced.release()
+        # If nothing is using the mapping anymore, unmap it now. Otherwise, it
+        # stays mapped until whatever is using it is garbage collected.
+        with contextlib.suppress(BufferError):
+            mapped.close()
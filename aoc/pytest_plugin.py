@@ -0,0 +1,93 @@
+"""
+The regression gate (see `aoc.regression`) as a pytest plugin, registered
+through the `pytest11` entry point, so it's available to any test run in an
+environment with `aoc` installed.
+
+Tests marked `@pytest.mark.perf` are skipped unless pytest is run with
+`--perf-gate`, since benchmarking is slow. They get a `perf_gate` fixture,
+which benchmarks a day and fails the test if any of its steps regressed:
+
+    @pytest.mark.perf
+    def test_performance(perf_gate):
+        perf_gate(2025, 1)
+"""
+
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from aoc.days import day_label
+from aoc.regression import (
+    BASELINE_PATH,
+    DEFAULT_TOLERANCE,
+    compare,
+    format_comparisons,
+    has_regressions,
+    load_baseline,
+    measure_day,
+)
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("aoc")
+    group.addoption(
+        "--perf-gate",
+        action="store_true",
+        help="run tests marked perf, comparing benchmarks against the baseline",
+    )
+    group.addoption(
+        "--perf-tolerance",
+        type=float,
+        default=DEFAULT_TOLERANCE,
+        help="how much slower or bigger a step can get before it counts as a "
+        "regression, as a fraction of its baseline",
+    )
+    group.addoption(
+        "--perf-baseline",
+        default=str(BASELINE_PATH),
+        help="the baseline to compare against (default: benchmarks/baseline.json)",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line(
+        "markers",
+        "perf: a benchmark regression check, only run with --perf-gate",
+    )
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: list[pytest.Item]
+) -> None:
+    if config.getoption("--perf-gate"):
+        return
+    skip = pytest.mark.skip(reason="benchmark regression checks need --perf-gate")
+    for item in items:
+        if "perf" in item.keywords:
+            item.add_marker(skip)
+
+
+@pytest.fixture
+def perf_gate(request: pytest.FixtureRequest) -> Callable[[int, int], None]:
+    """
+    Benchmark a day the way the baseline was measured, and fail if any step
+    regressed. Days missing from the baseline are skipped.
+    """
+    config = request.config
+    path = config.getoption("--perf-baseline", None)
+    tolerance = config.getoption("--perf-tolerance", None)
+    if path is None or tolerance is None:
+        raise pytest.UsageError("perf_gate needs --perf-baseline and --perf-tolerance")
+    baseline = load_baseline(Path(path))
+
+    def check(year: int, day: int) -> None:
+        label = day_label(year, day)
+        if baseline is None or label not in baseline["days"]:
+            pytest.skip(f"{label} has no baseline")
+        measurements = {label: measure_day(year, day, baseline["settings"])}
+        comparisons = compare(baseline, measurements, float(tolerance))
+        if has_regressions(comparisons):
+            pytest.fail(format_comparisons(comparisons), pytrace=False)
+
+    return check
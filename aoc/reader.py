@@ -0,0 +1,286 @@
+"""
+Reading puzzle inputs without turning them into Python strings first.
+
+`map_input` memory-maps an input file, and everything else here works on any
+buffer (a mapped file, `bytes`, or a `str`, which has to be encoded first), so
+a parser written on top of it works the same on a `text` passed in by the
+benchmarks and on a multi-gigabyte file mapped straight from disk. For inputs
+too big to parse whole, `file_chunks` reads a file a run of whole lines at a
+time, for parsing each piece on its own.
+
+The integer tokenizer finds every run of digits in one vectorized pass over
+the bytes, treating anything else (`,`, `-`, `|`, `: `, whitespace, words) as
+a separator, and returns their values as an int64 array. Big inputs are
+scanned a chunk at a time, so its temporary arrays stay a fixed size however
+large the input is. With `signed`, a `-` directly in front of a number makes
+it negative, unless it comes straight after another number (like the `-` in
+the range `10-20`). Numbers too long for an int64 raise an `OverflowError`,
+except in `int_lists`, which returns Python ints anyway, and falls back to
+splitting each line into them (or tokenizing it with a regex, with `signed`).
+
+On top of that, `int_rows` groups the integers by line, `int_block` returns
+them as a 2D array when every line has the same number of them (so a column is
+just a view, `block[:, 0]`), and `line_views` slices lines out of the buffer
+without copying them.
+"""
+
+import contextlib
+import mmap
+import re
+from collections.abc import Buffer, Iterator
+from itertools import pairwise
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from aoc.imports import lazy_import
+
+if TYPE_CHECKING:
+    import numpy as np
+else:
+    # Not every day that parses with this needs NumPy for anything else.
+    np = lazy_import("numpy")
+
+type Source = str | Buffer
+
+# How much of the input to tokenize at once. Each chunk needs a few temporary
+# arrays several times its size.
+CHUNK_SIZE = 1 << 24
+
+NEWLINE = ord("\n")
+MINUS = ord("-")
+# The most digits an int64 can always hold.
+MAX_DIGITS = 18
+
+# For tokenizing what `scan` can't: every byte but a digit or a newline turned
+# into a space, so that the numbers on a line are whatever it splits into, and
+# a pattern for the signed ones, where a `-` may or may not be a separator.
+SEPARATORS = bytes(
+    byte if ord("0") <= byte <= ord("9") or byte == NEWLINE else ord(" ")
+    for byte in range(256)
+)
+SIGNED_INT_PATTERN = re.compile(rb"(?<![0-9])-?[0-9]+")
+
+
+@contextlib.contextmanager
+def map_input(path: str | Path) -> Iterator[Buffer]:
+    """
+    Memory-map the file at `path` (read-only) for as long as the block runs.
+    """
+    with open(path, "rb") as file:
+        # Empty files can't be mapped, but there's nothing to map anyway.
+        if file.seek(0, 2) == 0:
+            yield b""
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield mapped
+
+
+def file_chunks(path: str | Path, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Read the file at `path` in pieces of about `chunk_size` bytes, each made of
+    whole lines (unless a single line is longer than that), so no number is
+    split between two pieces.
+    """
+    with open(path, "rb") as file:
+        rest = b""
+        while block := file.read(chunk_size):
+            data = rest + block
+            end = data.rfind(b"\n") + 1
+            if end:
+                yield data[:end]
+            rest = data[end:]
+        if rest:
+            yield rest
+
+
+def as_bytes(source: Source) -> "np.ndarray":
+    """
+    A uint8 array over `source`, sharing its memory unless it's a `str`.
+    """
+    if isinstance(source, str):
+        return np.frombuffer(source.encode(), dtype=np.uint8)
+    return np.frombuffer(source, dtype=np.uint8)
+
+
+def scan(data: "np.ndarray", signed: bool) -> tuple["np.ndarray", "np.ndarray"]:
+    """
+    Tokenize one chunk of bytes, returning the value of every integer in it and
+    the index at which each one starts.
+    """
+    # Bytes below "0" wrap around to large values, so this is a single test.
+    is_digit = (data - ord("0")) < 10
+    # A number starts at a digit that doesn't follow another one, and ends
+    # (exclusive) at a byte that isn't a digit but follows one. There can be a
+    # number for every other byte, so the arrays with an entry per number are
+    # kept to as few as possible, and updated in place.
+    starts = np.flatnonzero(is_digit[1:] > is_digit[:-1])
+    starts += 1
+    ends = np.flatnonzero(is_digit[:-1] > is_digit[1:])
+    ends += 1
+    if len(data) and is_digit[0]:
+        starts = np.concatenate(([0], starts))
+    if len(data) and is_digit[-1]:
+        ends = np.concatenate((ends, [len(data)]))
+    if not len(starts):
+        return np.zeros(0, dtype=np.int64), starts
+    ends -= starts
+    longest = int(ends.max())
+    if longest > MAX_DIGITS:
+        raise OverflowError(f"Integers longer than {MAX_DIGITS} digits don't fit")
+    lengths = ends.astype(np.uint8)
+    del ends
+
+    # Read every number a digit at a time, all of them at once, so that there's
+    # no scratch array with an entry for every digit. `starts` walks along each
+    # number in place (and is walked back after), and the numbers that have
+    # already been read to their end are masked out rather than gathered.
+    values = np.zeros(len(starts), dtype=np.int64)
+    for place in range(longest):
+        # A shorter number's place can be just past the end of the data.
+        digits = np.take(data, starts, mode="clip")
+        digits -= ord("0")
+        going = lengths > place
+        np.multiply(values, 10, out=values, where=going)
+        np.add(values, digits, out=values, where=going)
+        starts += 1
+    starts -= longest
+
+    if signed:
+        # A "-" right before a number negates it, unless it follows a digit,
+        # where it's a separator, like in "10-20". That's worked out for every
+        # byte, and then looked up at the byte before each number.
+        negates = np.zeros(len(data) + 1, dtype=bool)
+        negates[1:] = data == MINUS
+        negates[2:] &= ~is_digit[:-1]
+        values[negates[starts]] *= -1
+    return values, starts
+
+
+def chunks(data: "np.ndarray", chunk_size: int) -> Iterator["np.ndarray"]:
+    """
+    Split `data` into views of about `chunk_size` bytes. Chunks are only ever
+    cut after a byte that's neither a digit nor a `-`, so no number (or its
+    sign) is split between two of them.
+    """
+    if chunk_size <= MAX_DIGITS + 1:
+        raise ValueError("Chunks need to be bigger than the biggest number")
+    start = 0
+    while start < len(data):
+        end = min(start + chunk_size, len(data))
+        if end < len(data):
+            window = data[start:end]
+            separators = np.flatnonzero(((window - ord("0")) >= 10) & (window != MINUS))
+            if len(separators):
+                end = start + int(separators[-1]) + 1
+            elif ((window - ord("0")) < 10).any():
+                raise OverflowError(
+                    f"Integers longer than {MAX_DIGITS} digits don't fit"
+                )
+            # Otherwise, it's a run of nothing but "-", which can be cut
+            # anywhere.
+        yield data[start:end]
+        start = end
+
+
+def ints(
+    source: Source, signed: bool = False, chunk_size: int = CHUNK_SIZE
+) -> "np.ndarray":
+    """
+    Every integer in `source`, in order, as an int64 array.
+    """
+    data = as_bytes(source)
+    parts = [scan(chunk, signed)[0] for chunk in chunks(data, chunk_size)]
+    if not parts:
+        return np.zeros(0, dtype=np.int64)
+    return np.concatenate(parts)
+
+
+def count_lines(data: "np.ndarray") -> int:
+    """
+    The number of lines in `data`, where a trailing newline doesn't start one.
+    """
+    newlines = int(np.count_nonzero(data == NEWLINE))
+    return newlines + (1 if len(data) and data[-1] != NEWLINE else 0)
+
+
+def int_rows(
+    source: Source, signed: bool = False, chunk_size: int = CHUNK_SIZE
+) -> tuple["np.ndarray", "np.ndarray"]:
+    """
+    Every integer in `source` along with how many of them are on each line
+    (including lines with none).
+    """
+    data = as_bytes(source)
+    parts: list[np.ndarray] = []
+    lines: list[np.ndarray] = []
+    lines_before = 0
+    for chunk in chunks(data, chunk_size):
+        values, starts = scan(chunk, signed)
+        newlines = np.flatnonzero(chunk == NEWLINE)
+        parts.append(values)
+        # The line each number is on, worked out in place of where it starts.
+        line = np.searchsorted(newlines, starts)
+        del starts
+        line += lines_before
+        lines.append(line)
+        lines_before += len(newlines)
+    if not parts:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    # A lone chunk's arrays are used as they are, rather than copied.
+    line = lines[0] if len(lines) == 1 else np.concatenate(lines)
+    del lines
+    counts = np.bincount(line, minlength=count_lines(data))
+    return parts[0] if len(parts) == 1 else np.concatenate(parts), counts
+
+
+def int_lists(source: Source, signed: bool = False) -> list[list[int]]:
+    """
+    The integers on each line of `source`, as lists.
+    """
+    try:
+        values, counts = int_rows(source, signed)
+    except OverflowError:
+        # Falling back outside the handler, where the traceback (and with it
+        # the tokenizer's arrays) has already been let go.
+        pass
+    else:
+        flat = values.tolist()
+        offsets = [0, *np.cumsum(counts).tolist()]
+        return [flat[start:end] for start, end in pairwise(offsets)]
+    if signed:
+        return [
+            [int(value) for value in SIGNED_INT_PATTERN.findall(line)]
+            for line in line_views(source)
+        ]
+    data = source.encode() if isinstance(source, str) else bytes(source)
+    lines = data.translate(SEPARATORS).split(b"\n")
+    # A trailing newline ends the last line rather than starting another.
+    if not lines[-1]:
+        lines.pop()
+    return [list(map(int, line.split())) for line in lines]
+
+
+def int_block(source: Source, signed: bool = False) -> "np.ndarray":
+    """
+    The integers in `source` as a 2D array with a row per line, for inputs with
+    the same number of integers on every line. Lines without any are skipped.
+    """
+    values, counts = int_rows(source, signed)
+    counts = counts[counts > 0]
+    if not len(counts):
+        return values.reshape(0, 0)
+    if (counts != counts[0]).any():
+        raise ValueError("Lines have different numbers of integers")
+    return values.reshape(len(counts), int(counts[0]))
+
+
+def line_views(source: Source) -> list[memoryview]:
+    """
+    Every line in `source` (without its newline), as a view of its bytes.
+    """
+    data = as_bytes(source)
+    view = memoryview(data)
+    newlines = np.flatnonzero(data == NEWLINE).tolist()
+    ends = newlines + ([len(data)] if len(data) and data[-1] != NEWLINE else [])
+    starts = [0, *(newline + 1 for newline in newlines)][: len(ends)]
+    return [view[start:end] for start, end in zip(starts, ends)]
@@ -0,0 +1,293 @@
+"""
+A performance regression gate. Every day is benchmarked on a generated input
+(so the numbers don't depend on anyone's personal puzzle input), and each
+step's median time and peak memory are compared against a checked-in baseline,
+`benchmarks/baseline.json`.
+
+A step has regressed when it got slower (or hungrier) by more than the
+tolerance, as a fraction of its baseline, and by more than a small absolute
+floor, so that a step that takes microseconds can't fail the gate on noise
+alone. The baseline records how it was measured (the input size and seed, and
+how many runs), and later runs measure the same way.
+"""
+
+import json
+import multiprocessing
+import tempfile
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Literal, TypedDict
+
+from aoc.bench import bench_day, format_duration
+from aoc.days import REPO_ROOT, load_generator
+from aoc.memory import format_bytes
+
+BASELINE_PATH = REPO_ROOT / "benchmarks" / "baseline.json"
+
+DEFAULT_TOLERANCE = 0.25
+# Changes smaller than these are always treated as noise.
+MIN_TIME_CHANGE = 5e-3
+MIN_MEMORY_CHANGE = 100_000
+
+type Verdict = Literal["improved", "regressed", "unchanged", "new", "missing", "failed"]
+VERDICTS: tuple[Verdict, ...] = (
+    "improved",
+    "regressed",
+    "unchanged",
+    "new",
+    "missing",
+    "failed",
+)
+
+
+class Settings(TypedDict):
+    # The generated input's size, as a multiple of the real input's.
+    factor: float
+    seed: int
+    repeat: int
+    warmup: int
+
+
+DEFAULT_SETTINGS: Settings = {"factor": 1, "seed": 0, "repeat": 3, "warmup": 0}
+
+
+class StepBaseline(TypedDict):
+    # In seconds.
+    median: float
+    # In bytes.
+    peak: int
+
+
+class Baseline(TypedDict):
+    settings: Settings
+    # By day ("2024/11"), then by step.
+    days: dict[str, dict[str, StepBaseline]]
+
+
+class Measurement(TypedDict):
+    steps: dict[str, StepBaseline]
+    # Set if the day raised, in which case it has no steps.
+    error: str | None
+
+
+class Comparison(TypedDict):
+    day: str
+    step: str
+    baseline: StepBaseline | None
+    current: StepBaseline | None
+    time: Verdict
+    memory: Verdict
+    verdict: Verdict
+    # Why the day failed, if it did.
+    error: str | None
+
+
+def load_baseline(path: Path = BASELINE_PATH) -> Baseline | None:
+    if not path.exists():
+        return None
+    return json.loads(path.read_text())
+
+
+def write_baseline(baseline: Baseline, path: Path = BASELINE_PATH) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(baseline, indent=2) + "\n")
+
+
+def bench_generated(year: int, day: int, settings: Settings) -> Measurement:
+    generator = load_generator(year, day)
+    size = max(round(generator.REAL_SIZE * settings["factor"]), 1)
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "input.txt"
+            path.write_text(generator.generate(size, settings["seed"]))
+            results = bench_day(
+                year,
+                day,
+                path,
+                settings["repeat"],
+                settings["warmup"],
+                memory=True,
+            )
+    except Exception as error:  # noqa: BLE001 - reported as a failed day
+        return {"steps": {}, "error": f"{type(error).__name__}: {error}"}
+    return {
+        "steps": {
+            result["step"]: {
+                "median": result["stats"]["median"],
+                "peak": result["memory"]["peak"] if result["memory"] else 0,
+            }
+            for result in results
+        },
+        "error": None,
+    }
+
+
+def measure_day(year: int, day: int, settings: Settings) -> Measurement:
+    """
+    Benchmark a day on its generated input, including each step's peak memory.
+    Every day is measured in a process of its own, forked from this one: how
+    much a process has allocated (say, for the days measured before it)
+    changes how often the garbage collector runs, which is enough to move a
+    step's time by half.
+    """
+    # Forked rather than spawned, since solutions are loaded by path, and the
+    # ones with process pools of their own need those to be forked too.
+    context = multiprocessing.get_context("fork")
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+        return executor.submit(bench_generated, year, day, settings).result()
+
+
+def judge(baseline: float, current: float, tolerance: float, floor: float) -> Verdict:
+    if abs(current - baseline) <= floor:
+        return "unchanged"
+    if current > baseline * (1 + tolerance):
+        return "regressed"
+    if current < baseline / (1 + tolerance):
+        return "improved"
+    return "unchanged"
+
+
+def compare_step(
+    day: str,
+    step: str,
+    baseline: StepBaseline | None,
+    current: StepBaseline | None,
+    tolerance: float,
+) -> Comparison:
+    if baseline is None or current is None:
+        verdict: Verdict = "new" if baseline is None else "missing"
+        return {
+            "day": day,
+            "step": step,
+            "baseline": baseline,
+            "current": current,
+            "time": verdict,
+            "memory": verdict,
+            "verdict": verdict,
+            "error": None,
+        }
+    time = judge(baseline["median"], current["median"], tolerance, MIN_TIME_CHANGE)
+    memory = judge(baseline["peak"], current["peak"], tolerance, MIN_MEMORY_CHANGE)
+    if "regressed" in (time, memory):
+        verdict = "regressed"
+    elif "improved" in (time, memory):
+        verdict = "improved"
+    else:
+        verdict = "unchanged"
+    return {
+        "day": day,
+        "step": step,
+        "baseline": baseline,
+        "current": current,
+        "time": time,
+        "memory": memory,
+        "verdict": verdict,
+        "error": None,
+    }
+
+
+def compare(
+    baseline: Baseline,
+    measurements: dict[str, Measurement],
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> list[Comparison]:
+    """
+    Compare every measured day's steps against the baseline. A day that failed
+    to run at all counts as one failed comparison. Days that weren't measured
+    aren't compared.
+    """
+    comparisons: list[Comparison] = []
+    for day, measurement in measurements.items():
+        expected = baseline["days"].get(day, {})
+        if measurement["error"] is not None:
+            comparisons.append(
+                {
+                    "day": day,
+                    "step": "",
+                    "baseline": None,
+                    "current": None,
+                    "time": "failed",
+                    "memory": "failed",
+                    "verdict": "failed",
+                    "error": measurement["error"],
+                }
+            )
+            continue
+        current = measurement["steps"]
+        for step in [*expected, *(step for step in current if step not in expected)]:
+            comparisons.append(
+                compare_step(
+                    day, step, expected.get(step), current.get(step), tolerance
+                )
+            )
+    return comparisons
+
+
+def has_regressions(comparisons: list[Comparison]) -> bool:
+    return any(
+        comparison["verdict"] in ("regressed", "missing", "failed")
+        for comparison in comparisons
+    )
+
+
+def updated_baseline(
+    baseline: Baseline | None,
+    measurements: dict[str, Measurement],
+    settings: Settings,
+) -> Baseline:
+    """
+    The baseline with the measured days replaced by their new measurements.
+    Days that weren't measured are kept, unless they were measured with other
+    settings, in which case they can't be compared anymore and are dropped.
+    """
+    days: dict[str, dict[str, StepBaseline]] = {}
+    if baseline is not None and baseline["settings"] == settings:
+        days = dict(baseline["days"])
+    for day, measurement in measurements.items():
+        if measurement["error"] is None:
+            days[day] = measurement["steps"]
+    ordered = sorted(days.items(), key=lambda item: tuple(map(int, item[0].split("/"))))
+    return {"settings": settings, "days": dict(ordered)}
+
+
+def format_change(baseline: float, current: float) -> str:
+    if baseline == 0:
+        return ""
+    return f"{(current - baseline) / baseline:+.0%}"
+
+
+def format_comparisons(comparisons: list[Comparison]) -> str:
+    header = (
+        f"{'day':<9}{'step':<7}{'median':>12}{'was':>12}{'change':>9}"
+        f"{'peak':>12}{'was':>12}{'change':>9}  verdict"
+    )
+    lines = [header]
+    for comparison in comparisons:
+        baseline = comparison["baseline"]
+        current = comparison["current"]
+        cells = ["", "", "", "", "", ""]
+        if current is not None:
+            cells[0] = format_duration(current["median"])
+            cells[3] = format_bytes(current["peak"])
+        if baseline is not None:
+            cells[1] = format_duration(baseline["median"])
+            cells[4] = format_bytes(baseline["peak"])
+        if baseline is not None and current is not None:
+            cells[2] = format_change(baseline["median"], current["median"])
+            cells[5] = format_change(baseline["peak"], current["peak"])
+        lines.append(
+            f"{comparison['day']:<9}{comparison['step']:<7}"
+            f"{cells[0]:>12}{cells[1]:>12}{cells[2]:>9}"
+            f"{cells[3]:>12}{cells[4]:>12}{cells[5]:>9}"
+            f"  {comparison['verdict']}"
+        )
+        if comparison["error"] is not None:
+            lines.append(f"  {comparison['error']}")
+    counts = Counter(comparison["verdict"] for comparison in comparisons)
+    lines.append(
+        ", ".join(
+            f"{counts[verdict]} {verdict}" for verdict in VERDICTS if verdict in counts
+        )
+    )
+    return "\n".join(lines)
@@ -0,0 +1,241 @@
+"""
+Run every day's solution on its real input in one go. Days are spread across a
+pool of worker processes, one per core, so the whole suite takes about as long
+as its slowest few days instead of the sum of all of them, and each worker pays
+for importing NumPy and friends once rather than once per day.
+
+Before a day's real input is solved, its example checks (the `check_examples`
+function in its `main.py`, if it has one) are run from inside the day's
+directory, the same way `python main.py` would run them. A day whose examples
+fail isn't run on its real input, and a day whose answers don't match the ones
+recorded for its input (see `aoc.answers`) is reported as failed.
+"""
+
+import contextlib
+import functools
+import io
+import json
+import os
+import time
+import traceback
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Literal, TypedDict
+
+from aoc.answers import Check, check_answer, format_check, input_hash
+from aoc.bench import format_duration
+from aoc.days import PARTS, DayKey, day_dir, day_label, input_path, load_day
+from aoc.memo import input_scope
+from aoc.memory import format_bytes, measure_memory
+
+type Status = Literal["ok", "failed", "no input"]
+# "none" when the day has no example checks to run (or they were skipped).
+type ExampleStatus = Literal["passed", "failed", "none"]
+
+
+class StepTiming(TypedDict):
+    step: str
+    answer: str | None
+    check: Check | None
+    # Elapsed wall clock time and CPU time of the worker process (and any
+    # processes it ran the step's work on), in seconds.
+    wall: float
+    cpu: float
+    # Peak bytes allocated, if memory was measured.
+    peak: int | None
+
+
+class DayReport(TypedDict):
+    year: int
+    day: int
+    examples: ExampleStatus
+    status: Status
+    error: str | None
+    steps: list[StepTiming]
+
+
+def cpu_time() -> float:
+    """
+    CPU time used by this process and by its children that have finished, like
+    the workers of a process pool that's been shut down.
+    """
+    times = os.times()
+    return times.user + times.system + times.children_user + times.children_system
+
+
+def timed(
+    step: str, fn: Callable[[], Any], memory: bool = False
+) -> tuple[Any, StepTiming]:
+    peak = None
+    wall_start, cpu_start = time.perf_counter(), cpu_time()
+    if memory:
+        result, memory_stats = measure_memory(fn)
+        peak = memory_stats["peak"]
+    else:
+        result = fn()
+    timing: StepTiming = {
+        "step": step,
+        "answer": None,
+        "check": None,
+        "wall": time.perf_counter() - wall_start,
+        "cpu": cpu_time() - cpu_start,
+        "peak": peak,
+    }
+    return result, timing
+
+
+def run_day(
+    year: int, day: int, examples: bool = True, memory: bool = False
+) -> DayReport:
+    """
+    Check a day's examples and solve its real input, timing parsing and each
+    part. Errors are caught and reported rather than raised, so that one broken
+    day doesn't take down the rest of the run.
+
+    With `memory`, each step's peak memory use is measured too (see
+    `aoc.memory`), which slows the steps down and so inflates their times.
+    """
+    report: DayReport = {
+        "year": year,
+        "day": day,
+        "examples": "none",
+        "status": "ok",
+        "error": None,
+        "steps": [],
+    }
+    try:
+        module = load_day(year, day)
+        check_examples = getattr(module, "check_examples", None)
+        if examples and check_examples is not None:
+            # The checks open their example files by relative path, and some
+            # print as they go, which would only garble the summary.
+            try:
+                with (
+                    contextlib.chdir(day_dir(year, day)),
+                    contextlib.redirect_stdout(io.StringIO()),
+                    input_scope(),
+                ):
+                    check_examples()
+            except AssertionError as error:
+                report["examples"] = "failed"
+                report["status"] = "failed"
+                report["error"] = f"Example check failed: {error}"
+                return report
+            report["examples"] = "passed"
+
+        path = input_path(year, day)
+        if not path.exists():
+            report["status"] = "no input"
+            return report
+
+        text = path.read_text()
+        label, input_sha256 = day_label(year, day), input_hash(text)
+        # Workers are reused from one day to the next, so nothing memoized for
+        # this day's input is kept once it's done.
+        with input_scope():
+            parse = functools.partial(module.parse, text)
+            parsed, timing = timed("parse", parse, memory)
+            report["steps"].append(timing)
+            for part in PARTS:
+                solve = getattr(module, part, None)
+                if solve is None:
+                    continue
+                answer, timing = timed(part, functools.partial(solve, parsed), memory)
+                timing["answer"] = str(answer)
+                timing["check"] = check_answer(label, input_sha256, part, answer)
+                report["steps"].append(timing)
+    except Exception:
+        report["status"] = "failed"
+        report["error"] = traceback.format_exc(limit=-1).strip()
+    return report
+
+
+def _init_worker(backend: str) -> None:
+    os.environ["AOC_EXECUTOR"] = backend
+
+
+def run_all(
+    days: list[DayKey],
+    workers: int | None = None,
+    examples: bool = True,
+    memory: bool = False,
+    backend: str | None = None,
+) -> list[DayReport]:
+    """
+    Run every one of `days` (see `run_day`) across a pool of `workers`
+    processes (one per core by default), returning the reports in the same
+    order as `days`. The days are already spread across the cores, so the ones
+    that split up their work run it on `backend`, which is serial unless given:
+    a process pool of its own in every worker would start one process per
+    core for each of them.
+    """
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(
+        max_workers=min(workers, max(len(days), 1)),
+        initializer=_init_worker,
+        initargs=(backend or "serial",),
+    ) as pool:
+        futures = [
+            pool.submit(run_day, year, day, examples, memory) for year, day in days
+        ]
+        return [future.result() for future in futures]
+
+
+def total_time(report: DayReport, kind: Literal["wall", "cpu"]) -> float:
+    return sum(step[kind] for step in report["steps"])
+
+
+def to_json(reports: list[DayReport]) -> str:
+    return json.dumps(reports, indent=2)
+
+
+def to_markdown(reports: list[DayReport], elapsed: float | None = None) -> str:
+    memory = any(
+        step["peak"] is not None for report in reports for step in report["steps"]
+    )
+    lines = [
+        "| Year | Day | Examples | Step | Answer | Wall | CPU |"
+        + (" Peak memory |" if memory else ""),
+        "|:----:|:---:|:--------:|------|--------|-----:|----:|"
+        + ("------------:|" if memory else ""),
+    ]
+    for report in reports:
+        prefix = f"| {report['year']} | {report['day']} | {report['examples']} "
+        if report["status"] != "ok":
+            # Just the last line of the error, which says what went wrong.
+            error = (report["error"] or "").splitlines()[-1:] or [""]
+            error = error[0].replace("|", "\\|")
+            lines.append(
+                prefix
+                + f"| {report['status']} | {error} | | |"
+                + (" |" if memory else "")
+            )
+            continue
+        for step in report["steps"]:
+            line = (
+                prefix
+                + f"| {step['step']} | {format_check(step['answer'], step['check'])} "
+                + f"| {format_duration(step['wall'])} "
+                + f"| {format_duration(step['cpu'])} |"
+            )
+            if memory:
+                peak = step["peak"]
+                line += f" {'' if peak is None else format_bytes(peak)} |"
+            lines.append(line)
+    ok = [report for report in reports if report["status"] == "ok"]
+    summary = (
+        f"{len(ok)} of {len(reports)} days solved, "
+        f"{format_duration(sum(total_time(report, 'wall') for report in ok))} "
+        f"of solving in total"
+    )
+    if elapsed is not None:
+        summary += f" ({format_duration(elapsed)} elapsed)"
+    return "\n".join(lines) + "\n\n" + summary + "\n"
+
+
+def write_report(text: str, output: str | None) -> None:
+    if output:
+        Path(output).write_text(text)
+    else:
+        print(text, end="")
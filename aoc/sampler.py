@@ -0,0 +1,198 @@
+"""
+A sampling profiler, for the runs that `@profiled` (see `aoc.instrument`) can't
+help with: loops so tight that timing every call doubles their cost, and runs
+so long that a 5x slowdown makes profiling them impractical.
+
+Instead of hooking every call, a signal timer interrupts the process at a fixed
+rate (250 times per second of CPU time, by default) and records the stack it
+was interrupted in. Each frame is named for the module and function it's in,
+with frames from a day's own scripts named for the day, like
+`2024/22:evolve` or `aoc.search:dijkstra`. Every stack starts from the step
+being run (`parse`, `part1` or `part2`), and the stacks are written out in the
+collapsed format (`part2;2024/22:part2;2024/22:make_sequence;... 42`, one
+stack and its count per line) that flamegraph.pl, speedscope and inferno all
+render. Time spent in C code (NumPy, say) is attributed to the Python function
+that called it.
+
+Only the main thread of the process doing the sampling is sampled, since that
+is where signal handlers run and forked workers don't inherit the timer, so
+`python -m aoc sample` runs days on the serial executor (see `aoc.executor`)
+unless told otherwise. Signal timers are Unix-only, and Linux delivers them no
+more often than its scheduler ticks (often 250 times a second), so asking for
+a higher frequency there doesn't get more samples.
+"""
+
+import functools
+import os
+import signal
+import time
+from collections import Counter
+from collections.abc import Callable
+from pathlib import Path
+from types import CodeType, FrameType
+from typing import Any, TypedDict
+
+from aoc.days import PARTS, REPO_ROOT, day_label, load_day
+from aoc.instrument import profile_dir
+
+DEFAULT_FREQUENCY = 250
+
+# A sampled stack, outermost frame first.
+type Stack = tuple[str, ...]
+
+
+class SampledStep(TypedDict):
+    step: str
+    answer: Any
+    # Wall clock time, in seconds.
+    elapsed: float
+    samples: int
+
+
+class SampleReport(TypedDict):
+    frequency: int
+    steps: list[SampledStep]
+    stacks: Counter[Stack]
+
+
+@functools.cache
+def frame_label(code: CodeType, module: str) -> str:
+    """
+    Name a frame for the function it's running, prefixed with the day it's
+    from (and the script, unless it's the day's `main.py`) or else the module.
+    """
+    path = Path(code.co_filename)
+    if path.is_relative_to(REPO_ROOT):
+        parts = path.relative_to(REPO_ROOT).parts
+        if len(parts) == 3 and parts[0].isdigit() and parts[1].isdigit():
+            year, day, script = parts
+            label = day_label(int(year), int(day))
+            if script != "main.py":
+                label += f"/{path.stem}"
+            return f"{label}:{code.co_qualname}"
+    return f"{module}:{code.co_qualname}"
+
+
+class Sampler:
+    frequency: int
+    # How many times each stack was sampled.
+    stacks: Counter[Stack]
+    step: str | None
+
+    def __init__(self, frequency: int = DEFAULT_FREQUENCY) -> None:
+        if frequency <= 0:
+            raise ValueError("Need a positive sampling frequency")
+        if not hasattr(signal, "setitimer"):
+            raise RuntimeError("Sampling needs signal timers, which are Unix-only")
+        self.frequency = frequency
+        self.stacks = Counter()
+        self.step = None
+
+    def sample(self, _signum: int, frame: FrameType | None) -> None:
+        stack: list[str] = []
+        # Walk out to the frame that started the step, so that the runner's
+        # own frames don't show up in every stack.
+        while frame is not None and frame.f_code is not RUN_CODE:
+            module = frame.f_globals.get("__name__", "?")
+            stack.append(frame_label(frame.f_code, module))
+            frame = frame.f_back
+        if frame is None or self.step is None:
+            return
+        stack.append(self.step)
+        self.stacks[tuple(reversed(stack))] += 1
+
+    def run[R](self, step: str, fn: Callable[[], R]) -> R:
+        """
+        Call `fn`, sampling its stack until it returns. Samples are recorded
+        under `step`.
+        """
+        interval = 1 / self.frequency
+        previous = signal.signal(signal.SIGPROF, self.sample)
+        self.step = step
+        signal.setitimer(signal.ITIMER_PROF, interval, interval)
+        try:
+            return fn()
+        finally:
+            signal.setitimer(signal.ITIMER_PROF, 0)
+            signal.signal(signal.SIGPROF, previous)
+            self.step = None
+
+
+RUN_CODE = Sampler.run.__code__
+
+
+def sample_day(
+    year: int, day: int, text: str, frequency: int = DEFAULT_FREQUENCY
+) -> SampleReport:
+    """
+    Parse `text` and solve both parts of a day once each, sampling all three.
+    """
+    module = load_day(year, day)
+    sampler = Sampler(frequency)
+    steps: list[SampledStep] = []
+    parsed = None
+    for step in ("parse", *PARTS):
+        if step == "parse":
+            fn = functools.partial(module.parse, text)
+        elif hasattr(module, step):
+            fn = functools.partial(getattr(module, step), parsed)
+        else:
+            continue
+        before = sampler.stacks.total()
+        start = time.perf_counter()
+        result = sampler.run(step, fn)
+        elapsed = time.perf_counter() - start
+        if step == "parse":
+            parsed = result
+        steps.append(
+            {
+                "step": step,
+                "answer": None if step == "parse" else result,
+                "elapsed": elapsed,
+                "samples": sampler.stacks.total() - before,
+            }
+        )
+    return {"frequency": frequency, "steps": steps, "stacks": sampler.stacks}
+
+
+def to_collapsed(stacks: Counter[Stack]) -> str:
+    return "".join(
+        f"{';'.join(stack)} {count}\n" for stack, count in sorted(stacks.items())
+    )
+
+
+def write_collapsed(
+    stacks: Counter[Stack], label: str, path: Path | None = None
+) -> Path:
+    """
+    Write the stacks to `path`, or to a new file in the profile directory
+    named for `label` (like "2024-22"), the time and the process. Returns
+    where they were written.
+    """
+    if path is None:
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        path = profile_dir() / f"{label}-{stamp}-{os.getpid()}.collapsed"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(to_collapsed(stacks))
+    return path
+
+
+def format_hottest(stacks: Counter[Stack], top: int = 10) -> str:
+    """
+    Summarize the functions that were sampled the most: "self" counts the
+    samples taken in the function itself, and "total" the ones with it
+    anywhere on the stack.
+    """
+    own: Counter[str] = Counter()
+    total: Counter[str] = Counter()
+    for stack, count in stacks.items():
+        own[stack[-1]] += count
+        for frame in set(stack):
+            total[frame] += count
+    samples = stacks.total() or 1
+    lines = [f"{'function':<56}{'self':>9}{'total':>9}"]
+    for frame, count in own.most_common(top):
+        lines.append(
+            f"{frame:<56}{count / samples:>9.1%}{total[frame] / samples:>9.1%}"
+        )
+    return "\n".join(lines)
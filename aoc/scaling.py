@@ -0,0 +1,219 @@
+"""
+Scaling benchmarks driven by the synthetic input generators. A day is timed on
+generated inputs at several multiples of the real input size, and the timings
+are fit to a power law, so a step that grows quadratically shows up as
+`n^2.0` instead of just being slow.
+"""
+
+import functools
+import math
+import statistics
+from collections.abc import Sequence
+from typing import TypedDict
+
+from aoc.answers import check_answer, input_hash
+from aoc.bench import format_duration, time_repeated
+from aoc.days import PARTS, day_label, load_day, load_generator, reset_caches
+from aoc.memory import format_bytes
+from aoc.parse_cache import cached_parse
+
+DEFAULT_FACTORS = (1, 10, 100)
+
+
+class SizeResult(TypedDict):
+    factor: float
+    size: int
+    bytes: int
+    # Median time per step, in seconds. Steps that failed or were skipped at
+    # this size are left out.
+    medians: dict[str, float]
+    errors: dict[str, str]
+
+
+class Fit(TypedDict):
+    step: str
+    exponent: float
+    label: str
+
+
+def fit_exponent(points: Sequence[tuple[float, float]]) -> float | None:
+    """
+    Fit `time = c * size^k` to a list of (size, time) points with least squares
+    on the log-log values, returning `k`. Returns None if there aren't at least
+    two distinct sizes to fit against.
+    """
+    usable = [(math.log(size), math.log(time)) for size, time in points if time > 0]
+    if len({x for x, _ in usable}) < 2:
+        return None
+    mean_x = statistics.fmean(x for x, _ in usable)
+    mean_y = statistics.fmean(y for _, y in usable)
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in usable)
+    variance = sum((x - mean_x) ** 2 for x, _ in usable)
+    return covariance / variance
+
+
+def describe_exponent(exponent: float) -> str:
+    """
+    Name the complexity class closest to a fitted exponent. With only a few
+    sizes to go on, n log n is indistinguishable from a slightly-worse-than-
+    linear polynomial, so it gets lumped in with linear.
+    """
+    if exponent < 0.25:
+        return "constant"
+    if exponent < 1.3:
+        return "linear"
+    if exponent < 1.75:
+        return "n^1.5"
+    if exponent < 2.5:
+        return "quadratic"
+    if exponent < 3.5:
+        return "cubic"
+    return "worse than cubic"
+
+
+def sweep(
+    year: int,
+    day: int,
+    factors: tuple[float, ...] = DEFAULT_FACTORS,
+    seed: int = 0,
+    repeat: int = 3,
+    budget: float = 60.0,
+    cache: bool = False,
+) -> list[SizeResult]:
+    """
+    Time parsing and both parts of a day's solution on generated inputs at
+    each multiple of the real input size in `factors`, smallest first. Factors
+    below 1 are useful for days that are already slow on a real input.
+
+    `budget` is the longest a single run of a step should take, in seconds. A
+    step is left out of the next size if, even growing linearly from its
+    median at this size, it would go over budget there. A step that raises
+    (e.g. a recursive solution running out of stack) is left out of every
+    larger size, and if parsing is left out, so is everything else. That
+    includes a part whose answer doesn't match the one recorded for the same
+    generated input, which shows up as a `WrongAnswer`.
+
+    With `cache`, inputs are parsed through the parsed input cache, and the
+    parse step times loading the cached entry instead.
+    """
+    if repeat < 1:
+        raise ValueError("Need at least one timed repetition")
+
+    module = load_day(year, day)
+    generator = load_generator(year, day)
+    steps = ["parse"] + [part for part in PARTS if hasattr(module, part)]
+    label = day_label(year, day)
+    dropped: set[str] = set()
+
+    def reset() -> None:
+        reset_caches(module)
+
+    results: list[SizeResult] = []
+    factors = tuple(sorted(factors))
+    for index, factor in enumerate(factors):
+        growth = factors[index + 1] / factor if index + 1 < len(factors) else 1
+        size = max(round(generator.REAL_SIZE * factor), 1)
+        text = generator.generate(size, seed)
+        input_sha256 = input_hash(text)
+        result: SizeResult = {
+            "factor": factor,
+            "size": size,
+            "bytes": len(text.encode()),
+            "medians": {},
+            "errors": {},
+        }
+        results.append(result)
+
+        if "parse" in dropped:
+            continue
+        parsed = None
+        for step in steps:
+            if step in dropped:
+                continue
+            if step == "parse" and cache:
+                fn = functools.partial(cached_parse, module, text)
+            elif step == "parse":
+                fn = functools.partial(module.parse, text)
+            else:
+                fn = functools.partial(getattr(module, step), parsed)
+            try:
+                if step == "parse" and cache:
+                    cached_parse(module, text)
+                answer, samples = time_repeated(fn, repeat, 0, reset)
+                if step != "parse":
+                    check_answer(label, input_sha256, step, answer)
+            except Exception as error:
+                result["errors"][step] = type(error).__name__
+                dropped.add(step)
+                if step == "parse":
+                    break
+                continue
+            if step == "parse":
+                parsed = answer
+            median = statistics.median(samples)
+            result["medians"][step] = median
+            if median * growth > budget:
+                dropped.add(step)
+
+    return results
+
+
+def fit_results(results: list[SizeResult]) -> list[Fit]:
+    steps: list[str] = []
+    for result in results:
+        steps.extend(step for step in result["medians"] if step not in steps)
+
+    fits: list[Fit] = []
+    for step in steps:
+        points = [
+            (result["size"], result["medians"][step])
+            for result in results
+            if step in result["medians"]
+        ]
+        exponent = fit_exponent(points)
+        if exponent is not None:
+            fits.append(
+                {
+                    "step": step,
+                    "exponent": exponent,
+                    "label": describe_exponent(exponent),
+                }
+            )
+    return fits
+
+
+def format_sweep(results: list[SizeResult]) -> str:
+    steps: list[str] = []
+    for result in results:
+        for step in [*result["medians"], *result["errors"]]:
+            if step not in steps:
+                steps.append(step)
+    steps.sort(key=lambda step: ("parse", *PARTS).index(step))
+
+    header = f"{'factor':<8}{'size':>10}{'input':>12}"
+    lines = [header + "".join(f"{step:>14}" for step in steps)]
+    for result in results:
+        line = (
+            f"{format(result['factor'], 'g') + 'x':<8}"
+            f"{result['size']:>10}"
+            f"{format_bytes(result['bytes']):>12}"
+        )
+        for step in steps:
+            if step in result["medians"]:
+                cell = format_duration(result["medians"][step])
+            elif step in result["errors"]:
+                cell = result["errors"][step]
+            else:
+                cell = "skipped"
+            line += f"{cell:>14}"
+        lines.append(line)
+
+    fits = {fit["step"]: fit for fit in fit_results(results)}
+    if fits:
+        exponents = [
+            f"n^{fits[step]['exponent']:.2f}" if step in fits else "" for step in steps
+        ]
+        labels = [fits[step]["label"] if step in fits else "" for step in steps]
+        lines.append(f"{'fit':<30}" + "".join(f"{cell:>14}" for cell in exponents))
+        lines.append(" " * 30 + "".join(f"{cell:>14}" for cell in labels))
+    return "\n".join(lines)
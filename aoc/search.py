@@ -0,0 +1,271 @@
+"""
+Shortest path search over graphs whose nodes are numbered 0 to n - 1, for the
+maze and racetrack puzzles.
+
+Distances and predecessors live in preallocated int64 arrays indexed by node,
+rather than in dicts and sets keyed by tuples, and queues hold bare node IDs.
+Instead of carrying a copy of the path in every queue entry, the search
+records each node's predecessors on shortest paths, which together form a DAG:
+any one shortest path, or the set of nodes on every shortest path, can be read
+back out of it afterwards.
+
+The queue discipline is picked from the edge weights the graph can have:
+
+- one weight for every edge: a plain BFS queue,
+- weights of only 0 and 1: a 0-1 BFS deque,
+- small integer weights: Dial's algorithm, with a ring of buckets,
+- anything else, or when an A* heuristic is given: a binary heap.
+
+For grids, `aoc.grid.Grid.node` turns a position into a node ID.
+"""
+
+import heapq
+from array import array
+from collections import deque
+from collections.abc import Callable, Collection, Iterable
+from typing import Literal
+
+type Neighbors = Callable[[int], Iterable[tuple[int, int]]]
+type Heuristic = Callable[[int], int]
+type Algorithm = Literal["bfs", "0-1 bfs", "dial", "dijkstra"]
+
+# The distance to any node the search hasn't reached.
+UNREACHED = 2**62
+# The predecessor of any node without one.
+NO_NODE = -1
+
+# Dial's algorithm keeps one bucket per possible distance within the largest
+# edge weight, so past this point a heap is the better deal.
+MAX_DIAL_WEIGHT = 64
+
+
+class SearchResult:
+    """
+    The outcome of a search: the shortest distance to every node reached, and
+    the DAG of predecessors on shortest paths.
+    """
+
+    distances: array
+    # The first predecessor found for each node on a shortest path to it.
+    predecessors: array
+    # Any further predecessors with an equally short path, for the rare nodes
+    # that have more than one.
+    extra_predecessors: dict[int, list[int]]
+
+    def __init__(self, num_nodes: int) -> None:
+        self.distances = array("q", [UNREACHED]) * num_nodes
+        self.predecessors = array("q", [NO_NODE]) * num_nodes
+        self.extra_predecessors = {}
+
+    def reached(self, node: int) -> bool:
+        return self.distances[node] != UNREACHED
+
+    def distance(self, node: int) -> int:
+        """
+        The shortest distance to `node`. Raises a ValueError if the search
+        never reached it.
+        """
+        distance = self.distances[node]
+        if distance == UNREACHED:
+            raise ValueError(f"No path found to node {node}")
+        return distance
+
+    def predecessors_of(self, node: int) -> list[int]:
+        first = self.predecessors[node]
+        if first == NO_NODE:
+            return []
+        return [first, *self.extra_predecessors.get(node, ())]
+
+    def path_to(self, node: int) -> list[int]:
+        """
+        One shortest path to `node`, starting from whichever source it came
+        from.
+        """
+        self.distance(node)
+        path = [node]
+        while (node := self.predecessors[node]) != NO_NODE:
+            path.append(node)
+        path.reverse()
+        return path
+
+    def nodes_on_shortest_paths(self, targets: Iterable[int]) -> set[int]:
+        """
+        Every node on any shortest path to any of `targets`, including the
+        targets themselves (so pass only the nearest ones, if that's what you
+        want).
+        """
+        seen = {target for target in targets if self.reached(target)}
+        stack = list(seen)
+        while stack:
+            for predecessor in self.predecessors_of(stack.pop()):
+                if predecessor not in seen:
+                    seen.add(predecessor)
+                    stack.append(predecessor)
+        return seen
+
+
+def choose_algorithm(
+    weights: Collection[int], heuristic: Heuristic | None = None
+) -> Algorithm:
+    """
+    Pick the cheapest queue discipline that is still correct for a graph whose
+    edges can have any of the given (non-negative) weights.
+    """
+    if any(weight < 0 for weight in weights):
+        raise ValueError("Edge weights must not be negative")
+    if heuristic is not None:
+        return "dijkstra"
+    if len(set(weights)) == 1 and min(weights) > 0:
+        return "bfs"
+    if set(weights) <= {0, 1}:
+        return "0-1 bfs"
+    if all(isinstance(weight, int) for weight in weights) and (
+        max(weights) <= MAX_DIAL_WEIGHT
+    ):
+        return "dial"
+    return "dijkstra"
+
+
+def search(
+    num_nodes: int,
+    sources: Iterable[int],
+    neighbors: Neighbors,
+    weights: Collection[int],
+    targets: Collection[int] = (),
+    heuristic: Heuristic | None = None,
+    algorithm: Algorithm | None = None,
+) -> SearchResult:
+    """
+    Find shortest paths from any of `sources` through a graph with `num_nodes`
+    nodes. `neighbors(node)` returns (neighbor, weight) pairs for the edges
+    leaving `node`, and `weights` lists every weight those edges can have,
+    which decides the algorithm used (unless one is given).
+
+    Without `targets`, every reachable node is explored. With them, the search
+    stops as soon as it has settled every node that is no further away than
+    the nearest target. That's enough to answer both "how far is the nearest
+    target" and "what's on every shortest path to it".
+
+    `heuristic(node)` turns the search into A*. It must never overestimate the
+    remaining distance to the nearest target, and never drop by more than an
+    edge's weight along that edge, or shortest paths may be missed.
+    """
+    if algorithm is None:
+        algorithm = choose_algorithm(weights, heuristic)
+    result = SearchResult(num_nodes)
+    distances = result.distances
+    predecessors = result.predecessors
+    extra_predecessors = result.extra_predecessors
+    target_set = set(targets)
+    # The distance to the nearest target, once one has been settled.
+    stop_after = UNREACHED
+
+    sources = list(dict.fromkeys(sources))
+    for source in sources:
+        distances[source] = 0
+
+    def relax(node: int, neighbor: int, distance: int) -> bool:
+        """
+        Record an edge into `neighbor` that gives it a path of `distance`.
+        Returns True if that's a new shortest distance, so it needs to be
+        (re)queued.
+        """
+        current = distances[neighbor]
+        if distance < current:
+            distances[neighbor] = distance
+            predecessors[neighbor] = node
+            extra_predecessors.pop(neighbor, None)
+            return True
+        if distance == current and neighbor != node:
+            extra_predecessors.setdefault(neighbor, []).append(node)
+        return False
+
+    if algorithm == "bfs":
+        # Every edge has the same weight, so nodes come off the queue in order
+        # of distance without any sorting.
+        queue = deque(sources)
+        while queue:
+            node = queue.popleft()
+            distance = distances[node]
+            if distance > stop_after:
+                break
+            if node in target_set and stop_after == UNREACHED:
+                stop_after = distance
+            for neighbor, weight in neighbors(node):
+                if relax(node, neighbor, distance + weight):
+                    queue.append(neighbor)
+
+    elif algorithm == "0-1 bfs":
+        # Zero-weight edges go to the front of the queue and the rest to the
+        # back, which keeps the queue sorted by distance. A node can be queued
+        # more than once if a shorter path turns up, so stale entries (with a
+        # larger distance than the node has now) are skipped.
+        queue = deque((0, source) for source in sources)
+        settled = set()
+        while queue:
+            distance, node = queue.popleft()
+            if distance != distances[node] or node in settled:
+                continue
+            if distance > stop_after:
+                break
+            settled.add(node)
+            if node in target_set and stop_after == UNREACHED:
+                stop_after = distance
+            for neighbor, weight in neighbors(node):
+                if relax(node, neighbor, distance + weight):
+                    if weight == 0:
+                        queue.appendleft((distance, neighbor))
+                    else:
+                        queue.append((distance + weight, neighbor))
+
+    elif algorithm == "dial":
+        # One bucket per distance, modulo one more than the largest weight:
+        # every node waiting on the queue is within that range of the one
+        # being settled, so the buckets never collide.
+        num_buckets = max(weights) + 1
+        buckets: list[list[int]] = [[] for _ in range(num_buckets)]
+        buckets[0].extend(sources)
+        pending = len(sources)
+        distance = 0
+        while pending and distance <= stop_after:
+            bucket = buckets[distance % num_buckets]
+            while bucket:
+                node = bucket.pop()
+                pending -= 1
+                if distances[node] != distance:
+                    continue
+                if node in target_set and stop_after == UNREACHED:
+                    stop_after = distance
+                for neighbor, weight in neighbors(node):
+                    if relax(node, neighbor, distance + weight):
+                        buckets[(distance + weight) % num_buckets].append(neighbor)
+                        pending += 1
+            distance += 1
+
+    else:
+        # Heap entries pack the priority and node into one int, which is
+        # much faster to compare (and smaller) than a tuple.
+        heap = [
+            (heuristic(source) if heuristic else 0) * num_nodes + source
+            for source in sources
+        ]
+        heapq.heapify(heap)
+        settled = set()
+        while heap:
+            priority, node = divmod(heapq.heappop(heap), num_nodes)
+            if node in settled:
+                continue
+            if priority > stop_after:
+                break
+            settled.add(node)
+            distance = distances[node]
+            if node in target_set and stop_after == UNREACHED:
+                stop_after = distance
+            for neighbor, weight in neighbors(node):
+                if relax(node, neighbor, distance + weight):
+                    estimate = distance + weight
+                    if heuristic:
+                        estimate += heuristic(neighbor)
+                    heapq.heappush(heap, estimate * num_nodes + neighbor)
+
+    return result
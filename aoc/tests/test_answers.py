@@ -0,0 +1,45 @@
+import pytest
+
+from aoc import answers
+from aoc.answers import WrongAnswer, check_answer, forget_answers, input_hash
+
+
+@pytest.fixture(autouse=True)
+def store(tmp_path, monkeypatch):
+    monkeypatch.setenv("AOC_CACHE_DIR", str(tmp_path))
+    return tmp_path / "answers.sqlite"
+
+
+def test_first_answer_is_recorded(store):
+    sha = input_hash("1 2 3\n")
+    assert check_answer("2024/1", sha, "part1", 11) == "recorded"
+    assert store.exists()
+    assert check_answer("2024/1", sha, "part1", 11) == "matched"
+    # Answers are compared the way they're printed.
+    assert check_answer("2024/1", sha, "part1", "11") == "matched"
+    # Each part, and each input, has an answer of its own.
+    assert check_answer("2024/1", sha, "part2", 31) == "recorded"
+    assert check_answer("2024/1", input_hash("4 5 6\n"), "part1", 7) == "recorded"
+
+
+def test_wrong_answer():
+    sha = input_hash("1 2 3\n")
+    check_answer("2024/1", sha, "part1", 11)
+    with pytest.raises(WrongAnswer, match="2024/1 part1 answered 12, but 11"):
+        check_answer("2024/1", sha, "part1", 12)
+
+
+def test_forget_answers():
+    assert forget_answers() == 0
+    check_answer("2024/1", input_hash("a"), "part1", 1)
+    check_answer("2024/1", input_hash("b"), "part1", 2)
+    check_answer("2024/2", input_hash("c"), "part1", 3)
+    assert forget_answers("2024/1") == 2
+    assert check_answer("2024/1", input_hash("a"), "part1", 5) == "recorded"
+    assert forget_answers() == 2
+
+
+def test_format_check():
+    assert answers.format_check(None, None) == ""
+    assert answers.format_check(11, "recorded") == "11 (new)"
+    assert answers.format_check(11, "matched") == "11 ✓"
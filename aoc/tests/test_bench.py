@@ -0,0 +1,27 @@
+from aoc.bench import bench_day, summarize
+from aoc.days import day_dir, discover_days
+
+
+def test_summarize():
+    stats = summarize([0.3, 0.1, 0.2, 0.4])
+    assert stats == {"runs": 4, "min": 0.1, "median": 0.25, "p95": 0.4}
+
+
+def test_discover_days():
+    days = discover_days([2024])
+    assert (2024, 1) in days
+    assert (2024, 25) in days
+    # There's no Python solution for 2024 day 17.
+    assert (2024, 17) not in days
+    assert all(year == 2024 for year, _ in days)
+
+
+def test_bench_day(tmp_path, monkeypatch):
+    monkeypatch.setenv("AOC_CACHE_DIR", str(tmp_path))
+    results = bench_day(2024, 1, day_dir(2024, 1) / "test.txt", repeat=2, warmup=0)
+    assert [result["step"] for result in results] == ["parse", "part1", "part2"]
+    assert [result["answer"] for result in results] == [None, 11, 31]
+    assert all(result["stats"]["runs"] == 2 for result in results)
+    assert [result["check"] for result in results] == [None, "recorded", "recorded"]
+    results = bench_day(2024, 1, day_dir(2024, 1) / "test.txt", repeat=1, warmup=0)
+    assert [result["check"] for result in results] == [None, "matched", "matched"]
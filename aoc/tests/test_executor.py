@@ -0,0 +1,76 @@
+import pytest
+
+from aoc import executor
+from aoc.executor import BACKENDS, parallel_map, resolve_backend
+
+
+def square(value: int) -> int:
+    return value * value
+
+
+def offset(base: dict[str, int], value: int) -> int:
+    return base["offset"] + value
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_parallel_map(backend, monkeypatch):
+    monkeypatch.setenv("AOC_WORKERS", "3")
+    values = list(range(50))
+    assert parallel_map(square, values, backend=backend) == [
+        value * value for value in values
+    ]
+    assert parallel_map(offset, values, shared={"offset": 7}, backend=backend) == [
+        value + 7 for value in values
+    ]
+    assert parallel_map(square, [], backend=backend) == []
+
+
+def test_resolve_backend(monkeypatch):
+    monkeypatch.setenv("AOC_EXECUTOR", "threads")
+    assert resolve_backend() == "threads"
+    assert resolve_backend("serial") == "serial"
+    monkeypatch.setattr(executor, "free_threading_available", lambda: False)
+    assert resolve_backend("free-threaded") == "processes"
+    monkeypatch.setenv("AOC_WORKERS", "1")
+    assert resolve_backend("auto") == "serial"
+    monkeypatch.setattr(executor, "free_threading_available", lambda: True)
+    assert resolve_backend("free-threaded") == "threads"
+    assert resolve_backend("auto") == "threads"
+    with pytest.raises(ValueError, match="Unknown executor"):
+        resolve_backend("gpu")
+
+
+def mark(grid: list[str], index: int) -> int:
+    # Uses the grid as scratch space, putting it back before returning.
+    previous, grid[index] = grid[index], "#"
+    try:
+        return grid.count("#")
+    finally:
+        grid[index] = previous
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_parallel_map_scratch(backend, monkeypatch):
+    monkeypatch.setenv("AOC_WORKERS", "3")
+    grid = ["."] * 50
+    assert parallel_map(mark, range(50), shared=grid, backend=backend) == [1] * 50
+    assert grid == ["."] * 50
+
+
+def test_auto_head_start(monkeypatch):
+    monkeypatch.setenv("AOC_WORKERS", "3")
+    monkeypatch.setattr(executor, "free_threading_available", lambda: False)
+    values = list(range(50))
+
+    def no_pool(*args):
+        raise AssertionError("Started a pool for quick work")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(executor, "process_pool", no_pool)
+        assert parallel_map(square, values, backend="auto") == [
+            value * value for value in values
+        ]
+    monkeypatch.setattr(executor, "SERIAL_HEAD_START", 0)
+    assert parallel_map(offset, values, shared={"offset": 7}, backend="auto") == [
+        value + 7 for value in values
+    ]
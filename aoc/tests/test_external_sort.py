@@ -0,0 +1,51 @@
+import numpy as np
+
+from aoc.external_sort import (
+    RunWriter,
+    group_counts,
+    lockstep,
+    merge_runs,
+    reduce_runs,
+)
+
+
+def test_sorts_on_disk(tmp_path):
+    rng = np.random.default_rng(0)
+    values = rng.integers(-1000, 1000, 10_000)
+    writer = RunWriter(tmp_path, run_length=700)
+    for start in range(0, len(values), 333):
+        writer.add(values[start : start + 333])
+    runs = writer.finish()
+    assert len(runs) == 15
+
+    merged = list(merge_runs(runs, block_length=50))
+    assert np.array_equal(np.concatenate(merged), np.sort(values))
+    # Merging doesn't use the runs up, so they can be merged again.
+    assert np.array_equal(np.concatenate(list(merge_runs(runs, 64))), np.sort(values))
+
+    reduced = reduce_runs(runs, block_length=50, fan_in=4)
+    assert len(reduced) == 4
+    assert not any(run.exists() for run in runs)
+    merged = list(merge_runs(reduced, block_length=50))
+    assert np.array_equal(np.concatenate(merged), np.sort(values))
+
+
+def test_lockstep():
+    first = [np.arange(0, 3), np.arange(3, 10)]
+    second = [np.arange(10, 15), np.arange(15, 17), np.arange(17, 30)]
+    pairs = list(lockstep(first, second))
+    assert [len(a) for a, _ in pairs] == [3, 2, 2, 3]
+    assert all(len(a) == len(b) for a, b in pairs)
+    assert np.array_equal(np.concatenate([b for _, b in pairs]), np.arange(10, 20))
+
+
+def test_group_counts():
+    values = np.sort(np.random.default_rng(1).integers(0, 20, 500))
+    blocks = [values[start : start + 17] for start in range(0, len(values), 17)]
+    groups = list(group_counts(blocks))
+    ids = np.concatenate([ids for ids, _ in groups])
+    counts = np.concatenate([counts for _, counts in groups])
+    expected_ids, expected_counts = np.unique(values, return_counts=True)
+    assert np.array_equal(ids, expected_ids)
+    assert np.array_equal(counts, expected_counts)
+    assert list(group_counts([])) == []
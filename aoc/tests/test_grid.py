@@ -0,0 +1,73 @@
+import pickle
+
+import numpy as np
+
+from aoc.grid import Grid, shift
+
+TEXT = "..@\n@@.\n.@.\n"
+
+
+def test_text_round_trip():
+    grid = Grid.from_text(TEXT)
+    assert (grid.height, grid.width) == (3, 3)
+    assert grid.cells.dtype == np.uint8
+    assert grid.to_text() == TEXT
+    assert grid.padded("#").to_text() == TEXT
+    assert pickle.loads(pickle.dumps(grid)) == grid
+
+
+def test_padded_keeps_positions():
+    grid = Grid.from_text(TEXT)
+    padded = grid.padded("#", 2)
+    assert padded[0, 2] == grid[0, 2] == "@"
+    assert padded[-1, 0] == padded[3, 4] == "#"
+    assert (
+        padded.find_all("@") == grid.find_all("@") == [(0, 2), (1, 0), (1, 1), (2, 1)]
+    )
+    padded[0, 0] = "x"
+    assert grid[0, 0] == "."
+
+
+def test_find_and_mask():
+    grid = Grid.from_text(TEXT)
+    assert grid.find("@") == (0, 2)
+    assert grid.mask("@").sum() == 4
+    assert grid.neighbors((0, 0)) == [(0, 1), (1, 0)]
+
+
+def test_neighbor_counts():
+    grid = Grid.from_text(TEXT)
+    assert grid.count_neighbors("@").tolist() == [[2, 3, 1], [2, 3, 3], [3, 2, 2]]
+    assert np.array_equal(
+        grid.padded(".").count_neighbors("@"), grid.count_neighbors("@")
+    )
+
+
+def test_shift():
+    values = np.arange(6).reshape(2, 3)
+    assert shift(values, 0, 1, -1).tolist() == [[1, 2, -1], [4, 5, -1]]
+    assert shift(values, -1, 0, -1).tolist() == [[-1, -1, -1], [0, 1, 2]]
+
+
+def test_word_search():
+    grid = Grid.from_text("XMAS\nMMAA\nAXAS\nSSXS\n")
+    # Across the top, down the left, and diagonally from the top left.
+    assert grid.count_word("XMAS") == 3
+    assert grid.count_word("XMAS", ((0, 1),)) == 1
+    # Bands smaller than the grid, and padding, don't change what's found.
+    assert grid.count_word("XMAS", band_cells=1) == 3
+    assert grid.padded(".", 2).count_word("XMAS") == 3
+
+    # Masks come in the order of the directions, whether or not the word fits,
+    # and mark where its `anchor`-th letter is: here, the "M" of an "AM" read
+    # leftwards, off the grid, and upwards.
+    ((left, nowhere, up),) = grid.word_masks("AM", ((0, -1), (5, 0), (-1, 0)), anchor=1)
+    assert np.argwhere(left).tolist() == [[0, 1], [1, 1]]
+    assert not nowhere.any()
+    assert np.argwhere(up).tolist() == [[1, 0]]
+    bands = list(grid.word_masks("MA", ((1, 1),), band_cells=4))
+    assert len(bands) == 4
+    assert np.array_equal(
+        np.vstack([masks[0] for masks in bands]),
+        next(grid.word_masks("MA", ((1, 1),)))[0],
+    )
@@ -0,0 +1,35 @@
+import sys
+import types
+
+from aoc.imports import lazy_import, measure_imports, parse_import_times
+
+SAMPLE = """\
+import time: self [us] | cumulative | imported package
+import time:       118 |        118 |   _io
+import time:       541 |       2762 | site
+import time:      2251 |      57717 |   pulp.pulp
+import time:       325 |      58263 | pulp
+"""
+
+
+def test_lazy_import(monkeypatch):
+    monkeypatch.delitem(sys.modules, "colorsys", raising=False)
+    module = lazy_import("colorsys")
+    # Until it's used, it's a lazy stand-in rather than an ordinary module.
+    assert type(module) is not types.ModuleType
+    assert module.rgb_to_hsv(1.0, 0.0, 0.0) == (0.0, 1.0, 1.0)
+    # Once loaded, it's an ordinary module, and importing it again reuses it.
+    assert type(module) is types.ModuleType
+    assert lazy_import("colorsys") is module
+
+
+def test_parse_import_times():
+    imports = parse_import_times(SAMPLE)
+    assert [entry["module"] for entry in imports] == ["site", "pulp"]
+    assert imports[1]["cumulative"] == 0.058263
+
+
+def test_measure_imports():
+    report = measure_imports(2024, 1)
+    assert report["total"] > report["interpreter"] > 0
+    assert "aoc.days" in [entry["module"] for entry in report["top"]]
@@ -0,0 +1,44 @@
+import json
+import time
+
+from aoc import instrument
+
+
+def test_disabled_is_free(monkeypatch):
+    monkeypatch.setattr(instrument, "enabled", False)
+
+    def fn() -> int:
+        return 1
+
+    assert instrument.profiled(fn) is fn
+
+
+def test_counts_and_times(monkeypatch, tmp_path):
+    monkeypatch.setattr(instrument, "enabled", True)
+    instrument.reset()
+
+    @instrument.profiled
+    def leaf() -> None:
+        time.sleep(0.01)
+
+    @instrument.profiled
+    def countdown(n: int) -> int:
+        leaf()
+        return 0 if n == 0 else countdown(n - 1) + 1
+
+    assert countdown(3) == 3
+    stats = instrument.stats
+    leaf_stats = stats[f"{__name__}.{leaf.__qualname__}"]
+    countdown_stats = stats[f"{__name__}.{countdown.__qualname__}"]
+    assert (countdown_stats["calls"], countdown_stats["max_depth"]) == (4, 4)
+    assert (leaf_stats["calls"], leaf_stats["max_depth"]) == (4, 1)
+    # The recursion is only counted once, and almost all of it is spent in the
+    # leaf calls rather than in the countdown itself.
+    assert leaf_stats["cumulative"] <= countdown_stats["cumulative"]
+    assert countdown_stats["cumulative"] < 2 * leaf_stats["cumulative"]
+    assert countdown_stats["self"] < leaf_stats["self"]
+
+    path = instrument.write_trace(tmp_path / "trace.json")
+    trace = json.loads(path.read_text())
+    assert trace["functions"] == stats
+    instrument.reset()
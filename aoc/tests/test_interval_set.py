@@ -0,0 +1,62 @@
+import random
+
+import numpy as np
+import pytest
+
+from aoc.interval_set import IntervalSet
+
+
+def test_merges_intervals():
+    intervals = IntervalSet([(16, 20), (3, 5), (12, 18), (10, 14), (6, 6)])
+    # 3-5 and 6-6 touch, so they're merged too.
+    assert list(intervals) == [(3, 6), (10, 20)]
+    assert len(intervals) == 2
+    assert intervals.total_length() == 15
+    assert IntervalSet().total_length() == 0
+    with pytest.raises(ValueError):
+        IntervalSet([(5, 3)])
+
+
+def test_membership():
+    intervals = IntervalSet([(3, 5), (10, 14)])
+    assert [value in intervals for value in range(2, 16)] == [
+        value in {3, 4, 5, 10, 11, 12, 13, 14} for value in range(2, 16)
+    ]
+    assert intervals.contains_many(np.array([1, 3, 5, 6, 14, 15])).tolist() == [
+        False,
+        True,
+        True,
+        False,
+        True,
+        False,
+    ]
+    assert IntervalSet().contains_many(np.array([1, 2])).tolist() == [False, False]
+
+
+def test_union_and_intersection():
+    a = IntervalSet([(1, 5), (10, 20)])
+    b = IntervalSet([(4, 12), (18, 30), (40, 41)])
+    assert list(a | b) == [(1, 30), (40, 41)]
+    assert list(a & b) == [(4, 5), (10, 12), (18, 20)]
+    assert a & IntervalSet() == IntervalSet()
+
+
+def test_matches_sets():
+    rng = random.Random(0)
+
+    def random_intervals() -> list[tuple[int, int]]:
+        starts = [rng.randint(0, 500) for _ in range(20)]
+        return [(start, start + rng.randint(0, 30)) for start in starts]
+
+    first, second = random_intervals(), random_intervals()
+    first_values = {value for start, end in first for value in range(start, end + 1)}
+    second_values = {value for start, end in second for value in range(start, end + 1)}
+    a, b = IntervalSet(first), IntervalSet(second)
+
+    assert a.total_length() == len(first_values)
+    values = np.arange(-5, 600)
+    assert a.contains_many(values).tolist() == [
+        value in first_values for value in values.tolist()
+    ]
+    assert (a | b).total_length() == len(first_values | second_values)
+    assert (a & b).total_length() == len(first_values & second_values)
@@ -0,0 +1,91 @@
+import pytest
+
+from aoc import memo as memo_module
+from aoc.memo import collect_counts, input_scope, memo
+
+calls: list[int] = []
+
+
+@memo
+def fibonacci(n: int) -> int:
+    calls.append(n)
+    return n if n < 2 else fibonacci(n - 1) + fibonacci(n - 2)
+
+
+@memo(maxsize=2)
+def square(n: int) -> int:
+    calls.append(n)
+    return n * n
+
+
+@memo(maxsize=2, policy="fifo")
+def cube(n: int) -> int:
+    calls.append(n)
+    return n**3
+
+
+def counts(fn) -> dict[str, int]:
+    return collect_counts()[f"memo {__name__}.{fn.__qualname__}"]
+
+
+@pytest.fixture(autouse=True)
+def reset():
+    memo_module.reset_counts()
+    calls.clear()
+
+
+def test_unbounded():
+    assert fibonacci(30) == 832040
+    assert sorted(calls) == list(range(31))
+    assert counts(fibonacci) == {"hits": 28, "misses": 31, "evictions": 0}
+    # Counts carry on across clearing the cache.
+    fibonacci.cache_clear()
+    fibonacci(1)
+    assert counts(fibonacci) == {"hits": 28, "misses": 32, "evictions": 0}
+
+
+def test_lru_eviction():
+    for n in [1, 2, 1, 3, 1, 2]:
+        square(n)
+    # 1 stays cached, since it keeps being used; 2 is evicted to make room
+    # for 3, and has to be computed again.
+    assert calls == [1, 2, 3, 2]
+    assert counts(square) == {"hits": 2, "misses": 4, "evictions": 2}
+
+
+def test_fifo_eviction():
+    for n in [1, 2, 1, 3, 1, 2]:
+        cube(n)
+    # 1 is evicted for 3 despite being used, being the oldest entry.
+    assert calls == [1, 2, 3, 1, 2]
+    assert counts(cube) == {"hits": 1, "misses": 5, "evictions": 3}
+
+
+def test_input_scope():
+    with input_scope():
+        fibonacci(10)
+        square(3)
+        assert fibonacci.cache_info().currsize == 11
+    assert fibonacci.cache_info().currsize == 0
+    assert square.cache_info().currsize == 0
+
+
+def test_closures_share_counts():
+    def outer(n: int) -> int:
+        @memo
+        def helper(n: int) -> int:
+            return n if n == 0 else helper(n - 1)
+
+        result = helper(n)
+        helper.cache_clear()
+        return result
+
+    outer(3)
+    outer(3)
+    assert collect_counts()[
+        f"memo {__name__}.{outer.__qualname__}.<locals>.helper"
+    ] == {
+        "hits": 0,
+        "misses": 8,
+        "evictions": 0,
+    }
@@ -0,0 +1,104 @@
+import pytest
+
+from aoc import memo, memo_store
+from aoc.memo_store import Encoder, PersistentCache
+
+calls: list[tuple[frozenset[str], str]] = []
+
+
+def count_splits(words: frozenset[str], text: str) -> int:
+    calls.append((words, text))
+    if text == "":
+        return 1
+    return sum(
+        count_splits(words, text[len(word) :])
+        for word in words
+        if text.startswith(word)
+    )
+
+
+@pytest.fixture(autouse=True)
+def store(tmp_path, monkeypatch):
+    monkeypatch.setenv("AOC_CACHE_DIR", str(tmp_path))
+    calls.clear()
+    return tmp_path / "memo.sqlite"
+
+
+def test_encoding_is_stable():
+    encoder = Encoder()
+    words = ["a", "ab", "b", "ba", "abc"]
+    assert encoder.encode((frozenset(words), "ab")) == encoder.encode(
+        (frozenset(reversed(words)), "ab")
+    )
+    # Repeated strings pickle the same whether or not they're the same object.
+    text = "xyz"
+    assert encoder.encode((text, text)) == encoder.encode((text, "".join("xyz")))
+
+
+def test_set_encodings_follow_changes():
+    # A set can change between calls, so it's encoded afresh every time.
+    values = {1, 2}
+    before = memo_store.encode_set(values)
+    values.add(3)
+    assert memo_store.encode_set(values) != before
+    # Frozensets can't, so their encodings are kept, but only while they live.
+    frozen = frozenset(values)
+    assert memo_store.encode_set(frozen) == memo_store.encode_set(frozen)
+    assert id(frozen) in memo_store.encoded_sets
+    key = id(frozen)
+    del frozen
+    assert key not in memo_store.encoded_sets
+
+
+def test_entries_persist():
+    words = frozenset(["a", "b", "ab"])
+    first = PersistentCache(count_splits)
+    assert first(words, "abab") == 4
+    assert calls
+    first.cache_clear()
+
+    calls.clear()
+    second = PersistentCache(count_splits)
+    # Loaded from the store, without calling the function at all, even though
+    # the set was built anew.
+    assert second(frozenset(["ab", "b", "a"]), "abab") == 4
+    assert calls == []
+    assert second.cache_info().hits == 1
+
+
+def test_source_change_invalidates(tmp_path):
+    source = tmp_path / "main.py"
+    source.write_text("version = 1")
+    first = PersistentCache(count_splits)
+    first.source = str(source)
+    first(frozenset(["a"]), "aa")
+    first.cache_clear()
+
+    source.write_text("version = 2")
+    memo_store.source_hash.cache_clear()
+    calls.clear()
+    second = PersistentCache(count_splits)
+    second.source = str(source)
+    second(frozenset(["a"]), "aa")
+    assert calls
+
+
+def test_clear_store():
+    cache = PersistentCache(count_splits)
+    cache(frozenset(["a"]), "aaa")
+    cache.flush()
+    assert memo_store.clear_store() == 1
+    assert memo_store.clear_store() == 0
+
+
+def test_memo_persist(monkeypatch):
+    def square(n: int) -> int:
+        return n * n
+
+    assert not isinstance(memo.memo(square, persist=True), PersistentCache)
+    monkeypatch.setattr(memo, "persist_enabled", True)
+    memoized = memo.memo(square, persist=True)
+    assert isinstance(memoized, PersistentCache)
+    assert memoized(3) == 9
+    with pytest.raises(ValueError):
+        memo.memo(square, maxsize=10, persist=True)
@@ -0,0 +1,48 @@
+import pytest
+
+from aoc.bench import bench_day
+from aoc.days import day_dir
+from aoc.memory import measure_memory, over_budget, parse_size
+
+kept: list[list[int]] = []
+
+
+def allocate() -> int:
+    temporary = list(range(200_000))
+    kept.append(list(range(1000)))
+    return len(temporary)
+
+
+def test_measure_memory():
+    result, stats = measure_memory(allocate)
+    assert result == 200_000
+    # The temporary list counts toward the peak, even though it's gone by the
+    # time the step returns...
+    assert stats["peak"] > 200_000 * 8
+    # ...but only the list that's still held shows up as an allocation site.
+    assert stats["top"][0]["location"] == "aoc/tests/test_memory.py:12"
+    assert 8000 <= stats["top"][0]["size"] < 200_000
+    kept.clear()
+
+
+def test_parse_size():
+    assert parse_size("800") == 800
+    assert parse_size("512M") == 512_000_000
+    assert parse_size("1.5g") == 1_500_000_000
+    assert parse_size("64kB") == 64_000
+    with pytest.raises(ValueError):
+        parse_size("lots")
+
+
+def test_over_budget():
+    peaks = {"parse": 10, "part1": 500, "part2": 2000}
+    assert over_budget(peaks, None) == []
+    assert over_budget(peaks, 1000) == ["part2"]
+
+
+def test_bench_day_memory():
+    path = day_dir(2024, 1) / "test.txt"
+    results = bench_day(2024, 1, path, repeat=1, warmup=0, memory=True)
+    memories = [result["memory"] for result in results]
+    assert all(memory is not None and memory["peak"] > 0 for memory in memories)
+    assert bench_day(2024, 1, path, repeat=1, warmup=0)[0]["memory"] is None
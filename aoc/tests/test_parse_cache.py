@@ -0,0 +1,96 @@
+from typing import Any
+
+import numpy as np
+import pytest
+
+from aoc import parse_cache
+from aoc.days import discover_days, load_day, load_generator
+
+
+def same(loaded: Any, value: Any) -> bool:
+    # Arrays don't compare to a single bool, so they're compared on their own.
+    if isinstance(value, np.ndarray):
+        return (
+            type(loaded) is np.ndarray
+            and loaded.dtype == value.dtype
+            and np.array_equal(loaded, value)
+        )
+    if type(value) is tuple:
+        return (
+            type(loaded) is tuple
+            and len(loaded) == len(value)
+            and all(same(a, b) for a, b in zip(loaded, value))
+        )
+    return loaded == value
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("AOC_CACHE_DIR", str(tmp_path))
+    return tmp_path / "parsed"
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "abc\n",
+        ["..#", "#.", ""],
+        [list("..#"), list("#.#")],
+        ([3, 4, 2], [4, 3, 5]),
+        [(0, 1), (-2, 2**40)],
+        [[7, 6, 4, 2, 1], [1, 3]],
+        [],
+        {"kh": {"tc"}, "tc": {"kh"}},
+        [2**70, True],
+        (np.array([3, 4, 2]), np.array([4, 3, 5])),
+        np.arange(12, dtype=np.int32).reshape(3, 4),
+        np.array([0.5, -1.25]),
+    ],
+)
+def test_round_trip(value, cache_dir):
+    path = cache_dir / "entry.bin"
+    parse_cache.dump(value, path)
+    assert same(parse_cache.load(path), value)
+
+
+@pytest.mark.parametrize("year, day", discover_days())
+def test_round_trip_parsed_input(year: int, day: int, cache_dir):
+    generator = load_generator(year, day)
+    parsed = load_day(year, day).parse(generator.generate(generator.REAL_SIZE // 20))
+    path = cache_dir / "entry.bin"
+    parse_cache.dump(parsed, path)
+    loaded = parse_cache.load(path)
+    assert same(loaded, parsed)
+    assert type(loaded) is type(parsed)
+
+
+def test_cached_parse(monkeypatch):
+    module = load_day(2024, 1)
+    calls: list[str] = []
+
+    def parse(text):
+        calls.append(text)
+        return ([1], [2])
+
+    monkeypatch.setattr(module, "parse", parse)
+    assert parse_cache.cached_parse(module, "1   2\n") == ([1], [2])
+    assert parse_cache.cached_parse(module, "1   2\n") == ([1], [2])
+    assert calls == ["1   2\n"]
+    assert parse_cache.clear_cache() == 1
+
+
+def test_cache_key_follows_helpers(monkeypatch):
+    module = load_day(2024, 1)
+    dependencies = parse_cache.aoc_dependencies(module)
+    # The tokenizer 2024 day 1 parses with, and what that imports in turn.
+    assert {path.name for path in dependencies} >= {"reader.py", "imports.py"}
+    before = parse_cache.cache_path(module, "1   2\n")
+    hashes = {str(path): parse_cache.sha256_file(path) for path in dependencies}
+    hashes[str(dependencies[0])] = "edited"
+    real_sha256_file = parse_cache.sha256_file
+    monkeypatch.setattr(
+        parse_cache,
+        "sha256_file",
+        lambda path: hashes.get(str(path)) or real_sha256_file(path),
+    )
+    assert parse_cache.cache_path(module, "1   2\n") != before
@@ -0,0 +1,116 @@
+import random
+
+import numpy as np
+import pytest
+
+from aoc.reader import (
+    file_chunks,
+    int_block,
+    int_lists,
+    int_rows,
+    ints,
+    line_views,
+    map_input,
+)
+
+
+def test_ints():
+    assert ints("Button A: X+94, Y+34\nPrize: X=8400, Y=5400\n").tolist() == [
+        94,
+        34,
+        8400,
+        5400,
+    ]
+    # Without `signed`, "-" is just another separator.
+    assert ints("3-5\n10-14\n\n1|2").tolist() == [3, 5, 10, 14, 1, 2]
+    assert ints(b"").tolist() == []
+    assert ints("no numbers here").dtype == np.int64
+
+
+def test_signed_ints():
+    assert ints("p=0,4 v=3,-3\np=-6,3 v=-1,-3", signed=True).tolist() == [
+        0,
+        4,
+        3,
+        -3,
+        -6,
+        3,
+        -1,
+        -3,
+    ]
+    # A "-" between two numbers still separates them.
+    assert ints("-1-2 --3", signed=True).tolist() == [-1, 2, -3]
+
+
+@pytest.mark.parametrize("chunk_size", [20, 64, 1 << 20])
+def test_chunks_never_split_numbers(chunk_size):
+    rng = random.Random(chunk_size)
+    numbers = [rng.randint(-(10**17), 10**17) for _ in range(2000)]
+    text = "\n".join(f"{a}, {b}" for a, b in zip(numbers[::2], numbers[1::2]))
+    assert ints(text, signed=True, chunk_size=chunk_size).tolist() == numbers
+    values, counts = int_rows(text, signed=True, chunk_size=chunk_size)
+    assert values.tolist() == numbers
+    assert counts.tolist() == [2] * 1000
+
+
+def test_too_many_digits():
+    with pytest.raises(OverflowError):
+        ints("1234567890123456789")
+    # Lists of Python ints don't have a limit.
+    assert int_lists("12345678901234567890: 1 -2\n\n3", signed=True) == [
+        [12345678901234567890, 1, -2],
+        [],
+        [3],
+    ]
+    assert int_lists("12345678901234567890-1") == [[12345678901234567890, 1]]
+    assert int_lists(b"12345678901234567890: 1 2\n\n3\xb2x4\n") == [
+        [12345678901234567890, 1, 2],
+        [],
+        [3, 4],
+    ]
+
+
+def test_rows():
+    values, counts = int_rows("7 6 4\n\n1 2\n")
+    assert values.tolist() == [7, 6, 4, 1, 2]
+    assert counts.tolist() == [3, 0, 2]
+    assert int_lists("190: 10 19\n3267: 81 40 27") == [
+        [190, 10, 19],
+        [3267, 81, 40, 27],
+    ]
+
+
+def test_block():
+    block = int_block("3   4\n4   3\n2   5\n")
+    assert block.tolist() == [[3, 4], [4, 3], [2, 5]]
+    # Columns are views into the same array.
+    assert block[:, 1].base is not None
+    with pytest.raises(ValueError):
+        int_block("1 2\n3\n")
+
+
+def test_line_views():
+    assert [bytes(line) for line in line_views("ab\n\ncd")] == [b"ab", b"", b"cd"]
+    assert [bytes(line) for line in line_views("ab\n")] == [b"ab"]
+    assert line_views("") == []
+
+
+def test_map_input(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_text("1,2\n3,4\n")
+    with map_input(path) as data:
+        assert int_block(data).tolist() == [[1, 2], [3, 4]]
+    path.write_text("")
+    with map_input(path) as data:
+        assert ints(data).tolist() == []
+
+
+def test_file_chunks(tmp_path):
+    path = tmp_path / "input.txt"
+    text = "".join(f"{value}   {value * 7}\n" for value in range(1000))
+    path.write_text(text + "12 34")
+    chunks = list(file_chunks(path, chunk_size=100))
+    assert b"".join(chunks).decode() == text + "12 34"
+    # Every piece but the last is made of whole lines.
+    assert all(chunk.endswith(b"\n") for chunk in chunks[:-1])
+    assert chunks[-1].endswith(b"12 34")
@@ -0,0 +1,104 @@
+import pytest
+
+from aoc.days import discover_days
+from aoc.regression import (
+    DEFAULT_SETTINGS,
+    Baseline,
+    Measurement,
+    Settings,
+    StepBaseline,
+    compare,
+    format_comparisons,
+    has_regressions,
+    judge,
+    updated_baseline,
+)
+
+
+def step(median: float, peak: int = 0) -> StepBaseline:
+    return {"median": median, "peak": peak}
+
+
+BASELINE: Baseline = {
+    "settings": DEFAULT_SETTINGS,
+    "days": {
+        "2024/1": {"parse": step(0.010), "part1": step(0.100, 10**6)},
+        "2024/2": {"parse": step(0.010)},
+    },
+}
+
+
+@pytest.mark.parametrize(
+    "baseline, current, verdict",
+    [
+        (0.100, 0.110, "unchanged"),
+        (0.100, 0.200, "regressed"),
+        (0.100, 0.050, "improved"),
+        # Tiny steps can double without it counting, since that's noise.
+        (0.000_01, 0.000_02, "unchanged"),
+    ],
+)
+def test_judge(baseline, current, verdict):
+    assert judge(baseline, current, 0.25, 5e-3) == verdict
+
+
+def test_compare():
+    measurements: dict[str, Measurement] = {
+        "2024/1": {
+            "steps": {"parse": step(0.010), "part1": step(0.100, 3 * 10**6)},
+            "error": None,
+        },
+        "2024/3": {"steps": {"parse": step(0.010)}, "error": None},
+    }
+    comparisons = compare(BASELINE, measurements)
+    verdicts = [
+        (comparison["day"], comparison["step"], comparison["verdict"])
+        for comparison in comparisons
+    ]
+    assert verdicts == [
+        ("2024/1", "parse", "unchanged"),
+        ("2024/1", "part1", "regressed"),
+        ("2024/3", "parse", "new"),
+    ]
+    assert comparisons[1]["time"] == "unchanged"
+    assert comparisons[1]["memory"] == "regressed"
+    assert has_regressions(comparisons)
+    assert "1 regressed" in format_comparisons(comparisons)
+
+
+def test_missing_and_failed_steps_regress():
+    measurements: dict[str, Measurement] = {
+        "2024/1": {"steps": {"parse": step(0.010)}, "error": None},
+        "2024/2": {"steps": {}, "error": "ValueError: bad input"},
+    }
+    comparisons = compare(BASELINE, measurements)
+    assert [comparison["verdict"] for comparison in comparisons] == [
+        "unchanged",
+        "missing",
+        "failed",
+    ]
+    assert "ValueError: bad input" in format_comparisons(comparisons)
+
+
+def test_updated_baseline():
+    measurements: dict[str, Measurement] = {
+        "2024/10": {"steps": {"parse": step(0.5)}, "error": None},
+        "2024/2": {"steps": {"parse": step(0.5)}, "error": None},
+        "2024/3": {"steps": {}, "error": "ValueError"},
+    }
+    updated = updated_baseline(BASELINE, measurements, DEFAULT_SETTINGS)
+    assert list(updated["days"]) == ["2024/1", "2024/2", "2024/10"]
+    assert updated["days"]["2024/2"] == {"parse": step(0.5)}
+    # The original is left alone.
+    assert BASELINE["days"]["2024/2"] == {"parse": step(0.010)}
+
+    # Measurements with other settings can't be compared with the old ones.
+    settings: Settings = {**DEFAULT_SETTINGS, "factor": 10}
+    updated = updated_baseline(BASELINE, measurements, settings)
+    assert list(updated["days"]) == ["2024/2", "2024/10"]
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize("year, day", discover_days())
+def test_no_regressions(year: int, day: int, perf_gate):
+    perf_gate(year, day)
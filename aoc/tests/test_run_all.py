@@ -0,0 +1,53 @@
+import json
+
+from aoc import run_all
+from aoc.answers import check_answer, input_hash
+from aoc.days import day_dir
+from aoc.executor import resolve_backend
+
+
+def test_run_day(tmp_path, monkeypatch):
+    monkeypatch.setenv("AOC_CACHE_DIR", str(tmp_path))
+    # Solve the example as if it were the real input.
+    monkeypatch.setattr(
+        run_all, "input_path", lambda year, day: day_dir(year, day) / "test.txt"
+    )
+    report = run_all.run_day(2024, 1)
+    assert report["examples"] == "passed"
+    assert report["status"] == "ok"
+    assert [step["step"] for step in report["steps"]] == ["parse", "part1", "part2"]
+    assert [step["answer"] for step in report["steps"]] == [None, "11", "31"]
+    assert all(step["wall"] >= 0 and step["cpu"] >= 0 for step in report["steps"])
+    assert [step["check"] for step in report["steps"]] == [None, "recorded", "recorded"]
+
+
+def test_run_day_wrong_answer(tmp_path, monkeypatch):
+    monkeypatch.setenv("AOC_CACHE_DIR", str(tmp_path))
+    path = day_dir(2024, 1) / "test.txt"
+    monkeypatch.setattr(run_all, "input_path", lambda year, day: path)
+    check_answer("2024/1", input_hash(path.read_text()), "part2", 32)
+    report = run_all.run_day(2024, 1)
+    assert report["status"] == "failed"
+    assert "WrongAnswer" in (report["error"] or "")
+
+
+def test_workers_run_days_serially(monkeypatch):
+    # Each worker is one of a pool already, so it doesn't start pools of its own.
+    monkeypatch.setenv("AOC_EXECUTOR", "processes")
+    run_all._init_worker("serial")
+    assert resolve_backend() == "serial"
+
+
+def test_run_all_reports(tmp_path, monkeypatch):
+    monkeypatch.setenv("AOC_CACHE_DIR", str(tmp_path))
+    reports = run_all.run_all([(2024, 1), (2025, 3)], workers=2)
+    assert [(report["year"], report["day"]) for report in reports] == [
+        (2024, 1),
+        (2025, 3),
+    ]
+    # 2025 keeps no example checks in its solutions.
+    assert [report["examples"] for report in reports] == ["passed", "none"]
+    assert json.loads(run_all.to_json(reports)) == reports
+    markdown = run_all.to_markdown(reports)
+    assert markdown.startswith("| Year | Day |")
+    assert "| 2024 | 1 | passed |" in markdown
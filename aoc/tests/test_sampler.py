@@ -0,0 +1,40 @@
+import time
+from collections import Counter
+
+from aoc.days import load_day
+from aoc.sampler import Sampler, format_hottest, frame_label, to_collapsed
+
+
+def spin(seconds: float) -> int:
+    # Signal timers count CPU time, so this has to keep the CPU busy.
+    end = time.process_time() + seconds
+    count = 0
+    while time.process_time() < end:
+        count += 1
+    return count
+
+
+def outer() -> int:
+    return spin(0.2)
+
+
+def test_sampler():
+    sampler = Sampler(frequency=1000)
+    assert sampler.run("part1", outer) > 0
+    assert sampler.stacks.total() > 0
+    # Every stack starts from the step, without any of the sampler's frames.
+    for stack in sampler.stacks:
+        assert stack[:3] == ("part1", f"{__name__}:outer", f"{__name__}:spin")
+
+
+def test_frame_label():
+    module = load_day(2024, 22)
+    assert frame_label(module.evolve.__code__, module.__name__) == "2024/22:evolve"
+    assert frame_label(spin.__code__, __name__) == f"{__name__}:spin"
+
+
+def test_collapsed_output():
+    stacks: Counter = Counter({("part1", "a", "b"): 3, ("part1", "a"): 1})
+    assert to_collapsed(stacks) == "part1;a 1\npart1;a;b 3\n"
+    summary = format_hottest(stacks)
+    assert summary.splitlines()[1].split() == ["b", "75.0%", "75.0%"]
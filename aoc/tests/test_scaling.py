@@ -0,0 +1,38 @@
+import pytest
+
+from aoc.days import discover_days, load_day, load_generator
+from aoc.scaling import fit_exponent, sweep
+
+
+def test_fit_exponent():
+    points = [(size, 3e-6 * size**2) for size in (10, 100, 1000)]
+    assert fit_exponent(points) == pytest.approx(2)
+    assert fit_exponent([(10, 1.0)]) is None
+
+
+@pytest.mark.parametrize("year, day", discover_days())
+def test_generated_input_parses(year: int, day: int):
+    generator = load_generator(year, day)
+    text = generator.generate(max(generator.REAL_SIZE // 20, 1), seed=1)
+    assert text == generator.generate(max(generator.REAL_SIZE // 20, 1), seed=1)
+    load_day(year, day).parse(text)
+
+
+def test_sweep(tmp_path, monkeypatch):
+    monkeypatch.setenv("AOC_CACHE_DIR", str(tmp_path))
+    results = sweep(2024, 1, factors=(0.1, 0.2), repeat=1)
+    assert [result["size"] for result in results] == [100, 200]
+    assert all(
+        set(result["medians"]) == {"parse", "part1", "part2"} for result in results
+    )
+
+
+@pytest.mark.parametrize("factor", [0.05, 1, 10])
+@pytest.mark.parametrize("seed", range(4))
+def test_generated_patrol_leaves_the_map(factor: float, seed: int):
+    # The guard has to walk off a generated map for there to be an answer, and
+    # a benchmark is only worth running if she covers a fair part of it first.
+    generator = load_generator(2024, 6)
+    size = round(generator.REAL_SIZE * factor)
+    module = load_day(2024, 6)
+    assert module.part1(module.parse(generator.generate(size, seed))) >= size // 10
@@ -0,0 +1,91 @@
+import pytest
+
+from aoc.grid import Grid
+from aoc.search import choose_algorithm, search
+
+# A small directed graph with two equally short routes from 0 to 4:
+# 0 -> 1 -> 3 -> 4 and 0 -> 2 -> 3 -> 4, plus a longer detour 0 -> 5 -> 4.
+EDGES = {
+    0: [(1, 2), (2, 2), (5, 4)],
+    1: [(3, 2)],
+    2: [(3, 2)],
+    3: [(4, 2)],
+    5: [(4, 4)],
+}
+
+
+def neighbors(node: int) -> list[tuple[int, int]]:
+    return EDGES.get(node, [])
+
+
+def test_choose_algorithm():
+    assert choose_algorithm([1]) == "bfs"
+    assert choose_algorithm([0, 1]) == "0-1 bfs"
+    assert choose_algorithm([1, 5]) == "dial"
+    assert choose_algorithm([1, 1001]) == "dijkstra"
+    assert choose_algorithm([1], heuristic=lambda node: 0) == "dijkstra"
+    with pytest.raises(ValueError):
+        choose_algorithm([-1])
+
+
+@pytest.mark.parametrize("algorithm", ["dial", "dijkstra"])
+def test_weighted_algorithms_agree(algorithm):
+    result = search(6, [0], neighbors, [2, 4], algorithm=algorithm)
+    assert [result.distances[node] for node in range(6)] == [0, 2, 2, 4, 6, 4]
+    assert result.nodes_on_shortest_paths([4]) == {0, 1, 2, 3, 4}
+    assert result.path_to(4) in ([0, 1, 3, 4], [0, 2, 3, 4])
+
+
+def test_bfs():
+    result = search(6, [0], lambda node: [(n, 1) for n, _ in neighbors(node)], [1])
+    assert [result.distances[node] for node in range(6)] == [0, 1, 1, 2, 2, 1]
+    assert result.path_to(4) == [0, 5, 4]
+
+
+def test_zero_one_bfs():
+    edges = {0: [(1, 1), (2, 0)], 2: [(1, 0)], 1: [(3, 1)]}
+    result = search(4, [0], lambda node: edges.get(node, []), [0, 1])
+    assert list(result.distances) == [0, 0, 0, 1]
+    assert result.path_to(3) == [0, 2, 1, 3]
+
+
+def test_unreachable_and_targets():
+    result = search(7, [0], neighbors, [2, 4], targets=[3])
+    assert result.distance(3) == 4
+    # Nothing further than the target is settled, and node 6 has no edges in.
+    assert not result.reached(6)
+    with pytest.raises(ValueError):
+        result.distance(6)
+    with pytest.raises(ValueError):
+        result.path_to(6)
+
+
+def test_a_star_on_grid():
+    grid = Grid.from_text("....\n.##.\n....\n").padded("#")
+    free = (grid.cells != ord("#")).tobytes()
+    steps = (1, -1, grid.stride, -grid.stride)
+    end = grid.node((2, 3))
+    end_row, end_col = 2, 3
+
+    def grid_neighbors(node: int) -> list[tuple[int, int]]:
+        return [(node + step, 1) for step in steps if free[node + step]]
+
+    def manhattan(node: int) -> int:
+        row, col = grid.position(node)
+        return abs(row - end_row) + abs(col - end_col)
+
+    result = search(
+        grid.num_nodes,
+        [grid.node((0, 0))],
+        grid_neighbors,
+        [1],
+        targets=[end],
+        heuristic=manhattan,
+    )
+    assert result.distance(end) == 5
+    path = [grid.position(node) for node in result.path_to(end)]
+    assert path[0] == (0, 0) and path[-1] == (2, 3) and len(path) == 6
+    # Both ways around the wall are equally short.
+    assert (1, 0) in {
+        grid.position(node) for node in result.nodes_on_shortest_paths([end])
+    }
@@ -0,0 +1,49 @@
+import random
+
+from aoc.union_find import UnionFind
+
+
+def test_union_find():
+    forest = UnionFind(6)
+    assert forest.num_components == 6
+    assert forest.union(0, 1)
+    assert forest.union(2, 3)
+    assert forest.union(1, 3)
+    # Already connected, through 0 - 1 - 3.
+    assert not forest.union(0, 2)
+    assert forest.num_components == 3
+    assert forest.connected(0, 3)
+    assert not forest.connected(0, 4)
+    assert forest.component_size(2) == 4
+    assert sorted(forest.component_sizes()) == [1, 1, 4]
+    assert sorted(forest.components()) == [[0, 1, 2, 3], [4], [5]]
+
+
+def test_matches_merging_sets():
+    rng = random.Random(0)
+    num_elements = 200
+    forest = UnionFind(num_elements)
+    groups = [{element} for element in range(num_elements)]
+    for _ in range(150):
+        a, b = rng.randrange(num_elements), rng.randrange(num_elements)
+        merged = groups[a] is not groups[b]
+        assert forest.union(a, b) == merged
+        if merged:
+            group = groups[a] | groups[b]
+            for element in group:
+                groups[element] = group
+    assert forest.num_components == len({id(group) for group in groups})
+    for element in range(num_elements):
+        assert forest.component_size(element) == len(groups[element])
+
+
+def test_deep_chains_stay_shallow():
+    # Without compression and union by size, this would be a chain a hundred
+    # thousand elements long.
+    forest = UnionFind(100_000)
+    for element in range(1, 100_000):
+        forest.union(element - 1, element)
+    assert forest.num_components == 1
+    assert forest.component_size(0) == 100_000
+    forest.find(0)
+    assert forest.parents[0] == forest.find(99_999)
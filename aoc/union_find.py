@@ -0,0 +1,88 @@
+"""
+A disjoint-set forest (union-find) over elements numbered 0 to n - 1, for the
+puzzles that keep merging things into groups: circuits of junction boxes, or
+the open regions of a grid as walls are taken away.
+
+Each element's parent, and each root's component size, live in preallocated
+int64 arrays indexed by element, like `aoc.search`'s distances. Finding a root
+compresses the path it took, and a union hangs the smaller tree under the
+larger one, so any sequence of operations takes close to constant time each.
+The number of components is kept up to date as they merge, so checking
+whether everything is connected yet doesn't need a pass over the elements.
+"""
+
+from array import array
+
+
+class UnionFind:
+    # The parent of each element, which is itself for a root.
+    parents: array
+    # The number of elements in each root's component (meaningless for
+    # elements that aren't roots).
+    sizes: array
+    num_components: int
+
+    def __init__(self, num_elements: int) -> None:
+        self.parents = array("q", range(num_elements))
+        self.sizes = array("q", [1]) * num_elements
+        self.num_components = num_elements
+
+    def __len__(self) -> int:
+        return len(self.parents)
+
+    def find(self, element: int) -> int:
+        """
+        The root of the component `element` is in. Every element on the way
+        there is pointed straight at the root, so the next lookup is quicker.
+        """
+        parents = self.parents
+        root = element
+        while (parent := parents[root]) != root:
+            root = parent
+        while (parent := parents[element]) != root:
+            parents[element] = root
+            element = parent
+        return root
+
+    def union(self, a: int, b: int) -> bool:
+        """
+        Merge the components of `a` and `b`, returning whether they were
+        separate until now.
+        """
+        root_a = self.find(a)
+        root_b = self.find(b)
+        if root_a == root_b:
+            return False
+        sizes = self.sizes
+        if sizes[root_a] < sizes[root_b]:
+            root_a, root_b = root_b, root_a
+        self.parents[root_b] = root_a
+        sizes[root_a] += sizes[root_b]
+        self.num_components -= 1
+        return True
+
+    def connected(self, a: int, b: int) -> bool:
+        return self.find(a) == self.find(b)
+
+    def component_size(self, element: int) -> int:
+        return self.sizes[self.find(element)]
+
+    def component_sizes(self) -> list[int]:
+        """
+        The size of every component, in no particular order.
+        """
+        parents = self.parents
+        return [
+            size
+            for element, size in enumerate(self.sizes)
+            if parents[element] == element
+        ]
+
+    def components(self) -> list[list[int]]:
+        """
+        The elements of every component, each in increasing order.
+        """
+        members: dict[int, list[int]] = {}
+        for element in range(len(self)):
+            members.setdefault(self.find(element), []).append(element)
+        return list(members.values())